@@ -0,0 +1,140 @@
+"""
+Benchmark do loop do jogo Perfect Potion.
+
+Roda uma partida sem janela (drivers SDL 'dummy'), sem limite de FPS e com
+entrada automática (um tiro a cada --fire-every frames), e mostra o tempo de
+cada fase do frame. O jogador não perde vidas, então a partida não acaba.
+
+Com --alloc, mede as alocações por fase com tracemalloc (src/utils/alloc_budget.py)
+e sai com código 1 se alguma fase passar do orçamento de settings.ALLOC_BUDGETS.
+
+Com --latency, o loop roda no ritmo de settings.FPS (clock.tick) e uma
+thread aperta ESPAÇO em momentos aleatórios, com o perf_counter do momento
+no evento; a sonda de src/utils/input_latency.py mede quanto tempo cada tiro
+leva para chegar à tela. Movimento não entra: pg.key.get_pressed() não vê
+eventos postados.
+
+Uso:
+    python benchmark.py --frames 1800
+    python benchmark.py --alloc --top 15
+    python benchmark.py --latency --frames 1200
+"""
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Benchmark do loop do Perfect Potion')
+    parser.add_argument('--frames', type=int, default=1800, help='frames medidos (padrão: 1800)')
+    parser.add_argument('--fire-every', type=int, default=15, help='frames entre tiros automáticos')
+    parser.add_argument('--seed', type=int, default=1, help='semente do random')
+    parser.add_argument('--alloc', action='store_true', help='mede alocações por fase e aplica os orçamentos')
+    parser.add_argument('--top', type=int, default=10, help='linhas que mais alocam a mostrar (--alloc)')
+    parser.add_argument('--latency', action='store_true',
+                        help='roda no ritmo de settings.FPS e mede a latência tecla -> tela dos tiros')
+    parser.add_argument('--window', action='store_true', help='abre a janela em vez de rodar sem vídeo')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if not args.window:
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+    import numpy as np
+    import pygame as pg
+    from src import settings
+    from src.game import Game
+    from src.utils.alloc_budget import AllocationTracker
+    from src.utils.frame_stats import ALLOCATIONS
+
+    random.seed(args.seed)
+    ALLOCATIONS.install()  # Surfaces e textos por frame (antes das fontes do jogo)
+    game = Game()
+    game.state = "GAME"
+    game.setup_new_game()
+
+    tracker = None
+    if args.alloc:
+        tracker = AllocationTracker(game.frame_timer)
+        tracker.start()
+
+    stop_input = threading.Event()
+    if args.latency:
+        game.input_latency.enabled = True
+
+        def press_space():
+            # Intervalo maior que PLAYER_SHOOT_DELAY: todo aperto deveria virar um tiro
+            rng = random.Random(args.seed)
+            delay = settings.PLAYER_SHOOT_DELAY / 1000.0
+            while not stop_input.wait(rng.uniform(delay + 0.05, delay + 0.2)):
+                pg.event.post(pg.event.Event(pg.KEYDOWN, key=pg.K_SPACE, posted=time.perf_counter()))
+
+        threading.Thread(target=press_space, name='latency-input', daemon=True).start()
+
+    timer = game.frame_timer
+    warmup = tracker.warmup if tracker else 0
+    phase_ms = np.zeros((args.frames, len(timer.phases)), dtype=np.float32)
+    surface_counts = np.zeros((args.frames, 2), dtype=np.int32)
+    for frame in range(warmup + args.frames):
+        if args.latency:
+            game.clock.tick(settings.FPS)
+        elif frame % args.fire_every == 0:
+            pg.event.post(pg.event.Event(pg.KEYDOWN, key=pg.K_SPACE))
+        game.run_frame()
+        game.player.lives = max(game.player.lives, 1)  # O benchmark não termina em game over
+        if frame >= warmup:
+            phase_ms[frame - warmup] = timer.last(1)[0]
+            surface_counts[frame - warmup] = timer.counts['surfaces'], timer.counts['renders']
+
+    # Tempo por fase
+    total = phase_ms.sum(axis=1)
+    print(f"{'fase':<18} {'média':>8} {'p95':>8} {'máx':>8}  (ms, {args.frames} frames)")
+    for i, phase in enumerate(timer.phases):
+        column = phase_ms[:, i]
+        print(f"{phase:<18} {column.mean():8.3f} {np.percentile(column, 95):8.3f} {column.max():8.3f}")
+    print(f"{'frame':<18} {total.mean():8.3f} {np.percentile(total, 95):8.3f} {total.max():8.3f}")
+    surfaces, renders = surface_counts.mean(axis=0)
+    print(f"Surfaces por frame {surfaces:.2f}, textos por frame {renders:.2f}")
+    if tracker is not None:
+        print("(com --alloc o tracemalloc deixa tudo mais lento; compare tempos sem --alloc)")
+
+    if args.latency:
+        stop_input.set()
+        shots = game.input_latency.summary()['shoot']
+        print(f"\nLatência tecla -> tela dos tiros ({settings.FPS} FPS): {shots['count']} medidos, "
+              f"{shots['missed']} sem reação")
+        if shots['count']:
+            print(f"  p50 {shots['p50_ms']:.2f} ms  p90 {shots['p90_ms']:.2f} ms  "
+                  f"p99 {shots['p99_ms']:.2f} ms  máx {shots['max_ms']:.2f} ms")
+            print(f"  frames até a tela: {shots['frames']}")
+
+    if tracker is None:
+        return 0
+    tracker.stop()
+
+    # Alocações por fase e linhas que mais alocam
+    print(f"\n{'fase':<18} {'blocos':>8} {'bytes':>9} {'pico':>9} {'orçamento':>10}  (por frame)")
+    for phase, (blocks, size, peak) in tracker.per_frame().items():
+        budget = tracker.budgets.get(phase, '-')
+        print(f"{phase:<18} {blocks:8.1f} {size:9.0f} {peak:9d} {budget:>10}")
+    print("\nLinhas de src/ que mais alocam (blocos por frame):")
+    for phase, filename, lineno, blocks, size in tracker.top_lines(limit=args.top):
+        print(f"  {blocks:7.2f} {size:9.0f} B  {filename}:{lineno}  [{phase}]")
+
+    failures = tracker.over_budget()
+    for phase, blocks, budget in failures:
+        print(f"[FALHA] {phase}: {blocks:.1f} blocos por frame (orçamento {budget})")
+    if not failures:
+        print("\nOrçamentos de alocação respeitados.")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
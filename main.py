@@ -1,6 +1,7 @@
 # entrada principal do jogo. A sua única função é iniciar o jogo.
 import sys
 import os
+import argparse
 import warnings
 
 # Suprime avisos do pkg_resources
@@ -11,13 +12,54 @@ warnings.filterwarnings("ignore", message=".*pkg_resources is deprecated.*")
 src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), 'src'))
 sys.path.insert(0, os.path.dirname(src_path))
 
-# Agora que o caminho está configurado, podemos importar a classe Game
-from src.game import Game
+# Relatório de inicialização: importado antes do jogo para medir todos os imports
+from src.utils.startup import STARTUP
+
+
+def parse_args():
+    """Lê as opções de linha de comando (todas opcionais)."""
+    parser = argparse.ArgumentParser(description='Perfect Potion')
+    parser.add_argument('--trace', action='store_true',
+                        help='grava spans do jogo em saves/trace-*.json (Chrome trace-event)')
+    parser.add_argument('--flight-recorder', action='store_true',
+                        help='salva os últimos frames em saves/hitch-*.json quando um frame demora demais')
+    parser.add_argument('--profile', action='store_true',
+                        help='amostra a sessão inteira e grava saves/profile-*-<ESTADO>.folded')
+    parser.add_argument('--startup-report', action='store_true',
+                        help='mostra o tempo de cada import e etapa até o primeiro frame')
+    parser.add_argument('--telemetry', action='store_true',
+                        help='grava os contadores de cada partida em saves/telemetry.jsonl')
+    parser.add_argument('--latency', action='store_true',
+                        help='mede a latência tecla -> tela e grava os percentis na telemetria (liga --telemetry)')
+    return parser.parse_args()
+
 
 # Bloco principal que só executa quando este ficheiro é corrido diretamente
 if __name__ == '__main__':
+    args = parse_args()
+    if args.startup_report:
+        STARTUP.start()
+
+    # Agora que o caminho está configurado, podemos importar a classe Game
+    from src.game import Game
+    from src.utils.tracing import TRACER
+    from src.utils.frame_stats import ALLOCATIONS
+    STARTUP.step('imports do jogo')
+
+    if args.trace:
+        TRACER.enabled = True
+    if args.telemetry or args.latency:
+        ALLOCATIONS.install()  # Surfaces e textos da telemetria (antes das fontes do jogo)
     try:
         game = Game()
+        if args.telemetry or args.latency:
+            game.telemetry.enabled = True
+        if args.flight_recorder:
+            game.flight_recorder.enabled = True
+        if args.profile:
+            game.profiler.start()
+        if args.latency:
+            game.input_latency.enabled = True
         game.run()
     except Exception as e:
         # Se ocorrer um erro inesperado, imprime-o antes de fechar
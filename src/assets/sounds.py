@@ -11,8 +11,9 @@ sounds = {}
 def load_sounds():
     """Carrega todos os efeitos sonoros do jogo."""
     try:
-        # Inicializa o mixer de som do pygame
-        pg.mixer.init()
+        # Inicializa o mixer de som do pygame (se o jogo ainda não tiver feito isso)
+        if not pg.mixer.get_init():
+            pg.mixer.init()
         
         # Caminho para a pasta de sons
         sounds_dir = os.path.join('assets', 'sounds')
@@ -31,9 +32,6 @@ def load_sounds():
         print(f"Erro ao carregar sons: {e}")
         return False
 
-# Inicializa os sons quando o módulo é importado
-load_sounds()
-
 def play_sound(sound_name, volume=0.5):
     """
     Reproduz um som do dicionário de sons.
@@ -42,6 +40,9 @@ def play_sound(sound_name, volume=0.5):
         sound_name (str): Nome do som a ser reproduzido
         volume (float): Volume do som (0.0 a 1.0)
     """
+    # Os sons só são carregados no primeiro uso (não mais no import)
+    if not sounds:
+        load_sounds()
     if sound_name in sounds:
         try:
             sound = sounds[sound_name]
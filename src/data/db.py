@@ -13,9 +13,6 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 DB_DIR = os.path.join(BASE_DIR, '..', 'data')
 DB_PATH = os.path.join(DB_DIR, 'players.db')
 
-# Ensure the data directory exists
-os.makedirs(DB_DIR, exist_ok=True)
-
 class Database:
     _instance = None
     
@@ -36,6 +33,8 @@ class Database:
     def connect(self):
         """Establish a connection to the database."""
         try:
+            # Ensure the data directory exists
+            os.makedirs(DB_DIR, exist_ok=True)
             self.conn = sqlite3.connect(DB_PATH)
             self.conn.row_factory = sqlite3.Row  # This enables column access by name
             self.cursor = self.conn.cursor()
@@ -246,5 +245,25 @@ class Database:
             print(f"Error getting scores for player {player_id}: {e}")
             return []
 
-# Create a singleton instance of the database
-db = Database()
+class _LazyDatabase:
+    """Stand-in for the Database singleton that connects on first use.
+
+    Importing this module no longer opens SQLite or runs the DDL, so screens
+    that never touch the database (splash, main menu) don't pay for it.
+    """
+
+    def __init__(self):
+        self._instance = None
+
+    def _load(self):
+        """Create (or return) the Database singleton."""
+        if self._instance is None:
+            self._instance = Database()
+        return self._instance
+
+    def __getattr__(self, name):
+        return getattr(self._load(), name)
+
+
+# Singleton instance of the database, created on first attribute access
+db = _LazyDatabase()
@@ -0,0 +1,113 @@
+"""
+Tabela de dificuldade por nível do jogo Perfect Potion.
+
+Cada nível tem um DifficultyProfile imutável, calculado uma única vez a
+partir das configurações. A sessão de jogo recebe o perfil do nível e o
+repassa ao spawner e ao gerenciador de níveis, em vez de alterar o módulo
+settings durante o jogo. Assim várias sessões podem rodar no mesmo processo
+(simulações em paralelo, validação no servidor) sem interferir umas nas outras.
+"""
+from dataclasses import dataclass, replace
+from typing import Optional, Tuple
+from src import settings
+
+# Níveis pré-calculados; níveis acima disso usam o perfil do último
+DIFFICULTY_LEVELS = 30
+
+
+@dataclass(frozen=True)
+class DifficultyProfile:
+    """Parâmetros de dificuldade de um nível (imutável)."""
+    level: int
+    spawn_interval: float                      # ms entre ondas de spawn
+    first_wave_delay: float                    # ms do início do nível até a primeira onda
+    wave_size: Tuple[int, int]                 # Itens por onda (mínimo, máximo)
+    speed_min: int                             # Velocidade mínima base dos itens
+    speed_max: int                             # Velocidade máxima base (exclusiva)
+    speed_scale: float                         # Multiplicador de velocidade do nível
+    spawn_weights: Tuple[Tuple[str, int], ...]  # Pesos (tipo, peso) de cada tipo de item
+    recipe_bias: float                         # Chance de um ingrediente ser o próximo da receita
+    recipe_length: int                         # Poções por receita
+    recipe_count: int                          # Receitas ativas ao mesmo tempo
+    recipe_ordered: bool                       # Se a ordem das poções importa
+    movement_patterns: Tuple[Tuple[str, Tuple[Tuple[str, int], ...]], ...]  # Pesos dos padrões por tipo
+    max_items: int                             # Limite de itens na tela
+    collision_profile: str                     # Perfil de colisão (settings.COLLISION_PROFILES)
+
+
+def recipe_length_for(level: int) -> int:
+    """Retorna o número de ingredientes da receita de um nível."""
+    if level >= 10:
+        return 4
+    elif level >= 5:
+        return 3
+    else:
+        return 2
+
+
+def movement_for(level: int) -> Tuple[Tuple[str, Tuple[Tuple[str, int], ...]], ...]:
+    """Pesos dos padrões de movimento de cada tipo de item num nível (tipos sem regra andam em linha)."""
+    rules = {}
+    for from_level, kind, weights in settings.MOVEMENT_PATTERN_RULES:
+        if level >= from_level:
+            rules[kind] = tuple(weights.items())
+    return tuple(sorted(rules.items()))
+
+
+def build_profile(level: int) -> DifficultyProfile:
+    """
+    Calcula o perfil de dificuldade de um nível a partir das configurações.
+
+    Args:
+        level: Número do nível (começando em 1)
+    """
+    weights = settings.ITEM_SPAWN_WEIGHTS_BY_LEVEL.get(level, settings.ITEM_SPAWN_WEIGHTS)
+    recipe_rules = settings.RECIPE_RULES_BY_LEVEL.get(level, {})
+    speed_scale = min(1.0 + (level - 1) * settings.LEVEL_SPEED_INCREASE, settings.LEVEL_SPEED_SCALE_MAX)
+    return DifficultyProfile(
+        level=level,
+        spawn_interval=max(settings.SPAWN_WAVE_INTERVAL - (level - 1) * settings.SPAWN_WAVE_INTERVAL_STEP,
+                           settings.SPAWN_WAVE_INTERVAL_MIN),
+        first_wave_delay=settings.SPAWN_FIRST_WAVE_DELAY,
+        wave_size=tuple(settings.SPAWN_WAVE_SIZE),
+        speed_min=settings.ITEM_SPEED_MIN,
+        speed_max=settings.ITEM_SPEED_MAX,
+        speed_scale=round(speed_scale, 3),
+        spawn_weights=tuple(weights.items()),
+        recipe_bias=settings.SPAWN_RECIPE_BIAS,
+        recipe_length=recipe_rules.get('length', recipe_length_for(level)),
+        recipe_count=recipe_rules.get('count', 1),
+        recipe_ordered=recipe_rules.get('ordered', True),
+        movement_patterns=movement_for(level),
+        max_items=settings.MAX_ITEMS_ON_SCREEN,
+        collision_profile=settings.COLLISION_PROFILE_BY_LEVEL.get(level, settings.COLLISION_PROFILE),
+    )
+
+
+def build_difficulty_table(levels: int = DIFFICULTY_LEVELS) -> Tuple[DifficultyProfile, ...]:
+    """Pré-calcula os perfis dos níveis 1 a 'levels'."""
+    return tuple(build_profile(level) for level in range(1, levels + 1))
+
+
+def difficulty_for(level: int, table: Optional[Tuple[DifficultyProfile, ...]] = None) -> DifficultyProfile:
+    """
+    Retorna o perfil de um nível (níveis além da tabela usam o último perfil).
+
+    Args:
+        level: Número do nível
+        table: Tabela de perfis da sessão (padrão: DIFFICULTY_TABLE)
+
+    Returns:
+        DifficultyProfile: Perfil do nível; além da tabela, uma cópia do
+        último perfil com o número do nível pedido (LevelManager compara
+        profile.level com o nível atual)
+    """
+    table = table or DIFFICULTY_TABLE
+    profile = table[max(1, min(level, len(table))) - 1]
+    if level > len(table):
+        return replace(profile, level=level)
+    return profile
+
+
+# Tabela compartilhada (somente leitura) por todas as sessões
+DIFFICULTY_TABLE = build_difficulty_table()
@@ -0,0 +1,122 @@
+"""
+Catálogo de poções compilado a partir do POTION_DATA.
+
+Cada poção recebe um id inteiro pequeno (sua posição no POTION_DATA). Os
+tipos viram bitsets, então "esta poção é boa?" é um teste de bit O(1) em vez
+de procurar o nome numa lista. O caminho da imagem de cada poção é resolvido
+uma única vez aqui, e as imagens redimensionadas ficam em cache por tamanho.
+
+Itens, receitas e HUD guardam ids; o nome do arquivo só é usado para
+carregar imagens e para mensagens.
+"""
+import os
+import pygame as pg
+from src import settings
+from src.data.potions import POTION_DATA, POTION_HITBOX
+from src.utils.log import get_logger
+
+log = get_logger(__name__)
+
+# Bits de tipo de cada poção
+FLAG_GOOD = 1 << 0
+FLAG_BAD = 1 << 1
+
+TYPE_FLAGS = {
+    'good': FLAG_GOOD,
+    'bad': FLAG_BAD,
+}
+
+# Id usado quando um item não é uma poção (bombas)
+NO_POTION = -1
+
+
+class PotionCatalog:
+    """Poções indexadas por id, com tipos em bitsets e assets pré-resolvidos."""
+
+    def __init__(self, potion_data=None, potion_dir=None):
+        """
+        Args:
+            potion_data: Dicionário no formato do POTION_DATA (padrão: POTION_DATA)
+            potion_dir: Pasta das imagens das poções (padrão: assets/items/potions)
+        """
+        potion_data = POTION_DATA if potion_data is None else potion_data
+        potion_dir = potion_dir or os.path.join(settings.ASSETS_DIR, 'items', 'potions')
+
+        self.names = list(potion_data)
+        self.ids = {name: potion_id for potion_id, name in enumerate(self.names)}
+        self.flags = [TYPE_FLAGS.get(data.get('type'), 0) for data in potion_data.values()]
+        self.effects = [data.get('effect', '') for data in potion_data.values()]
+        self.hitboxes = [data.get('hitbox', POTION_HITBOX) for data in potion_data.values()]
+        self.spawn_weights = [data.get('spawn_weight', 1) for data in potion_data.values()]
+
+        # Bitset com um bit por poção de cada tipo
+        self.good_mask = self.mask_of(i for i, f in enumerate(self.flags) if f & FLAG_GOOD)
+        self.bad_mask = self.mask_of(i for i, f in enumerate(self.flags) if f & FLAG_BAD)
+        self.good_ids = self.ids_in(self.good_mask)
+        self.bad_ids = self.ids_in(self.bad_mask)
+
+        # Caminho de cada imagem (None se o arquivo não existir)
+        self.paths = []
+        for name in self.names:
+            path = os.path.join(potion_dir, name)
+            self.paths.append(path if os.path.exists(path) else None)
+
+        self._images = {}  # (id, tamanho) -> Surface
+
+    def __len__(self):
+        return len(self.names)
+
+    def id_of(self, name):
+        """Retorna o id de uma poção pelo nome do arquivo (NO_POTION se não existir)."""
+        return self.ids.get(name, NO_POTION)
+
+    def name_of(self, potion_id):
+        """Retorna o nome do arquivo de uma poção (None para NO_POTION)."""
+        return self.names[potion_id] if 0 <= potion_id < len(self.names) else None
+
+    @staticmethod
+    def mask_of(potion_ids):
+        """Monta um bitset a partir de uma sequência de ids."""
+        mask = 0
+        for potion_id in potion_ids:
+            mask |= 1 << potion_id
+        return mask
+
+    def ids_in(self, mask):
+        """Lista os ids presentes num bitset."""
+        return [i for i in range(len(self.names)) if mask >> i & 1]
+
+    def is_good(self, potion_id):
+        """True se a poção é boa (teste de bit)."""
+        return potion_id >= 0 and self.good_mask >> potion_id & 1 == 1
+
+    def is_bad(self, potion_id):
+        """True se a poção é ruim (teste de bit)."""
+        return potion_id >= 0 and self.bad_mask >> potion_id & 1 == 1
+
+    def image(self, potion_id, size):
+        """
+        Retorna a imagem de uma poção no tamanho pedido (carregada uma vez).
+
+        Args:
+            potion_id: Id da poção
+            size: Lado da imagem quadrada em pixels
+
+        Returns:
+            pg.Surface ou None se a imagem não existir
+        """
+        key = (potion_id, size)
+        if key not in self._images:
+            path = self.paths[potion_id] if 0 <= potion_id < len(self.paths) else None
+            image = None
+            if path:
+                try:
+                    image = pg.transform.scale(pg.image.load(path).convert_alpha(), (size, size))
+                except Exception as e:
+                    log.error("Erro ao carregar imagem da poção %s: %s", self.names[potion_id], e)
+            self._images[key] = image
+        return self._images[key]
+
+
+# Catálogo compartilhado, compilado na importação
+CATALOG = PotionCatalog()
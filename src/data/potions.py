@@ -44,6 +44,11 @@ POTION_DATA = {
     },
 }
 
+# Formato da área de colisão dos itens: 'mask', 'rect', 'circle' ou 'circle_mask'
+# (uma poção pode usar outro formato com a chave 'hitbox' no POTION_DATA)
+POTION_HITBOX = 'circle'
+BOMB_HITBOX = 'circle'
+
 # Constantes para facilitar o acesso aos tipos
 good_potions = [k for k, v in POTION_DATA.items() if v['type'] == 'good']
 bad_potions = [k for k, v in POTION_DATA.items() if v['type'] == 'bad']
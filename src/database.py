@@ -200,6 +200,26 @@ class PlayerDatabase:
             stats.update(dict(cursor.fetchone()))
             return stats
 
-# instância global do banco
+class _LazyPlayerDatabase:
+    """
+    Cria o PlayerDatabase só no primeiro uso.
+    Assim importar este módulo não abre o arquivo nem cria as tabelas.
+    """
+
+    def __init__(self, db_path: str):
+        self._db_path = db_path
+        self._instance = None
+
+    def _load(self) -> PlayerDatabase:
+        """Devolve a instância do banco, criando na primeira vez."""
+        if self._instance is None:
+            self._instance = PlayerDatabase(self._db_path)
+        return self._instance
+
+    def __getattr__(self, name):
+        return getattr(self._load(), name)
+
+
+# instância global do banco (criada no primeiro uso)
 DATABASE_PATH = os.path.join('data', 'players.db')
-db = PlayerDatabase(DATABASE_PATH)
+db = _LazyPlayerDatabase(DATABASE_PATH)
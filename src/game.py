@@ -8,29 +8,17 @@ import pygame as pg
 import sys
 import math
 import json
-from datetime import datetime
-
-# Configurações e bibliotecas básicas
-import os
-import time
-import random
-import pygame as pg
-import sys
-import math
-import json
+import logging
 from datetime import datetime
 
 # Configurações do jogo
 from src import settings
 
-# Sons e áudios
-from src.assets.sounds import sounds
-
 # Telas do jogo
 from src.menu.main_menu import MainMenu
 from src.menu.splash_screen import SplashScreen
 
-# Banco de dados
+# Banco de dados (a conexão só abre no primeiro uso)
 from src.data.db import db
 
 # Módulos do jogo
@@ -40,10 +28,32 @@ from src.items.hazard import Hazard
 from src.items.bomb import Bomb
 from src.utils.hud import HUD
 from src.utils.item_spawner import ItemSpawner
-from src.utils.explosion import Explosion
+from src.utils.item_engine import ItemEngine, KIND_INGREDIENT, KIND_HAZARD, KIND_BOMB
+from src.utils.collision import (sweep_projectiles, narrow_phase, shape_id,
+                                  SHAPE_CIRCLE, SHAPE_CIRCLE_MASK)
+from src.utils.pool import ObjectPool
+from src.utils.timer_service import TimerService
+from src.data.difficulty import DIFFICULTY_TABLE, difficulty_for
+from src.utils.level_pack import LevelPack
+from src.utils.asset_prefetcher import LevelAssetPrefetcher
+from src.projectile import Projectile
+from src.utils.explosion import ExplosionQueue
 from src.utils.damage_indicator import DamageIndicator
-from src.data.potions import POTION_DATA, good_potions
+from src.data.potions import POTION_DATA
+from src.data.potion_catalog import CATALOG
 from src.utils.level_manager import LevelManager
+from src.utils.log import get_logger
+from src.utils.frame_stats import FrameTimer, ALLOCATIONS
+from src.utils.perf_overlay import PerfOverlay
+from src.utils.flight_recorder import FlightRecorder
+from src.utils.profiler import SamplingProfiler
+from src.utils.memory_census import MemoryCensus
+from src.utils.input_latency import InputLatencyProbe
+from src.utils.telemetry import SessionTelemetry
+from src.utils.tracing import TRACER, traced
+from src.utils.startup import STARTUP
+
+log = get_logger(__name__)
 
 
 class Game:
@@ -55,20 +65,35 @@ class Game:
         Inicializa o jogo, configurando a janela, áudio e estado inicial.
         """
         pg.init()
+        STARTUP.step('pg.init')
+        
+        # Contadores da partida, repassados aos subsistemas (settings.TELEMETRY_ENABLED grava)
+        self.telemetry = SessionTelemetry()
+        
+        # Conta Surfaces e textos criados por frame só se alguém for ler a contagem
+        # (troca pg.Surface, pg.font.Font e pg.transform; antes de criar qualquer fonte)
+        if settings.PERF_COUNT_ALLOCATIONS or settings.PERF_OVERLAY or self.telemetry.enabled:
+            ALLOCATIONS.install()
+        
+        # Censo de memória (settings.MEMORY_CENSUS): o tracemalloc começa já aqui
+        self.memory = MemoryCensus()
+        self.memory.start()
         
         # Configura o sistema de áudio
         try:
             pg.mixer.init()
             self.sound_enabled = True
         except Exception as e:
-            print(f"Aviso: falha ao inicializar áudio: {e}")
+            log.warning("Aviso: falha ao inicializar áudio: %s", e)
             self.sound_enabled = False
+        STARTUP.step('mixer')
 
         # Configuração da janela
         self.WINDOW_WIDTH = settings.WINDOW_WIDTH
         self.WINDOW_HEIGHT = settings.WINDOW_HEIGHT
         self.screen = pg.display.set_mode((self.WINDOW_WIDTH, self.WINDOW_HEIGHT))
         pg.display.set_caption(settings.GAME_TITLE)
+        STARTUP.step('display')
         
         # Configuração de fonte e tempo
         self.clock = pg.time.Clock()
@@ -76,6 +101,7 @@ class Game:
         self.big_font = pg.font.Font(None, 72)  # Fonte para títulos
         self.small_font = pg.font.Font(None, 24)  # Fonte para textos pequenos
         self.level_up_font = pg.font.Font(None, 48)  # Fonte para mensagem de level up
+        STARTUP.step('fontes')
         self.show_level_up = False
         self.level_up_time = 0
         self.level_up_duration = 2000  # 2 segundos
@@ -98,13 +124,26 @@ class Game:
         # Grupos de sprites
         self.all_sprites = pg.sprite.Group()  # Todos os sprites do jogo
         self.projectiles = pg.sprite.Group()  # Projéteis atirados
-        self.items = pg.sprite.Group()        # Itens coletáveis
+        self.items = ItemEngine()             # Itens coletáveis (motor vetorizado)
         
         # Referências importantes
         self.player = None  # Será configurado quando o jogo começar
+        self.player_shape = shape_id(Alchemist.hitbox)  # Formato de colisão do jogador
+        self.projectile_shape = shape_id(Projectile.hitbox)  # Formato de colisão dos projéteis
         self.hud = HUD(self)  # Interface do usuário
         self.item_spawner = ItemSpawner(self)  # Controla o spawn de itens
         self.damage_indicators = []  # Indicadores de dano flutuantes
+        self.explosions = ExplosionQueue(self)  # Explosões em cadeia pendentes e seus efeitos
+        self.frame_timer = FrameTimer()  # Tempo de cada fase do frame
+        self.perf_overlay = PerfOverlay(self.frame_timer)  # Overlay de desempenho (F3)
+        self.flight_recorder = FlightRecorder(self.frame_timer)  # Salva os últimos frames se um demorar demais
+        self.profiler = SamplingProfiler(self)  # Profiler por estado do jogo (F9 ou main.py --profile)
+        self.input_latency = InputLatencyProbe(self)  # Latência tecla -> tela (main.py --latency)
+        self._overlay_allocations = (0, 0)  # (Surfaces, textos) criados pelo próprio overlay no frame
+        
+        # Pools de objetos reutilizáveis (criados antes de cada nível)
+        self.projectile_pool = ObjectPool(Projectile, 'projectiles')
+        self.indicator_pool = ObjectPool(DamageIndicator, 'damage_indicators')
         
         # Estatísticas do jogador
         self.ingredients_collected = 0  # Total de ingredientes coletados
@@ -118,19 +157,29 @@ class Game:
         self.level = 1                      # Nível atual
         self.level_start_time = 0           # Quando o nível começou
         self.level_complete = False         # Se o nível foi completado
+        self.difficulty_table = DIFFICULTY_TABLE   # Perfis de dificuldade desta sessão
+        self.difficulty = difficulty_for(1, self.difficulty_table)  # Perfil do nível atual
+        # Pacote de níveis com receitas e ondas prontas (None = níveis sorteados)
+        self.level_pack = LevelPack.load(settings.LEVEL_PACK) if settings.LEVEL_PACK else None
+        self.show_level_complete = False    # Se o banner de nível completo está visível
+        
+        # Timers de jogo no relógio da simulação (invencibilidade, mensagens, banners)
+        self.timers = TimerService()
+        self._next_level_timer = None
+        self._message_timer = None
+        self.message = None
         
         # Controle de estado
         self.is_game_over = False  # Se o jogo terminou
+        STARTUP.step('objetos do jogo')
         
         # Carrega recursos e inicia o jogo
         self._load_data()  # Carrega sons e imagens
-        
-        # Configura o timer para spawn de itens
-        self.item_spawn_timer = pg.USEREVENT + 1
-        pg.time.set_timer(self.item_spawn_timer, settings.ITEM_SPAWN_INTERVAL)
+        STARTUP.step('assets')
         
         # Toca a música do menu
         self._play_background_music('menu')
+        STARTUP.step('música do menu')
 
     def _load_data(self):
         """
@@ -164,27 +213,15 @@ class Game:
                     if os.path.exists(path):
                         self.sounds[name] = pg.mixer.Sound(path)
                     else:
-                        print(f"[AVISO] Arquivo de som não encontrado: {path}")
+                        log.warning("[AVISO] Arquivo de som não encontrado: %s", path)
                         
             except Exception as e:
-                print(f"[ERRO] Falha ao carregar sons: {e}")
+                log.error("[ERRO] Falha ao carregar sons: %s", e)
         
-        # Carrega a imagem de fundo do jogo
-        try:
-            # Define o caminho para a imagem de fundo
-            bg_path = os.path.join(settings.ASSETS_DIR, 'images', 'background', '4', 'dead forest.png')
-            
-            # Carrega e redimensiona a imagem para o tamanho da janela
-            bg_orig = pg.image.load(bg_path).convert()
-            self.background_image = pg.transform.scale(bg_orig, (self.WINDOW_WIDTH, self.WINDOW_HEIGHT))
-            
-        except FileNotFoundError:
-            print("[AVISO] Arquivo de fundo não encontrado. Usando fundo preto.")
-            self.background_image = None
-            
-        except Exception as e:
-            print(f"[ERRO] Falha ao carregar imagem de fundo: {e}")
-            self.background_image = None  # Fallback para fundo preto
+        # Fundos dos níveis: o do nível 1 é carregado agora, os seguintes são
+        # pré-carregados numa thread durante o nível anterior
+        self.backgrounds = LevelAssetPrefetcher((self.WINDOW_WIDTH, self.WINDOW_HEIGHT))
+        self.background_image = self.backgrounds.acquire(1)  # None = fundo preto
 
     def run(self):
         """
@@ -243,6 +280,14 @@ class Game:
             # Estado QUIT - Encerra o jogo
             elif self.state == "QUIT":
                 self.running = False  # Sai do loop principal
+        
+        # Salva os spans que sobraram desde o último game over
+        if TRACER.enabled:
+            TRACER.write()
+        self.flight_recorder.shutdown()
+        self.backgrounds.shutdown()
+        self.profiler.stop()
+        ALLOCATIONS.uninstall()
 
     def setup_new_game(self):
         """
@@ -259,10 +304,13 @@ class Game:
         # Reinicia a pontuação e o tempo de jogo
         self.score = 0
         self.game_start_time = pg.time.get_ticks()  # Marca o início do jogo
+        self.timers.reset()                         # Reinicia o relógio da simulação
+        self.telemetry.start_session()              # Zera os contadores da sessão
+        self.input_latency.reset()                  # Zera as medidas de latência de entrada
         
         # Limpa todos os grupos de sprites para remover resquícios de jogos anteriores
+        self._clear_projectiles()   # Devolve projéteis ativos ao pool
         self.all_sprites.empty()    # Remove todos os sprites do jogo
-        self.projectiles.empty()    # Limpa projéteis ativos
         self.items.empty()          # Remove itens restantes
         
         # Cria uma nova instância do jogador na posição central inferior da tela
@@ -271,10 +319,6 @@ class Game:
         self.player = Alchemist(self, (player_x, player_y))
         self.all_sprites.add(self.player)  # Adiciona o jogador ao grupo de sprites
         
-        # Configura o timer para spawn automático de itens
-        # O intervalo é definido nas configurações do jogo
-        pg.time.set_timer(self.item_spawn_timer, settings.ITEM_SPAWN_INTERVAL)
-        
         # Inicia a trilha sonora do jogo
         self._play_background_music('game')
         
@@ -284,6 +328,7 @@ class Game:
         # Inicia o jogo no nível 1
         self.start_level(1)
         
+    @traced('start_level', 'level')
     def start_level(self, level: int):
         """
         Inicializa um novo nível do jogo com as configurações apropriadas.
@@ -302,22 +347,20 @@ class Game:
         self.level_complete = False
         self.level_start_time = time.time()  # Marca o início do nível
         
-        # Notifica o gerenciador de níveis para configurar os requisitos
-        self.level_manager.start_level(level)
-        
         # Remove itens restantes do nível anterior
         self.items.empty()
+        self.explosions.clear()
         
-        # Aumenta a dificuldade progressivamente a cada nível
-        # Reduz o intervalo entre spawns em 50ms por nível, com mínimo de 200ms
-        settings.ITEM_SPAWN_INTERVAL = max(1000 - (level * 50), 200)
-        # Aplica o novo intervalo de spawn
-        pg.time.set_timer(self.item_spawn_timer, settings.ITEM_SPAWN_INTERVAL)
+        # Dificuldade, receitas e ondas de spawn do nível
+        self._configure_level(level)
         
         # Atualiza o HUD para refletir o novo nível
         if hasattr(self, 'hud'):
             self.hud.update_level(level)
+        
+        self._memory_checkpoint('start_level', level=level)
             
+    @traced('next_level', 'level')
     def next_level(self):
         """
         Avança para o próximo nível do jogo, realizando a transição necessária.
@@ -329,20 +372,25 @@ class Game:
         - Reproduzir efeitos visuais e sonoros
         - Atualizar a interface do usuário
         """
+        # Mostra quanto de cada pool o nível usou (para dimensionar os pools)
+        self._report_pools()
+        
         # Limpa todos os itens e projéteis do nível atual
         self.items.empty()          # Remove itens restantes
-        self.projectiles.empty()    # Remove projéteis em voo
+        self.explosions.clear()     # Descarta explosões em cadeia pendentes
+        self._clear_projectiles()   # Remove projéteis em voo
         
         # Incrementa o contador de níveis e atualiza o estado
         self.level += 1
         self.level_complete = False
         
-        # Mostra mensagem de level up
+        # Mostra mensagem de level up (escondida por um timer)
         self.show_level_up = True
-        self.level_up_time = pg.time.get_ticks()
+        self.level_up_time = self.sim_time
+        self.timers.call_later(self.level_up_duration, self._hide_level_up)
         
         # Notifica o gerenciador de níveis sobre a mudança
-        self.level_manager.start_level(self.level)
+        self._configure_level(self.level)
         
         # Reproduz som de avanço de nível
         self._play_sound('level_up')
@@ -357,7 +405,45 @@ class Game:
         
         # Limpa qualquer timer de próximo nível que possa estar pendente
         # Isso evita múltiplas chamadas acidentais a este método
-        pg.time.set_timer(pg.USEREVENT + 2, 0)  # Cancela o timer
+        self._cancel_timer('_next_level_timer')
+        
+        self._memory_checkpoint('next_level', level=self.level)
+
+    def _configure_level(self, level):
+        """
+        Prepara dificuldade, receitas e ondas de spawn de um nível.
+        
+        Níveis do pacote (settings.LEVEL_PACK) usam o perfil, as receitas e as
+        ondas compiladas do pacote; os demais usam a tabela de dificuldade e
+        ondas sorteadas. O nível seguinte do pacote já é compilado aqui.
+        """
+        pack = self.level_pack
+        from_pack = pack is not None and pack.has_level(level)
+        
+        # Perfil de dificuldade do nível (imutável, compartilhado entre sessões)
+        self.difficulty = pack.profile(level) if from_pack else difficulty_for(level, self.difficulty_table)
+        
+        # Notifica o gerenciador de níveis para configurar os requisitos
+        self.level_manager.start_level(level, self.difficulty, pack.recipes(level) if from_pack else None)
+        
+        # Cria de antemão os objetos que o nível vai usar
+        self._prewarm_pools()
+        self._apply_collision_profile()
+        
+        # Agenda as ondas de spawn do nível no relógio da simulação
+        # (o intervalo entre ondas diminui a cada nível)
+        entries = self.item_spawner.entries
+        schedule = pack.schedule(level, entries) if from_pack else None
+        self.item_spawner.start_level(self.difficulty, self.sim_time, schedule)
+        if pack is not None:
+            pack.prefetch(level + 1, entries)
+            for lvl in (level, level + 1):
+                if pack.background(lvl):
+                    self.backgrounds.overrides[lvl] = pack.background(lvl)
+        
+        # Troca o fundo (já pré-carregado) e começa a carregar o do próximo nível
+        self.background_image = self.backgrounds.acquire(level)
+        self.backgrounds.prefetch(level + 1)
 
     def _run_game_loop(self):
         """
@@ -386,16 +472,9 @@ class Game:
             if self.state != "GAME":
                 game_is_running = False
                 continue
-                
-            # Etapas principais do loop do jogo:
-            # 1. Processa eventos (entrada do usuário, etc)
-            self.events()
             
-            # 2. Atualiza a lógica do jogo (movimento, colisões, etc)
-            self.update()
-            
-            # 3. Renderiza todos os elementos na tela
-            self.draw()
+            # Eventos, atualização e desenho de um frame (medidos por fase)
+            self.run_frame()
             
             # Verifica se o jogador perdeu todas as vidas
             if self.player and self.player.lives <= 0:
@@ -403,6 +482,31 @@ class Game:
                 self.game_over()
                 game_is_running = False
 
+    def run_frame(self):
+        """
+        Executa um frame do jogo: eventos, atualização e desenho.
+
+        O frame é medido por fase (FrameTimer), com as alocações e o gravador
+        de voo. Usado pelo loop principal e pelo benchmark (sem o clock).
+        """
+        # Começa a medir o frame (tempos por fase, alocações e gravador de voo)
+        self.frame_timer.begin_frame()
+        self.flight_recorder.begin_frame()
+        self.input_latency.begin_frame()
+        allocations_start = ALLOCATIONS.snapshot()
+            
+        # Etapas principais do loop do jogo:
+        # 1. Processa eventos (entrada do usuário, etc)
+        self.events()
+        self.frame_timer.mark('events')
+        
+        # 2. Atualiza a lógica do jogo (movimento, colisões, etc)
+        self.update()
+        
+        # 3. Renderiza todos os elementos na tela
+        self.draw()
+        self._end_frame(allocations_start)
+
     def events(self):
         """
         Processa todos os eventos do jogo em cada frame.
@@ -417,6 +521,10 @@ class Game:
         """
         # Processa todos os eventos pendentes na fila de eventos do Pygame
         for event in pg.event.get():
+            self.telemetry.count_event(event.type)
+            self.flight_recorder.record_event(event)
+            self.input_latency.record_input(event)  # Antes de tratar (tiro e movimento)
+            
             # Evento de fechar a janela (clique no X)
             if event.type == pg.QUIT:
                 self.state = "QUIT"
@@ -431,15 +539,20 @@ class Game:
                     
                 # Barra de ESPAÇO: Dispara poção
                 if event.key == pg.K_SPACE and self.player:
+                    last_shot = self.player.last_shot_time
                     self.player.shoot()
-            
-            # Evento de spawn de itens (disparado por um timer)
-            if event.type == self.item_spawn_timer and not self.level_complete:
-                self.item_spawner.spawn_item()  # Gera novos itens na tela
+                    # Tecla em recarga não dispara: a sonda conta como 'sem reação'
+                    shot = self.player.last_shot_time
+                    self.input_latency.shot_result(shot if shot != last_shot else None)
+                
+                # F3: Mostra/esconde o overlay de desempenho
+                if event.key == pg.K_F3:
+                    self.perf_overlay.toggle()
+                    self._sync_allocation_counter()
                 
-            # Evento personalizado para avançar de nível
-            elif event.type == pg.USEREVENT + 2:
-                self.next_level()  # Avança para o próximo nível
+                # F9: Liga/desliga o profiler (grava os arquivos ao desligar)
+                if event.key == pg.K_F9:
+                    self.profiler.toggle()
                 
         # Atualiza o HUD (Heads-Up Display) se existir
         if hasattr(self, 'hud') and self.hud:
@@ -474,17 +587,48 @@ class Game:
         # Atualiza a posição de todos os sprites do jogo
         # baseado em suas velocidades e entrada do jogador
         self.all_sprites.update(keys)
+        self.frame_timer.mark('update.other')
+        
+        # Avança o relógio da simulação: dispara os timers vencidos e as ondas
+        # de spawn agendadas
+        self.timers.advance()
+        if not self.level_complete:
+            self.item_spawner.update(self.sim_time)
+        self.frame_timer.mark('update.spawning')
+        
+        # Move todos os itens e remove os que saíram da tela (vetorizado);
+        # itens com padrão homing seguem a altura do jogador
+        culled = self.items.step(self.player.rect.centery if self.player else None)
+        if culled:
+            self.telemetry.add('items.culled', culled)
+        self.frame_timer.mark('update.cleanup')
         
         # Verificação de segurança - se não houver jogador, interrompe a atualização
         if self.player is None: 
             return
         
-        # Detecta colisões entre o jogador e os itens coletáveis usando máscaras para precisão
+        # Detecta colisões entre o jogador e os itens coletáveis
+        # Primeiro consulta o índice espacial, depois resolve retângulos e círculos
+        # de forma vetorizada; só os itens que pedem precisão testam as máscaras
         hits_player_item = []
-        for item in self.items:
+        if self.player_shape in (SHAPE_CIRCLE, SHAPE_CIRCLE_MASK):
+            player_box, player_circle = self.player.rect, self.player.hitbox_circle()
+        else:
+            player_box, player_circle = self.player.hitbox_rect(), None
+        candidates = self.items.query_rect(self.player.rect)
+        accepted, needs_mask = narrow_phase(self.items, candidates, player_box, player_circle,
+                                            self.player_shape)
+        for slot in accepted:
+            hits_player_item.append(self.items.view(slot))
+        for slot in needs_mask:
+            item = self.items.view(slot)
             if pg.sprite.collide_mask(self.player, item):
                 hits_player_item.append(item)
-                item.kill()  # Remove o item da tela
+        for item in hits_player_item:
+            item.kill()  # Remove o item da tela
+        self.telemetry.add('collision.player.tested', int(candidates.size))
+        self.telemetry.add('collision.mask_tests', int(needs_mask.size))
+        self.telemetry.add('collision.player.hits', len(hits_player_item))
         
         # Processa cada item que colidiu com o jogador
         for hit in hits_player_item:
@@ -495,16 +639,16 @@ class Game:
             
             try:
                 # Verifica se o item coletado é um Ingrediente (poção boa)
-                if isinstance(hit, Ingredient):
+                if hit.kind == KIND_INGREDIENT:
                     # Só processa se estivermos no modo de fases e o nível não estiver completo
                     if hasattr(self, 'level_manager') and not self.level_complete:
-                        # Obtém o nome da poção do atributo do item
-                        potion_name = getattr(hit, 'potion_file_name', None)
+                        # Obtém o id da poção guardado no item
+                        potion_id = hit.potion_id
                         
-                        # Verifica se esta poção é uma das que fazem parte do nível atual
-                        if potion_name and potion_name in good_potions:
+                        # Verifica se esta poção é uma poção boa (teste de bit no catálogo)
+                        if CATALOG.is_good(potion_id):
                             # Registra a coleta da poção e verifica se está na ordem correta
-                            correct_order, level_complete = self.level_manager.register_potion_collected(potion_name)
+                            correct_order, level_complete = self.level_manager.register_potion_collected(potion_id)
                             
                             # Se a poção foi coletada na ordem correta
                             if correct_order:
@@ -522,14 +666,17 @@ class Game:
                                 # Verifica se completou o nível com sucesso
                                 if level_complete:
                                     self.level_complete = True
-                                    # Marca o tempo de conclusão para delay visual
-                                    self.level_complete_time = pg.time.get_ticks()
+                                    # Mostra o banner de conclusão por 3 segundos
+                                    self.level_complete_time = self.sim_time
+                                    self.show_level_complete = True
+                                    self.timers.call_later(3000, self._hide_level_complete)
                                     # Agenda o próximo nível para ser carregado após um pequeno delay
-                                    pg.time.set_timer(pg.USEREVENT + 2, 500)  # .5 segundos de delay
+                                    self._cancel_timer('_next_level_timer')
+                                    self._next_level_timer = self.timers.call_later(500, self.next_level)
                             else:
                                 # O jogador errou a sequência de poções
                                 # Apenas mostra mensagem de erro, sem remover vidas
-                                print("[ERRO] Ordem incorreta! Continue tentando.")
+                                log.debug("[ERRO] Ordem incorreta! Continue tentando.")
                                 self.current_combo = 0  # Reseta o combo
                                 
                                 # Toca som de erro
@@ -545,7 +692,7 @@ class Game:
                         self._handle_normal_ingredient()
                 
                 # Item do tipo Hazard (perigoso) - causa dano ao jogador
-                elif isinstance(hit, Hazard):
+                elif hit.kind == KIND_HAZARD:
                     damage = hit.damage  # Valor de dano definido no objeto Hazard
                     sound_to_play = 'damage'  # Som de dano
                     self.player.take_damage(damage)  # Aplica o dano ao jogador
@@ -553,7 +700,7 @@ class Game:
                     
                     # Cria um indicador visual de dano sobre o jogador
                     if hasattr(self, 'damage_indicators'):
-                        indicator = DamageIndicator(
+                        indicator = self.indicator_pool.acquire(
                             f'-{damage}',  # Texto exibido (ex: "-1")
                             (self.player.rect.centerx, self.player.rect.top - 20),  # Posição acima do jogador
                             color=(255, 50, 50),  # Cor vermelha para indicar dano
@@ -562,19 +709,18 @@ class Game:
                         self.damage_indicators.append(indicator)  # Adiciona à lista de indicadores ativos
                 
                 # Processa colisão com bombas
-                elif isinstance(hit, Bomb):
+                elif hit.kind == KIND_BOMB:
                     damage = 2  # Dano fixo causado por bombas
                     sound_to_play = 'explosion'  # Som característico de explosão
                     self.player.take_damage(damage)  # Aplica o dano
                     self.current_combo = 0  # Reseta o combo ao ser atingido
                     
-                    # Cria um efeito visual de explosão no local da bomba
+                    # A bomba explode no local; bombas no raio explodem em cadeia
+                    self.explosions.trigger(hit.rect.center, getattr(hit.prototype, 'explosion_radius', None))
+                    
                     if hasattr(self, 'damage_indicators'):
-                        # Cria o efeito de explosão com o raio definido nas configurações
-                        Explosion(self, hit.rect.center, settings.BOMB_EXPLOSION_RADIUS)
-                        
                         # Cria um indicador de dano sobre o jogador
-                        indicator = DamageIndicator(
+                        indicator = self.indicator_pool.acquire(
                             f'-{damage}',  # Texto exibido (ex: "-2")
                             (self.player.rect.centerx, self.player.rect.top - 20),  # Posição
                             color=(255, 50, 50),  # Cor vermelha
@@ -588,51 +734,56 @@ class Game:
                     
                 # Verifica se o jogador perdeu todas as vidas após o dano
                 if damage > 0 and self.player.lives <= 0 and not self.is_game_over:
-                    print("Jogador sem vidas, chamando game over...")  # Debug
+                    log.info("Jogador sem vidas, chamando game over...")  # Debug
                     self.game_over()  # Inicia a sequência de fim de jogo
                     return  # Interrompe a atualização atual
                     
             except Exception as e:
                 # Captura e exibe erros que possam ocorrer durante o processamento de colisões
-                print(f"Erro ao processar colisão: {e}")
-                import traceback
-                traceback.print_exc()  # Imprime o stack trace para depuração
+                log.exception("Erro ao processar colisão: %s", e)  # Inclui o stack trace
                 
             finally:
                 # Garante que o HUD seja atualizado mesmo em caso de erro
                 if hasattr(self, 'update_hud'):
                     self.update_hud()  # Atualiza a interface do usuário
+        self.frame_timer.mark('update.collision')
         
         # Filtra e remove indicadores de dano que já expiraram
         # Apenas mantém os indicadores cujo método update() retorna True (ainda ativos)
-        self.damage_indicators = [ind for ind in self.damage_indicators if ind.update()]
-        
-        # Remove itens que saíram da tela para liberar memória
-        self.item_spawner.cleanup_off_screen_items()
+        # e devolve os expirados ao pool
+        active_indicators = []
+        for indicator in self.damage_indicators:
+            if indicator.update():
+                active_indicators.append(indicator)
+            else:
+                self.indicator_pool.release(indicator)
+        self.damage_indicators = active_indicators
+        self.frame_timer.mark('update.cleanup')
         
-        # Verifica colisões entre projéteis do jogador e itens usando máscaras
+        # Verifica colisões entre projéteis do jogador e itens com teste contínuo
+        # (segmento percorrido no frame contra o retângulo do item), assim um tiro
+        # rápido não atravessa um item entre dois frames
         hits_projectile_item = {}
-        for proj in self.projectiles:
-            for item in self.items:
-                if pg.sprite.collide_mask(proj, item):
-                    if proj not in hits_projectile_item:
-                        hits_projectile_item[proj] = []
-                    hits_projectile_item[proj].append(item)
-                    proj.kill()
-                    item.kill()
+        projectiles = self.projectiles.sprites()
+        for proj_index, slot, _ in sweep_projectiles(projectiles, self.items, self.projectile_shape, self.telemetry):
+            proj = projectiles[proj_index]
+            item = self.items.view(slot)
+            hits_projectile_item[proj] = [item]
+            proj.kill()
+            item.kill()
+            # Bomba atingida por um tiro também explode
+            if item.kind == KIND_BOMB:
+                self.explosions.trigger(item.rect.center, getattr(item.prototype, 'explosion_radius', None))
         
         # Se houve colisões entre projéteis e itens
         if hits_projectile_item:
             self.add_score(5)  # Concede pontos por acertar itens com projéteis
             self._play_sound('explosion')  # Toca som de explosão
             self.enemies_defeated += len(hits_projectile_item)  # Atualiza contador de itens acertados
-
-        # Limpeza final de indicadores de dano (repetida por segurança)
-        # Garante que mesmo indicadores criados durante o processamento sejam limpos
-        self.damage_indicators = [ind for ind in self.damage_indicators if ind.update()]
         
-        # Limpeza final de itens fora da tela (repetida por segurança)
-        self.item_spawner.cleanup_off_screen_items()
+        # Processa as explosões pendentes dentro do orçamento do tick
+        self.explosions.update()
+        self.frame_timer.mark('update.collision')
 
     def draw(self):
         """
@@ -649,10 +800,20 @@ class Game:
         else:
             # Fallback para fundo preto caso não haja imagem
             self.screen.fill(settings.BLACK)
+        self.frame_timer.mark('draw.background')
+
+        # Desenha todos os itens de uma vez (uma única chamada a blits)
+        self.items.draw(self.screen)
+        self.frame_timer.mark('draw.sprites')
+        
+        # Efeitos das explosões sobre os itens
+        self.explosions.draw(self.screen)
+        self.frame_timer.mark('draw.effects')
 
         # Desenha todos os sprites do jogo na ordem de suas camadas (layers)
-        # Isso inclui jogador, itens, projéteis, etc.
+        # Isso inclui jogador, projéteis, etc.
         self.all_sprites.draw(self.screen)
+        self.frame_timer.mark('draw.sprites')
 
         # Efeito visual de invencibilidade (piscando) quando o jogador está protegido
         if self.player and hasattr(self.player, 'is_invulnerable') and self.player.is_invulnerable:
@@ -661,6 +822,7 @@ class Game:
         # Desenha os indicadores de dano flutuantes (ex: "-1" quando o jogador leva dano)
         for indicator in self.damage_indicators:
             indicator.draw(self.screen)
+        self.frame_timer.mark('draw.effects')
 
         # Elementos de interface são desenhados apenas durante o jogo
         if self.state == "GAME":
@@ -668,26 +830,23 @@ class Game:
             self.hud.draw()
             
             # Mostra mensagem de level up se necessário
-            if hasattr(self, 'show_level_up') and self.show_level_up:
-                current_time = pg.time.get_ticks()
-                if current_time - self.level_up_time < 2000:  # 2 segundos
-                    # Cria uma superfície semi-transparente
-                    overlay = pg.Surface((self.WINDOW_WIDTH, 100), pg.SRCALPHA)
-                    overlay.fill((0, 0, 0, 150))  # Preto semi-transparente
-                    
-                    # Renderiza o texto "LEVEL UP!"
-                    level_up_text = pg.font.Font(None, 48).render(
-                        f'NÍVEL {self.level} DESBLOQUEADO!', 
-                        True, 
-                        (255, 215, 0)  # Dourado
-                    )
-                    text_rect = level_up_text.get_rect(center=(self.WINDOW_WIDTH // 2, self.WINDOW_HEIGHT // 2))
-                    
-                    # Desenha a mensagem
-                    self.screen.blit(overlay, (0, self.WINDOW_HEIGHT // 2 - 50))
-                    self.screen.blit(level_up_text, text_rect)
-                else:
-                    self.show_level_up = False
+            # (o timer de level up desliga show_level_up depois de 2 segundos)
+            if self.show_level_up:
+                # Cria uma superfície semi-transparente
+                overlay = pg.Surface((self.WINDOW_WIDTH, 100), pg.SRCALPHA)
+                overlay.fill((0, 0, 0, 150))  # Preto semi-transparente
+                
+                # Renderiza o texto "LEVEL UP!"
+                level_up_text = pg.font.Font(None, 48).render(
+                    f'NÍVEL {self.level} DESBLOQUEADO!', 
+                    True, 
+                    (255, 215, 0)  # Dourado
+                )
+                text_rect = level_up_text.get_rect(center=(self.WINDOW_WIDTH // 2, self.WINDOW_HEIGHT // 2))
+                
+                # Desenha a mensagem
+                self.screen.blit(overlay, (0, self.WINDOW_HEIGHT // 2 - 50))
+                self.screen.blit(level_up_text, text_rect)
             
             # Código mantido para referência futura, caso seja necessário exibir
             # a sequência de poções necessárias em algum momento
@@ -695,10 +854,7 @@ class Game:
             #     self.level_manager.draw_requirements(self.screen, 20, 20)
             
             # Exibe uma mensagem de "Nível Completo" por 3 segundos após completar um nível
-            if (hasattr(self, 'level_complete') and 
-                hasattr(self, 'level_complete_time') and 
-                self.level_complete and 
-                time.time() - self.level_complete_time < 3):
+            if self.level_complete and self.show_level_complete:
                 
                 # Renderiza o texto em verde para indicar sucesso
                 level_complete_text = self.big_font.render(
@@ -716,9 +872,8 @@ class Game:
                 self.screen.blit(level_complete_text, text_rect)
         
             # Exibe mensagens temporárias na tela (como dicas, avisos ou instruções)
-            if (hasattr(self, 'message') and 
-                hasattr(self, 'message_end_time') and 
-                pg.time.get_ticks() < self.message_end_time):
+            # (o timer da mensagem a apaga quando a duração acaba)
+            if self.message:
                 
                 # Cria uma superfície semi-transparente para melhorar a legibilidade do texto
                 message_surface = pg.Surface((self.WINDOW_WIDTH, 40), pg.SRCALPHA)  # SRCALPHA permite transparência
@@ -731,10 +886,50 @@ class Game:
                 # Desenha o fundo e o texto na tela
                 self.screen.blit(message_surface, (0, 10))  # Fundo ligeiramente abaixo do topo
                 self.screen.blit(message_text, text_rect)    # Texto sobre o fundo
+        self.frame_timer.mark('draw.hud')
+        
+        # Overlay de desempenho (F3); as Surfaces dele não entram na contagem do frame
+        before = ALLOCATIONS.snapshot()
+        self.perf_overlay.fps = self.clock.get_fps()
+        self.perf_overlay.draw(self.screen)
+        after = ALLOCATIONS.snapshot()
+        self._overlay_allocations = (after[0] - before[0], after[1] - before[1])
+        self.frame_timer.mark('overlay')
     
         # Atualiza a tela inteira com tudo o que foi desenhado
         # Isso é essencial para que as alterações sejam visíveis ao jogador
         pg.display.flip()
+        self.input_latency.presented()  # Reações de entrada que acabaram de ir para a tela
+        self.frame_timer.mark('flip')
+
+    def _end_frame(self, allocations_start):
+        """
+        Fecha a medição do frame com os contadores ao vivo.
+
+        Args:
+            allocations_start: ALLOCATIONS.snapshot() do início do frame
+        """
+        surfaces, renders = ALLOCATIONS.snapshot()
+        self.frame_timer.end_frame(
+            items=len(self.items),
+            projectiles=len(self.projectiles),
+            indicators=len(self.damage_indicators),
+            surfaces=surfaces - allocations_start[0] - self._overlay_allocations[0],
+            renders=renders - allocations_start[1] - self._overlay_allocations[1],
+        )
+        self.flight_recorder.end_frame(self.frame_timer.counts)
+        self._overlay_allocations = (0, 0)
+        self.telemetry.add('frames')
+
+    def _sync_allocation_counter(self):
+        """
+        Mantém o contador de alocações instalado só enquanto alguém lê a
+        contagem (overlay visível, telemetria ou settings.PERF_COUNT_ALLOCATIONS).
+        """
+        if settings.PERF_COUNT_ALLOCATIONS or self.perf_overlay.visible or self.telemetry.enabled:
+            ALLOCATIONS.install()
+        else:
+            ALLOCATIONS.uninstall()
 
     def _draw_invulnerability_aura(self):
         """
@@ -748,15 +943,13 @@ class Game:
         if not self.player or not self.player.is_invulnerable: 
             return  # Sai do método se não houver jogador ou se ele não estiver invencível
             
-        # Verifica se o tempo de invencibilidade já expirou
-        current_time = pg.time.get_ticks()
-        if current_time > self.player.invulnerable_until:
-            self.player.is_invulnerable = False  # Desativa a invencibilidade
-            return  # Sai do método se o tempo de invencibilidade acabou
+        # O fim da invencibilidade é tratado pelo timer do jogador; aqui só se
+        # usa o tempo da simulação para o efeito visual
+        current_time = self.sim_time
             
         # Calcula o tempo restante de invencibilidade como um valor entre 0.0 e 1.0
         # Onde 1.0 é o início da invencibilidade e 0.0 é o fim
-        time_left = (self.player.invulnerable_until - current_time) / settings.PLAYER_INVULNERABILITY_DURATION
+        time_left = max(0.0, (self.player.invulnerable_until - current_time) / settings.PLAYER_INVULNERABILITY_DURATION)
         
         # Cria um efeito de pulsação suave usando a função seno
         # Multiplicador 0.01 controla a velocidade da pulsação
@@ -850,11 +1043,40 @@ class Game:
             message (str): A mensagem a ser exibida
             duration (int): Duração em milissegundos (padrão: 2000ms)
         """
-        if not hasattr(self, 'message') or not hasattr(self, 'message_end_time') or pg.time.get_ticks() < self.message_end_time:
-            self.message = message
-            self.message_start_time = pg.time.get_ticks()
-            self.message_end_time = self.message_start_time + duration
+        self.message = message
+        self.message_start_time = self.sim_time
+        self.message_end_time = self.message_start_time + duration
+        
+        # Uma mensagem nova substitui a anterior e o seu timer
+        self._cancel_timer('_message_timer')
+        self._message_timer = self.timers.call_later(duration, self._clear_message)
+    
+    @property
+    def sim_time(self):
+        """Tempo atual da simulação em ms (avança um passo por frame)."""
+        return self.timers.now_ms
     
+    def _cancel_timer(self, name):
+        """Cancela o timer guardado no atributo 'name', se houver."""
+        timer = getattr(self, name, None)
+        if timer is not None:
+            timer.cancel()
+            setattr(self, name, None)
+    
+    def _hide_level_up(self):
+        """Callback de timer: esconde o banner de level up."""
+        self.show_level_up = False
+    
+    def _hide_level_complete(self):
+        """Callback de timer: esconde o banner de nível completo."""
+        self.show_level_complete = False
+    
+    def _clear_message(self):
+        """Callback de timer: apaga a mensagem temporária."""
+        self.message = None
+        self._message_timer = None
+    
+    @traced('music_switch', 'audio')
     def _play_background_music(self, music_type='game'):
         """
         Controla a reprodução da música de fundo do jogo.
@@ -880,7 +1102,7 @@ class Game:
         # Obtém o nome do arquivo de música correspondente ao tipo solicitado
         music_file = music_files.get(music_type)
         if not music_file:
-            print(f"[ERRO] Tipo de música inválido: {music_type}")
+            log.error("[ERRO] Tipo de música inválido: %s", music_type)
             return
             
         # Monta o caminho completo para o arquivo de música
@@ -888,7 +1110,7 @@ class Game:
         
         # Verifica se o arquivo de música existe no sistema de arquivos
         if not os.path.exists(music_path):
-            print(f"[AVISO] Arquivo de música não encontrado: {music_path}")
+            log.warning("[AVISO] Arquivo de música não encontrado: %s", music_path)
             return
             
         try:
@@ -902,10 +1124,10 @@ class Game:
             volume = 0.5 if music_type == 'menu' else 0.7  # Ajusta o volume conforme necessário
             pg.mixer.music.set_volume(volume * self.music_volume)
             pg.mixer.music.play(-1)  # -1 para loop infinito
-            print(f"Tocando música: {music_file}")
+            log.info("Tocando música: %s", music_file)
             
         except Exception as e:
-            print(f"Erro ao reproduzir {music_file}: {e}")
+            log.error("Erro ao reproduzir %s: %s", music_file, e)
 
     def _play_sound(self, sound_type):
         """
@@ -925,7 +1147,7 @@ class Game:
                 sound.set_volume(self.sfx_volume)  # Ajusta o volume
                 sound.play()  # Toca o som
         except Exception as e:
-            print(f"[ERRO] Falha ao reproduzir som '{sound_type}': {e}")
+            log.error("[ERRO] Falha ao reproduzir som '%s': %s", sound_type, e)
 
     def add_score(self, points):
         """
@@ -973,10 +1195,10 @@ class Game:
             background = pg.image.load(bg_path).convert()
             background = pg.transform.scale(background, (self.WINDOW_WIDTH, self.WINDOW_HEIGHT))
         except FileNotFoundError:
-            print("Aviso: Imagem de fundo de game over não encontrada. Usando fundo preto.")
+            log.warning("Aviso: Imagem de fundo de game over não encontrada. Usando fundo preto.")
             background = None
         except Exception as e:
-            print(f"Erro ao carregar imagem de fundo: {e}")
+            log.error("Erro ao carregar imagem de fundo: %s", e)
             background = None
     
     def show_game_over_screen(self, stats):
@@ -1000,12 +1222,12 @@ class Game:
                 if os.path.exists(bg_path):
                     background = pg.image.load(bg_path).convert()
                     background = pg.transform.scale(background, (self.WINDOW_WIDTH, self.WINDOW_HEIGHT))
-                    print(f"Imagem de fundo carregada: {bg_path}")
+                    log.debug("Imagem de fundo carregada: %s", bg_path)
                     break
             except Exception as e:
-                print(f"Erro ao carregar imagem de fundo {bg_path}: {e}")
+                log.error("Erro ao carregar imagem de fundo %s: %s", bg_path, e)
         else:
-            print("Nenhuma imagem de fundo encontrada, usando fundo preto")
+            log.warning("Nenhuma imagem de fundo encontrada, usando fundo preto")
             background = None
         
         # Textos a serem exibidos
@@ -1069,7 +1291,8 @@ class Game:
         Args:
             level_complete (bool): Indica se o nível foi concluído (com falha)
         """
-        print("[ERRO] Ordem incorreta! Vidas restantes:", self.player.lives if hasattr(self, 'player') and self.player else 'N/A')
+        log.debug("[ERRO] Ordem incorreta! Vidas restantes: %s",
+                  self.player.lives if hasattr(self, 'player') and self.player else 'N/A')
         self.current_combo = 0  # Reseta o combo
         
         # Toca som de erro
@@ -1087,9 +1310,9 @@ class Game:
         if getattr(self, 'is_game_over', False):
             return
             
-        print("\n=== GAME OVER ===")
-        print(f"Jogador ID: {getattr(self, 'active_player_id', 'Nenhum')}")
-        print(f"Score: {self.score}")
+        log.info("=== GAME OVER ===")
+        log.info("Jogador ID: %s", getattr(self, 'active_player_id', 'Nenhum'))
+        log.info("Score: %s", self.score)
         
         try:
             # Marca que o jogo acabou para evitar processamento duplicado
@@ -1107,26 +1330,25 @@ class Game:
             if hasattr(self, 'active_player_id') and self.active_player_id:
                 try:
                     if hasattr(self, 'db') and hasattr(self.db, 'add_score'):
-                        print("Salvando pontuação...")
-                        print(f"Dados: player_id={self.active_player_id}, score={self.score}, level={self.level}, game_time={game_time_sec}")
+                        log.info("Salvando pontuação...")
+                        log.info("Dados: player_id=%s, score=%s, level=%s, game_time=%s", self.active_player_id, self.score, self.level, game_time_sec)
                         
                         # Salva a pontuação no banco de dados
-                        score_id = self.db.add_score(
-                            player_id=self.active_player_id,
-                            score=self.score,
-                            level=self.level,
-                            game_time=game_time_sec
-                        )
+                        with TRACER.span('db.add_score', 'db'):
+                            score_id = self.db.add_score(
+                                player_id=self.active_player_id,
+                                score=self.score,
+                                level=self.level,
+                                game_time=game_time_sec
+                            )
                         if score_id:
-                            print(f"Pontuação salva com sucesso! ID: {score_id}")
+                            log.info("Pontuação salva com sucesso! ID: %s", score_id)
                         else:
-                            print("Falha ao salvar pontuação no banco de dados")
+                            log.error("Falha ao salvar pontuação no banco de dados")
                 except Exception as e:
-                    print(f"Erro ao salvar pontuação: {e}")
-                    import traceback
-                    traceback.print_exc()
+                    log.exception("Erro ao salvar pontuação: %s", e)
             else:
-                print("Nenhum jogador ativo, pontuação não salva")
+                log.warning("Nenhum jogador ativo, pontuação não salva")
             
             # Formata o tempo para exibição (MM:SS)
             minutes = int(game_time_sec // 60)
@@ -1144,6 +1366,31 @@ class Game:
                 'time_played': f"{minutes:02d}:{seconds:02d}"
             }
             
+            # Latência tecla -> tela da partida (None com a sonda desligada)
+            input_latency = self.input_latency.summary()
+            if input_latency:
+                log.info("Latência de entrada: %s", input_latency)
+            
+            # Grava os contadores da sessão junto com as estatísticas
+            self.telemetry.flush(player_id=getattr(self, 'active_player_id', None),
+                                 game_time_sec=game_time_sec, input_latency=input_latency, **stats)
+            
+            # Com o tracing ligado, salva os spans da partida (Chrome trace-event)
+            if TRACER.enabled:
+                trace_path = TRACER.write()
+                if trace_path:
+                    log.info("Trace da partida salvo em %s", trace_path)
+                TRACER.clear()
+            
+            self._memory_checkpoint('game_over', level=self.level, score=self.score)
+            
+            # A tela de game over espera o jogador; não é um frame lento
+            self.flight_recorder.cancel_frame()
+            
+            # O próximo jogo começa no nível 1 (jogar de novo não passa por
+            # cleanup_game): descarta os fundos da partida e carrega o do nível 1
+            self.backgrounds.restart(1)
+            
             # Muda o estado para GAME_OVER
             self.state = "GAME_OVER"
             
@@ -1151,21 +1398,60 @@ class Game:
             self.show_game_over_screen(stats)
             
         except Exception as e:
-            print(f"Erro em game_over: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception("Erro em game_over: %s", e)
             # Em caso de erro, tenta voltar para o menu de qualquer forma
             self.state = "MENU"
 
+    def _prewarm_pools(self):
+        """
+        Cria antes do nível começar os objetos que ele vai precisar.
+        
+        Os tamanhos vêm de settings.POOL_PREWARM; os protótipos dos itens
+        também são carregados aqui para que nenhum spawn leia do disco.
+        """
+        self.projectile_pool.prewarm(settings.POOL_PREWARM.get('projectile', 0))
+        self.indicator_pool.prewarm(settings.POOL_PREWARM.get('damage_indicator', 0))
+        self.item_spawner.prewarm()
+        
+        for pool in (self.projectile_pool, self.indicator_pool, self.items):
+            pool.reset_stats()
+    
+    def _apply_collision_profile(self):
+        """
+        Aplica o perfil de colisão do nível atual (ou o do dispositivo).
+        
+        O perfil troca o formato declarado de cada entidade por outro, por
+        exemplo máscara por retângulo em máquinas mais fracas.
+        """
+        profile = settings.COLLISION_PROFILES.get(self.difficulty.collision_profile, {})
+        self.items.apply_collision_profile(profile)
+        self.player_shape = shape_id(Alchemist.hitbox, profile)
+        self.projectile_shape = shape_id(Projectile.hitbox, profile)
+    
+    def _report_pools(self):
+        """Registra o uso máximo de cada pool no nível (log de debug)."""
+        if not log.isEnabledFor(logging.DEBUG):
+            return
+        for pool in (self.projectile_pool, self.indicator_pool, self.items):
+            stats = pool.stats()
+            log.debug("[POOL] nível %s: %s máximo=%s criados=%s",
+                      self.level, stats['name'], stats['high_water'], stats['created'])
+    
+    def _clear_projectiles(self):
+        """Remove todos os projéteis, devolvendo-os ao pool."""
+        for projectile in self.projectiles.sprites():
+            projectile.kill()
+    
     def change_state(self, new_state):
         self.state = new_state
 
     def cleanup_game(self):
         """Limpa o estado do jogo ao retornar para o menu."""
         # Limpa todos os sprites e grupos
+        self._clear_projectiles()
         self.all_sprites.empty()
-        self.projectiles.empty()
         self.items.empty()
+        self.explosions.clear()
         
         # Reseta o jogador
         self.player = None
@@ -1176,8 +1462,30 @@ class Game:
         self.is_game_over = False
         self.level_complete = False
         
+        # Descarta timers pendentes (próximo nível, mensagens, banners)
+        self.timers.reset()
+        
+        # O próximo jogo começa no nível 1: descarta os fundos da partida (no
+        # máximo dois níveis na memória) e já deixa o do nível 1 carregando
+        self.backgrounds.restart(1)
+        self.show_level_up = False
+        self.show_level_complete = False
+        self.message = None
+        
         # Para a música do jogo e volta para a música do menu
         self._play_background_music('menu')
+        
+        self._memory_checkpoint('cleanup_game')
+
+    def _memory_checkpoint(self, label, **info):
+        """
+        Registra um ponto do censo de memória (se settings.MEMORY_CENSUS estiver ligado).
+
+        O censo leva algumas centenas de ms; o frame em que ele roda não
+        conta como frame lento no gravador de voo.
+        """
+        if self.memory.checkpoint(label, **info) is not None:
+            self.flight_recorder.cancel_frame()
 
     def quit(self):
         """Encerra o jogo de forma limpa."""
@@ -3,6 +3,9 @@ import pygame as pg
 import os
 import random
 from .base_item import Item
+from src.utils.log import get_logger
+
+log = get_logger(__name__)
 
 
 class Bomb(Item):
@@ -18,7 +21,6 @@ class Bomb(Item):
         Args:
             game: Referência ao jogo principal (opcional)
         """
-        print("\n--- Iniciando Bomb.__init__ ---")
         
         # Tenta carregar a imagem da bomba
         try:
@@ -44,26 +46,26 @@ class Bomb(Item):
                     try:
                         image_path = os.path.join(base_path, bomb_file)
                         abs_path = os.path.abspath(image_path)
-                        print(f"Tentando carregar: {abs_path}")
+                        log.debug("Tentando carregar: %s", abs_path)
                         
                         if os.path.exists(abs_path):
-                            print(f"Arquivo encontrado em: {abs_path}")
+                            log.debug("Arquivo encontrado em: %s", abs_path)
                             original_image = pg.image.load(abs_path).convert_alpha()
                             self.image = pg.transform.scale(original_image, (40, 40))
-                            print("Imagem da bomba carregada com sucesso!")
+                            log.debug("Imagem da bomba carregada com sucesso!")
                             image_loaded = True
                             break
                         else:
-                            print(f"Arquivo não encontrado em: {abs_path}")
+                            log.debug("Arquivo não encontrado em: %s", abs_path)
                     except Exception as e:
-                        print(f"Erro ao carregar {bomb_file}: {e}")
+                        log.debug("Erro ao carregar %s: %s", bomb_file, e)
             
             if not image_loaded:
                 raise FileNotFoundError("Nenhuma imagem de bomba encontrada")
                 
         except Exception as e:
-            print(f"Erro ao carregar imagem da bomba: {e}")
-            print("Usando placeholder...")
+            log.warning("Erro ao carregar imagem da bomba: %s", e)
+            log.warning("Usando placeholder...")
             # Cria um placeholder se não conseguir carregar a imagem
             self.image = pg.Surface((40, 40), pg.SRCALPHA)
             pg.draw.circle(self.image, (255, 0, 0), (20, 20), 18)  # Círculo vermelho
@@ -79,8 +81,7 @@ class Bomb(Item):
         self.damage = 2  # Dano causado pela bomba
         
         # A posição é definida pelo spawner, não mude aqui
-        print(f"Bomb criado na posição: ({self.rect.x}, {self.rect.y})")
-        print("--- Fim do Bomb.__init__ ---\n")
+        log.debug("Bomb criado na posição: (%s, %s)", self.rect.x, self.rect.y)
     
     def on_collect(self, player):
         """
@@ -93,7 +94,7 @@ class Bomb(Item):
         Returns:
             int: Pontos perdidos (número negativo)
         """
-        print("BOOM! A bomba explodiu!")
+        log.debug("BOOM! A bomba explodiu!")
         
         # Marca como pego e tira da tela
         self.collected = True
@@ -4,6 +4,9 @@ import random
 from .base_item import Item
 from src import settings
 from src.data.potions import POTION_DATA
+from src.utils.log import get_logger
+
+log = get_logger(__name__)
 
 
 class Hazard(Item):
@@ -20,7 +23,6 @@ class Hazard(Item):
             game: Referência para o jogo principal
             potion_file_name: Nome do arquivo da poção (se não informado, pega uma aleatória)
         """
-        print("\n--- Iniciando Hazard.__init__ ---")
 
         # Se não informou uma poção específica, pega uma aleatória das ruins
         if potion_file_name is None:
@@ -49,23 +51,23 @@ class Hazard(Item):
                 try:
                     image_path = os.path.join(base_path, self.potion_file_name)
                     abs_path = os.path.abspath(image_path)
-                    print(f"Tentando carregar poção específica: {abs_path}")
+                    log.debug("Tentando carregar poção específica: %s", abs_path)
 
                     if os.path.exists(abs_path):
-                        print(f"Arquivo encontrado em: {abs_path}")
+                        log.debug("Arquivo encontrado em: %s", abs_path)
                         original_image = pg.image.load(abs_path).convert_alpha()
                         self.image = pg.transform.scale(original_image, (40, 40))
-                        print(f"Imagem do perigo carregada: {self.potion_file_name}")
+                        log.debug("Imagem do perigo carregada: %s", self.potion_file_name)
                         image_loaded = True
                         break
                     else:
-                        print(f"Arquivo não encontrado em: {abs_path}")
+                        log.debug("Arquivo não encontrado em: %s", abs_path)
                 except Exception as e:
-                    print(f"Erro ao carregar {self.potion_file_name}: {e}")
+                    log.debug("Erro ao carregar %s: %s", self.potion_file_name, e)
 
             # Se não achou a poção certa, tenta qualquer uma ruim
             if not image_loaded:
-                print("Tentando carregar qualquer poção ruim disponível...")
+                log.debug("Tentando carregar qualquer poção ruim disponível...")
                 bad_potions_files = [k for k, v in POTION_DATA.items() if v['type'] == 'bad']
 
                 for base_path in base_paths:
@@ -76,27 +78,27 @@ class Hazard(Item):
                         try:
                             image_path = os.path.join(base_path, potion_file)
                             abs_path = os.path.abspath(image_path)
-                            print(f"Tentando carregar: {abs_path}")
+                            log.debug("Tentando carregar: %s", abs_path)
 
                             if os.path.exists(abs_path):
-                                print(f"Arquivo encontrado em: {abs_path}")
+                                log.debug("Arquivo encontrado em: %s", abs_path)
                                 original_image = pg.image.load(abs_path).convert_alpha()
                                 self.image = pg.transform.scale(original_image, (40, 40))
                                 self.potion_file_name = potion_file  # Atualiza o nome
-                                print(f"Imagem do perigo carregada: {potion_file}")
+                                log.debug("Imagem do perigo carregada: %s", potion_file)
                                 image_loaded = True
                                 break
                             else:
-                                print(f"Arquivo não encontrado em: {abs_path}")
+                                log.debug("Arquivo não encontrado em: %s", abs_path)
                         except Exception as e:
-                            print(f"Erro ao carregar {potion_file}: {e}")
+                            log.debug("Erro ao carregar %s: %s", potion_file, e)
 
             if not image_loaded:
                 raise FileNotFoundError("Nenhuma imagem de perigo encontrada")
 
         except Exception as e:
-            print(f"Erro ao carregar imagem do perigo: {e}")
-            print("Usando placeholder...")
+            log.warning("Erro ao carregar imagem do perigo: %s", e)
+            log.warning("Usando placeholder...")
             # Se não achou nenhuma imagem, cria um quadrado vermelho como fallback
             self.image = pg.Surface((40, 40), pg.SRCALPHA)
             pg.draw.line(self.image, (255, 0, 0), (5, 5), (35, 35), 4)  # Linha diagonal 1
@@ -111,8 +113,7 @@ class Hazard(Item):
         self.damage = 1  # Quantidade de dano que este item causa
 
         # NÃO sobrescreva as posições aqui - deixe o base_item.py cuidar disso
-        print(f"Hazard criado: {self.potion_file_name} na posição: ({self.rect.x}, {self.rect.y})")
-        print("--- Fim do Hazard.__init__ ---\n")
+        log.debug("Hazard criado: %s na posição: (%s, %s)", self.potion_file_name, self.rect.x, self.rect.y)
 
     def on_collect(self, player):
         """
@@ -124,7 +125,7 @@ class Hazard(Item):
         Returns:
             int: Pontos perdidos (número negativo)
         """
-        print(f"Perigo coletado: {self.potion_file_name}! O jogador sofreu {self.damage} de dano!")
+        log.debug("Perigo coletado: %s! O jogador sofreu %s de dano!", self.potion_file_name, self.damage)
 
         # Marca como pego e tira da tela
         self.collected = True
@@ -4,6 +4,9 @@ import random
 from .base_item import Item
 from src import settings
 from src.data.potions import POTION_DATA
+from src.utils.log import get_logger
+
+log = get_logger(__name__)
 
 
 class Ingredient(Item):
@@ -20,7 +23,6 @@ class Ingredient(Item):
             game: Referência para o jogo principal (opcional)
             potion_file_name: Nome do arquivo da poção (se não informado, pega uma aleatória)
         """
-        print("\n--- Iniciando Ingredient.__init__ ---")
 
         # Se não informou uma poção específica, pega uma aleatória das boas
         if potion_file_name is None:
@@ -48,23 +50,23 @@ class Ingredient(Item):
                 try:
                     image_path = os.path.join(base_path, self.potion_file_name)
                     abs_path = os.path.abspath(image_path)
-                    print(f"Tentando carregar poção específica: {abs_path}")
+                    log.debug("Tentando carregar poção específica: %s", abs_path)
 
                     if os.path.exists(abs_path):
-                        print(f"Arquivo encontrado em: {abs_path}")
+                        log.debug("Arquivo encontrado em: %s", abs_path)
                         original_image = pg.image.load(abs_path).convert_alpha()
                         self.image = pg.transform.scale(original_image, (40, 40))
-                        print(f"Imagem do ingrediente carregada: {self.potion_file_name}")
+                        log.debug("Imagem do ingrediente carregada: %s", self.potion_file_name)
                         image_loaded = True
                         break
                     else:
-                        print(f"Arquivo não encontrado em: {abs_path}")
+                        log.debug("Arquivo não encontrado em: %s", abs_path)
                 except Exception as e:
-                    print(f"Erro ao carregar {self.potion_file_name}: {e}")
+                    log.debug("Erro ao carregar %s: %s", self.potion_file_name, e)
 
             # Se não achou a poção certa, tenta qualquer uma boa
             if not image_loaded:
-                print("Tentando carregar qualquer poção boa disponível...")
+                log.debug("Tentando carregar qualquer poção boa disponível...")
                 good_potions_files = [k for k, v in POTION_DATA.items() if v['type'] == 'good']
 
                 for base_path in base_paths:
@@ -75,27 +77,27 @@ class Ingredient(Item):
                         try:
                             image_path = os.path.join(base_path, potion_file)
                             abs_path = os.path.abspath(image_path)
-                            print(f"Tentando carregar: {abs_path}")
+                            log.debug("Tentando carregar: %s", abs_path)
 
                             if os.path.exists(abs_path):
-                                print(f"Arquivo encontrado em: {abs_path}")
+                                log.debug("Arquivo encontrado em: %s", abs_path)
                                 original_image = pg.image.load(abs_path).convert_alpha()
                                 self.image = pg.transform.scale(original_image, (40, 40))
                                 self.potion_file_name = potion_file  # Atualiza o nome
-                                print(f"Imagem do ingrediente carregada: {potion_file}")
+                                log.debug("Imagem do ingrediente carregada: %s", potion_file)
                                 image_loaded = True
                                 break
                             else:
-                                print(f"Arquivo não encontrado em: {abs_path}")
+                                log.debug("Arquivo não encontrado em: %s", abs_path)
                         except Exception as e:
-                            print(f"Erro ao carregar {potion_file}: {e}")
+                            log.debug("Erro ao carregar %s: %s", potion_file, e)
 
             if not image_loaded:
                 raise FileNotFoundError("Nenhuma imagem de ingrediente encontrada")
 
         except Exception as e:
-            print(f"Erro ao carregar imagem do ingrediente: {e}")
-            print("Usando placeholder...")
+            log.warning("Erro ao carregar imagem do ingrediente: %s", e)
+            log.warning("Usando placeholder...")
             # Se não achou nenhuma imagem, cria um círculo verde como fallback
             self.image = pg.Surface((40, 40), pg.SRCALPHA)
             pg.draw.circle(self.image, (0, 255, 0), (20, 20), 18)  # Círculo verde
@@ -112,8 +114,7 @@ class Ingredient(Item):
         self.effect = "restores health"
 
         # NÃO sobrescreva as posições aqui - deixe o base_item.py cuidar disso
-        print(f"Ingredient criado: {self.potion_file_name} na posição: ({self.rect.x}, {self.rect.y})")
-        print("--- Fim do Ingredient.__init__ ---\n")
+        log.debug("Ingredient criado: %s na posição: (%s, %s)", self.potion_file_name, self.rect.x, self.rect.y)
 
     def on_collect(self, player):
         """
@@ -125,7 +126,7 @@ class Ingredient(Item):
         Returns:
             int: Pontos ganhos (número positivo)
         """
-        print(f"Ingrediente coletado: {self.potion_file_name}! Jogador ganhou pontos!")
+        log.debug("Ingrediente coletado: %s! Jogador ganhou pontos!", self.potion_file_name)
 
         # Marca como pego e tira da tela
         self.collected = True
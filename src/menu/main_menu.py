@@ -2,7 +2,6 @@ import pygame as pg
 import sys
 import os
 import src.settings as settings
-from src.menu.profile_screen import ProfileScreen
 
 
 class MainMenu:
@@ -145,6 +144,7 @@ class MainMenu:
                     if self.options[self.selected_option] == "Novo Jogo":
                         if not self.game.active_player_id:
                             # Se não houver jogador ativo, mostra a tela de seleção de perfil
+                            from src.menu.profile_screen import ProfileScreen
                             profile_screen = ProfileScreen(self.game)
                             if not profile_screen.run():
                                 # Usuário cancelou a seleção de perfil, não faz nada
@@ -152,6 +152,7 @@ class MainMenu:
                             # Se chegou aqui, um perfil foi selecionado, então continua para o jogo
                         self.next_state = "GAME"
                     elif self.options[self.selected_option] == "Trocar Jogador":
+                        from src.menu.profile_screen import ProfileScreen
                         profile_screen = ProfileScreen(self.game)
                         profile_screen.run()  # Não precisa verificar o retorno, apenas atualiza o jogador
                     elif self.options[self.selected_option] == "Ranking":
@@ -1,5 +1,8 @@
 import pygame as pg
 from src.data.db import db
+from src.utils.log import get_logger
+
+log = get_logger(__name__)
 
 class ProfileScreen:
     def __init__(self, game):
@@ -71,9 +74,9 @@ class ProfileScreen:
         """Carrega os perfis salvos do banco de dados."""
         try:
             self.profiles = db.get_players()
-            print(f"Perfis carregados: {self.profiles}")
+            log.debug("Perfis carregados: %s", self.profiles)
         except Exception as e:
-            print(f"Erro ao carregar perfis: {e}")
+            log.error("Erro ao carregar perfis: %s", e)
             self.profiles = []
 
     def run(self):
@@ -184,10 +187,10 @@ class ProfileScreen:
                 self.game.active_player_name = name
                 self.load_profiles()
                 return True
-            print(f"Erro: Já existe um jogador com o nome '{name}'")
+            log.warning("Erro: Já existe um jogador com o nome '%s'", name)
             return False
         except Exception as e:
-            print(f"Erro ao criar perfil: {e}")
+            log.error("Erro ao criar perfil: %s", e)
             return False
             
     def _draw(self):
@@ -3,6 +3,7 @@
 import pygame as pg
 import os
 import src.settings as settings
+from src.utils.startup import STARTUP
 
 class SplashScreen:
     def __init__(self, game):
@@ -107,3 +108,4 @@ class SplashScreen:
             self.screen.blit(text_surface, text_rect)
         
         pg.display.flip()
+        STARTUP.finish()  # Primeiro frame na tela (só faz algo com --startup-report)
@@ -5,6 +5,9 @@ import os
 import pygame as pg
 from src import settings
 from src.projectile import Projectile
+from src.utils.log import get_logger
+
+log = get_logger(__name__)
 
 
 class Alchemist(pg.sprite.Sprite):
@@ -15,12 +18,16 @@ class Alchemist(pg.sprite.Sprite):
         idle_frames (list): Lista de superfícies para a animação de parado.
         running_frames (list): Lista de superfícies para a animação de corrida.
         image (pygame.Surface): Imagem atual do personagem.
+        mask (pygame.mask.Mask): Máscara da imagem atual (pré-calculada).
         rect (pygame.Rect): Retângulo que define a posição e tamanho do personagem.
         speed (int): Velocidade de movimento do personagem.
         lives (int): Número de vidas restantes.
         is_invulnerable (bool): Indica se o jogador está em estado de invencibilidade.
-        invulnerable_until (int): Timestamp até quando o jogador está invencível.
+        invulnerable_until (int): Tempo da simulação (ms) até quando o jogador está invencível.
     """
+
+    # Formato da área de colisão ('mask', 'rect', 'circle' ou 'circle_mask')
+    hitbox = 'mask'
     
     def __init__(self, game, initial_pos):
         """
@@ -39,6 +46,7 @@ class Alchemist(pg.sprite.Sprite):
         self.lives = settings.PLAYER_START_LIVES
         self.is_invulnerable = False
         self.invulnerable_until = 0
+        self._invulnerability_timer = None
         
         # Configurações de animação
         self.idle_frames = []
@@ -61,7 +69,7 @@ class Alchemist(pg.sprite.Sprite):
         self.last_shot_time = 0
         
         # Configuração inicial
-        self.image = self.idle_frames[0]
+        self._set_frame(self.idle_frames[0])
         self.rect = self.image.get_rect(center=initial_pos)
         self.speed = settings.PLAYER_SPEED
 
@@ -69,21 +77,18 @@ class Alchemist(pg.sprite.Sprite):
         """
         Aplica dano ao jogador se não estiver invulnerável
         """
-        current_time = pg.time.get_ticks()
-        
-        # Verifica se está invulnerável
-        if self.is_invulnerable and current_time < self.invulnerable_until:
-            print("Jogador invulnerável - dano ignorado!")  # Debug
+        # Verifica se está invulnerável (o timer de invencibilidade desliga a flag)
+        if self.is_invulnerable:
+            log.debug("Jogador invulnerável - dano ignorado!")  # Debug
             return False  # Não causou dano
         
         # Aplica o dano
         self.lives -= amount
-        print(f"Dano aplicado! Vidas restantes: {self.lives}")  # Debug
+        log.debug("Dano aplicado! Vidas restantes: %s", self.lives)  # Debug
         
         # Ativa invulnerabilidade
-        self.is_invulnerable = True
-        self.invulnerable_until = current_time + settings.PLAYER_INVULNERABILITY_DURATION
-        print(f"Invulnerabilidade ativada até: {self.invulnerable_until}")  # Debug
+        self._activate_invulnerability()
+        log.debug("Invulnerabilidade ativada até: %s", self.invulnerable_until)  # Debug
         
         # Garante que o jogador não fique com vidas negativas
         if self.lives < 0:
@@ -96,19 +101,25 @@ class Alchemist(pg.sprite.Sprite):
         return True  # Causou dano
     
     def _activate_invulnerability(self):
-        """Ativa o estado de invencibilidade temporária."""
+        """Ativa o estado de invencibilidade temporária (encerrado por um timer)."""
+        timers = self.game.timers
+        if self._invulnerability_timer is not None:
+            self._invulnerability_timer.cancel()
         self.is_invulnerable = True
-        self.invulnerable_until = pg.time.get_ticks() + settings.PLAYER_INVULNERABILITY_DURATION
+        self.invulnerable_until = timers.now_ms + settings.PLAYER_INVULNERABILITY_DURATION
+        self._invulnerability_timer = timers.call_later(
+            settings.PLAYER_INVULNERABILITY_DURATION, self._end_invulnerability)
     
-    def _update_invulnerability(self):
-        """Atualiza o estado de invencibilidade."""
-        if self.is_invulnerable and pg.time.get_ticks() > self.invulnerable_until:
-            self.is_invulnerable = False
+    def _end_invulnerability(self):
+        """Callback de timer: encerra a invencibilidade."""
+        self.is_invulnerable = False
+        self._invulnerability_timer = None
+        log.debug("Invulnerabilidade expirou!")  # Debug
     
     def die(self):
         """Lida com a morte do jogador."""
         # Aqui você pode adicionar lógica de game over
-        print("Jogador morreu!")
+        log.info("Jogador morreu!")
         # Exemplo: self.game.game_over()
     
     def shoot(self):
@@ -137,13 +148,6 @@ class Alchemist(pg.sprite.Sprite):
         """
         # ... código existente do movimento ...
         
-        # 🛡️ VERIFICA SE A INVULNERABILIDADE EXPIROU
-        if hasattr(self, 'invulnerable_until'):
-            current_time = pg.time.get_ticks()
-            if self.invulnerable_until <= current_time:
-                self.is_invulnerable = False
-                print("Invulnerabilidade expirou!")  # Debug
-        
         # ... resto do código ...
 
     def _handle_movement(self, keys):
@@ -195,12 +199,8 @@ class Alchemist(pg.sprite.Sprite):
                 frames = self.idle_frames
                 frame_index = self.idle_frame_index = (self.idle_frame_index + 1) % len(frames)
             
-            # Atualiza a imagem atual
-            self.image = frames[frame_index]
-            
-            # Inverte a imagem se estiver virado para a esquerda
-            if self.direction == 'left':
-                self.image = pg.transform.flip(self.image, True, False)
+            # Atualiza a imagem atual (espelhada se estiver virado para a esquerda)
+            self._set_frame(frames[frame_index])
     
     def _load_animations(self):
         """Carrega e prepara as animações do personagem."""
@@ -227,6 +227,36 @@ class Alchemist(pg.sprite.Sprite):
             scaled_height = int(player_width * aspect_ratio)
             self.running_frames.append(pg.transform.scale(img, (player_width, scaled_height)))
 
+        # Versões espelhadas, máscaras e caixas opacas são calculadas uma única
+        # vez aqui em vez de a cada troca de frame
+        self._flipped = {}
+        self._frame_masks = {}
+        self._frame_boxes = {}
+        for frame in self.idle_frames + self.running_frames:
+            flipped = pg.transform.flip(frame, True, False)
+            self._flipped[frame] = flipped
+            for surface in (frame, flipped):
+                mask = pg.mask.from_surface(surface)
+                self._frame_masks[surface] = mask
+                rects = mask.get_bounding_rects()
+                self._frame_boxes[surface] = rects[0].unionall(rects[1:]) if rects else surface.get_rect()
+
+    def _set_frame(self, frame):
+        """Troca a imagem atual (espelhada se necessário) e sua máscara."""
+        if getattr(self, 'direction', 'right') == 'left':
+            frame = self._flipped[frame]
+        self.image = frame
+        self.mask = self._frame_masks[frame]
+
+    def hitbox_rect(self):
+        """Retorna o retângulo da parte opaca do frame atual, em coordenadas da tela."""
+        return self._frame_boxes[self.image].move(self.rect.topleft)
+
+    def hitbox_circle(self):
+        """Retorna (cx, cy, raio) do círculo inscrito na parte opaca do frame atual."""
+        box = self.hitbox_rect()
+        return box.centerx, box.centery, min(box.width, box.height) / 2
+
     def update(self, keys):
         # a função de update principal, chama os métodos de ajuda para organização
         self._handle_input(keys)
@@ -269,7 +299,7 @@ class Alchemist(pg.sprite.Sprite):
             if hasattr(self.game, 'shoot_sound') and self.game.shoot_sound:
                 self.game.shoot_sound.play()
 
-            projectile = Projectile(self.rect.center, self.shoot_direction)
+            projectile = self.game.projectile_pool.acquire(self.rect.center, self.shoot_direction)
             self.game.all_sprites.add(projectile)
             self.game.projectiles.add(projectile)
 
@@ -285,11 +315,8 @@ class Alchemist(pg.sprite.Sprite):
                 self.idle_frame_index = (self.idle_frame_index + 1) % len(self.idle_frames)
                 new_image = self.idle_frames[self.idle_frame_index]
 
-            # espelha a imagem baseado na direção
-            if self.direction == 'left':
-                self.image = pg.transform.flip(new_image, True, False)
-            else:
-                self.image = new_image
+            # espelha a imagem baseado na direção (frames já espelhados no carregamento)
+            self._set_frame(new_image)
 
     def _check_boundaries(self):
         # mantém o jogador dentro dos limites da tela/arena
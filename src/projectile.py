@@ -5,22 +5,51 @@ import os
 
 class Projectile(pg.sprite.Sprite):
     # a classe que define um projétil direcional
-    def __init__(self, pos, direction_vector):
+
+    # imagens compartilhadas por todos os projéteis (carregadas uma única vez)
+    _images = None
+
+    # formato da área de colisão ('rect' usa a caixa opaca e 'circle' o raio
+    # inscrito nela no teste contínuo; passa pelo perfil de colisão do nível)
+    hitbox = 'rect'
+
+    def __init__(self, pos=(0, 0), direction_vector=(1, 0)):
         super().__init__()
 
+        # pool de onde o projétil veio (definido pelo ObjectPool)
+        self.pool = None
+
         # carrega e redimensiona as imagens uma única vez
         self._load_images()
 
-        # atributos de movimento
-        self.pos = pg.math.Vector2(pos)
-        self.direction = pg.math.Vector2(direction_vector).normalize()
+        self.pos = pg.math.Vector2()
+        self.prev_pos = pg.math.Vector2()  # posição no frame anterior (colisão contínua)
+        self.direction = pg.math.Vector2(1, 0)
         self.speed = 25
+        self.reset(pos, direction_vector)
+
+    def reset(self, pos, direction_vector):
+        # reinicializa o projétil no lugar (usado pelo pool de projéteis)
+        self.pos.update(pos)
+        self.prev_pos.update(pos)
+        self.direction.update(direction_vector)
+        self.direction.normalize_ip()
 
         # escolhe a imagem e o rect corretos para a direção inicial
         self._set_image_and_rect()
 
+    def kill(self):
+        # remove o projétil dos grupos e o devolve ao pool, se tiver um
+        super().kill()
+        if self.pool is not None:
+            self.pool.release(self)
+
     def _load_images(self):
         # carrega e guarda todas as imagens de projétil necessárias
+        if Projectile._images is not None:
+            self.images = Projectile._images
+            return
+
         base_path = os.path.join('assets', 'images', 'projectiles')
         projectile_width = 60
 
@@ -49,6 +78,7 @@ class Projectile(pg.sprite.Sprite):
             'down_right': pg.transform.rotate(img_up_right, -90),
             'down_left': pg.transform.rotate(pg.transform.flip(img_up_right, True, False), 90)
         }
+        Projectile._images = self.images
 
     def _set_image_and_rect(self):
         # escolhe a imagem correta baseado no vetor de direção
@@ -74,9 +104,14 @@ class Projectile(pg.sprite.Sprite):
         # cria o rect com a imagem correta
         self.rect = self.image.get_rect(center=self.pos)
 
+        # meia-extensão da parte visível, usada no teste de colisão contínua
+        opaque = self.image.get_bounding_rect()
+        self.half_size = (opaque.width / 2, opaque.height / 2)
+
     def update(self, *args, **kwargs):
 
         # move o projétil baseado no vetor de direção
+        self.prev_pos.update(self.pos)
         self.pos += self.direction * self.speed
         self.rect.center = self.pos
 
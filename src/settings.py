@@ -35,10 +35,24 @@ PLAYER_START_LIVES = 3                  # Vidas iniciais do jogador
 PLAYER_INVULNERABILITY_DURATION = 2000  # ms de invencibilidade após levar dano
 
 # Configurações de itens
-ITEM_SPAWN_INTERVAL = 80         # ms entre spawns de itens (itens aparecem rápido)
+SIM_STEP_MS = 1000 / FPS         # Tempo de simulação que cada frame avança (ms)
+SPAWN_WAVE_INTERVAL = 2000       # ms (simulação) entre ondas de spawn no nível 1
+SPAWN_WAVE_INTERVAL_STEP = 50    # Redução do intervalo entre ondas a cada nível
+SPAWN_WAVE_INTERVAL_MIN = 1000   # Intervalo mínimo entre ondas
+SPAWN_FIRST_WAVE_DELAY = 500     # ms do início do nível até a primeira onda
 ITEM_SPEED_MIN = 3               # Velocidade mínima dos itens
 ITEM_SPEED_MAX = 7               # Velocidade máxima dos itens
 MAX_ITEMS_ON_SCREEN = 100        # Limite de itens na tela ao mesmo tempo
+LEVEL_SPEED_INCREASE = 0.1       # Aumento da velocidade dos itens por nível (multiplicador)
+LEVEL_SPEED_SCALE_MAX = 2.0      # Multiplicador máximo de velocidade dos itens
+ITEM_ENGINE_CAPACITY = 16384     # Slots pré-alocados no motor de itens (níveis de estresse)
+SPATIAL_CELL_SIZE = 64           # Tamanho da célula do índice espacial de colisões (px)
+
+# Quantidade de objetos criados antes de cada nível (pools de objetos)
+POOL_PREWARM = {
+    'projectile': 16,        # Projéteis na tela ao mesmo tempo
+    'damage_indicator': 8    # Indicadores de dano flutuantes
+}
 
 # Pesos para spawn de itens (chance relativa)
 ITEM_SPAWN_WEIGHTS = {
@@ -46,9 +60,51 @@ ITEM_SPAWN_WEIGHTS = {
     'hazard': 3,       # Perigos têm probabilidade menor
     'bomb': 2          # Bombas são raras
 }
+ITEM_SPAWN_WEIGHTS_BY_LEVEL = {}  # Pesos específicos de um nível, ex: {10: {'ingredient': 20, 'hazard': 6, 'bomb': 4}}
+SPAWN_WAVE_SIZE = (2, 4)          # Itens por onda de spawn (mínimo, máximo)
+SPAWN_RECIPE_BIAS = 0.35          # Chance de um ingrediente ser a próxima poção da receita
+
+# Receitas de cada nível: quantidade, tamanho e se a ordem importa
+# ex: {8: {'count': 2, 'ordered': False}}; níveis ausentes usam 1 receita ordenada
+RECIPE_RULES_BY_LEVEL = {}
+RECIPE_MISTAKE_MODE = 'keep'  # 'keep' mantém o progresso ao errar; 'restart' segue o link de falha
+
+# Pacote de níveis (assets/levels/<nome>.json); None usa níveis sorteados.
+# Níveis que não estão no pacote também são sorteados.
+LEVEL_PACK = None
+
+# Fundos dos níveis (relativos a assets/images), usados em ciclo: nível 1 usa o primeiro.
+# O fundo do próximo nível é pré-carregado numa thread durante o nível atual.
+LEVEL_BACKGROUNDS = [os.path.join('background', '4', f'{n}.png') for n in (1, 2, 3, 4, 6)]
+
+# Padrões de movimento dos itens (src/utils/movement.py): parâmetros (p0, p1) de cada padrão
+MOVEMENT_PATTERN_PARAMS = {
+    'linear': (0.0, 0.0),
+    'sine': (30.0, 0.08),     # Amplitude em pixels, frequência em rad/tick
+    'gravity': (0.03, 0.0),   # Aceleração de queda por tick (escalada pela velocidade do nível)
+    'homing': (0.05, 1.5),    # Aceleração e velocidade vertical máxima ao perseguir o jogador
+}
+# Regras (a partir do nível, tipo de item, pesos dos padrões); a última regra de cada tipo vale
+MOVEMENT_PATTERN_RULES = (
+    (6, 'ingredient', {'linear': 3, 'sine': 1}),
+    (10, 'hazard', {'linear': 3, 'gravity': 1}),
+    (15, 'hazard', {'linear': 2, 'gravity': 1, 'homing': 1}),
+)
+
+# Perfis de colisão por dispositivo: trocam o formato declarado de cada entidade
+# ('mask', 'rect', 'circle' ou 'circle_mask') por outro mais barato ou mais preciso
+COLLISION_PROFILES = {
+    'default': {},
+    'low_end': {'mask': 'rect', 'circle_mask': 'circle'},
+    'precise': {'circle': 'circle_mask', 'rect': 'mask'}
+}
+COLLISION_PROFILE = 'default'
+COLLISION_PROFILE_BY_LEVEL = {}  # Perfil específico de um nível, ex: {8: 'low_end'}
 
 # Configurações de bombas
 BOMB_EXPLOSION_RADIUS = 150  # Raio de efeito da explosão em pixels
+EXPLOSION_WORK_BUDGET = 64   # Itens atingidos por tick antes de adiar o resto da cadeia
+EXPLOSION_EFFECT_MS = 300    # Duração do efeito visual da explosão
 
 # Configurações de pontuação
 SCORE_INGREDIENT = 10  # Pontos ao pegar ingrediente
@@ -75,3 +131,41 @@ LIGHT_GRAY = (200, 200, 200)      # Cinza claro para detalhes
 MAX_PARTICLES = 100  # Limite de partículas na tela
 DEBUG = True         # Ativa informações de depuração (FPS, logs)
 LOG_LEVEL = 'DEBUG'  # Nível de log: DEBUG, INFO, WARNING, ERROR, CRITICAL
+LOG_FILE = None             # Arquivo de log extra (None = só terminal)
+LOG_BUFFER_SIZE = 4096      # Registros guardados em memória até a próxima escrita
+LOG_FLUSH_INTERVAL = 0.25   # Segundos entre escritas da thread de log
+PERF_OVERLAY = False        # Overlay de desempenho visível ao iniciar (F3 liga/desliga)
+PERF_HISTORY = 120          # Frames guardados no histórico de tempos (largura do gráfico)
+PERF_TEXT_REFRESH = 15      # Frames entre atualizações do texto do overlay
+PERF_COUNT_ALLOCATIONS = False  # Sempre conta Surfaces e textos por frame (sem isso, só com overlay/telemetria/benchmark)
+TELEMETRY_ENABLED = False   # Grava os contadores de cada partida no game over (main.py --telemetry liga)
+TELEMETRY_FILE = 'telemetry.jsonl'  # Arquivo (dentro de SAVE_DIR) com uma linha por partida
+TRACE_ENABLED = False       # Grava spans (fases do loop, spawns, níveis, DB, música); main.py --trace liga
+TRACE_BUFFER_SIZE = 200000  # Spans guardados em memória (os mais antigos são descartados)
+FLIGHT_RECORDER_ENABLED = False      # Salva os últimos frames quando um frame demora demais (main.py --flight-recorder liga)
+FLIGHT_RECORDER_FRAMES = 120         # Frames guardados no buffer (até PERF_HISTORY)
+FLIGHT_RECORDER_THRESHOLD_MS = 50    # Duração (sem a espera do clock) que conta como frame lento
+FLIGHT_RECORDER_MIN_INTERVAL = 30    # Segundos mínimos entre dois registros em SAVE_DIR
+FLIGHT_RECORDER_MAX_DUMPS = 20       # Máximo de registros por execução do jogo
+PROFILER_INTERVAL_MS = 5    # Intervalo entre amostras do profiler (F9 ou main.py --profile)
+# Orçamento de alocações por fase (benchmark.py --alloc): blocos alocados em src/
+# que continuam vivos no fim da fase, em média por frame; acima disso o benchmark falha
+ALLOC_BUDGETS = {
+    'events': 2,
+    'update.spawning': 4,
+    'update.cleanup': 8,
+    'update.collision': 48,
+    'update.other': 6,
+    'draw.background': 2,
+    'draw.sprites': 6,
+    'draw.effects': 2,
+    'draw.hud': 8,
+    'overlay': 2,
+    'flip': 2,
+}
+ALLOC_WARMUP_FRAMES = 120   # Frames ignorados no início do benchmark (caches, pools)
+MEMORY_CENSUS = False       # Snapshots de memória e censo de Surfaces a cada nível/fim de partida
+MEMORY_CENSUS_FILE = 'memory.jsonl'  # Arquivo (dentro de SAVE_DIR) com uma linha por ponto do censo
+MEMORY_CENSUS_TOP = 10      # Arquivos mostrados na diferença do tracemalloc
+INPUT_LATENCY = False       # Mede ms e frames entre uma tecla e a reação na tela (main.py --latency)
+INPUT_LATENCY_MAX_FRAMES = 30  # Frames esperando a reação antes de contar a entrada como 'sem reação'
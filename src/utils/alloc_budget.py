@@ -0,0 +1,149 @@
+"""
+Orçamento de alocações por fase do frame (modo de instrumentação).
+
+Usa tracemalloc, filtrado para o código em src/, ligado ao FrameTimer: a
+cada marca de fase o tracker tira um snapshot só com os blocos alocados
+desde a marca anterior (tracemalloc.clear_traces() a cada marca) e anota:
+- blocos e bytes alocados na fase que ainda estavam vivos no fim dela,
+  agrupados pela linha de src/ mais interna da pilha (ex: o pg.Rect novo
+  em Projectile.update);
+- o pico de bytes da fase, que também pega alocações temporárias que
+  morreram antes da marca (ex: Surfaces SRCALPHA criadas e descartadas
+  no HUD.draw).
+
+Com settings.ALLOC_BUDGETS ({fase: blocos por frame}) o benchmark falha se
+a média de alguma fase passar do orçamento. É caro (um snapshot por fase),
+então só liga no benchmark (benchmark.py --alloc); o tempo do tracker não
+entra nos tempos das fases.
+"""
+import os
+import threading
+import tracemalloc
+from src import settings
+
+# Pasta do código do jogo (só alocações feitas a partir daqui contam)
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Alocações cuja pilha começa aqui vêm de outras threads (log, vigia, prefetch)
+THREAD_ROOT = threading.__file__
+
+
+class AllocationTracker:
+    """Alocações por fase e por linha, com orçamento por fase."""
+
+    def __init__(self, timer, budgets=None, warmup=None, frames=16):
+        """
+        Args:
+            timer: FrameTimer do jogo (o tracker ouve as marcas dele)
+            budgets: {fase: blocos por frame} (padrão: settings.ALLOC_BUDGETS)
+            warmup: Frames ignorados no início (padrão: settings.ALLOC_WARMUP_FRAMES)
+            frames: Profundidade da pilha guardada por alocação
+        """
+        self.timer = timer
+        self.budgets = dict(settings.ALLOC_BUDGETS if budgets is None else budgets)
+        self.warmup = settings.ALLOC_WARMUP_FRAMES if warmup is None else warmup
+        self.depth = frames
+        self.frames = 0                                     # Frames medidos (depois do aquecimento)
+        self.blocks = {phase: 0 for phase in timer.phases}  # Blocos vivos no fim da fase (soma)
+        self.bytes = {phase: 0 for phase in timer.phases}
+        self.peak = {phase: 0 for phase in timer.phases}    # Maior pico de bytes da fase
+        self.lines = {}    # (fase, arquivo, linha) -> [blocos, bytes]
+        self._filters = [tracemalloc.Filter(True, os.path.join(SRC_DIR, '*'), all_frames=True),
+                         tracemalloc.Filter(False, __file__)]  # Alocações do próprio tracker
+        self._counting = False
+
+    def start(self):
+        """Liga o tracemalloc e passa a ouvir o FrameTimer."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.depth)
+        self.timer.listener = self
+
+    def stop(self):
+        """Para de ouvir o FrameTimer e desliga o tracemalloc."""
+        if self.timer.listener is self:
+            self.timer.listener = None
+        tracemalloc.stop()
+
+    # --- Chamados pelo FrameTimer ---
+
+    def begin_frame(self):
+        self._counting = self.timer.frame >= self.warmup
+        tracemalloc.clear_traces()
+
+    def mark(self, phase):
+        if self._counting:
+            _, peak = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot().filter_traces(self._filters)
+            blocks = size = 0
+            lines = self.lines
+            for trace in snapshot.traces:
+                if trace.traceback[0].filename == THREAD_ROOT:
+                    continue  # Outra thread
+                frame = self._src_frame(trace.traceback)
+                key = (phase, frame.filename, frame.lineno)
+                entry = lines.get(key)
+                if entry is None:
+                    entry = lines[key] = [0, 0]
+                entry[0] += 1
+                entry[1] += trace.size
+                blocks += 1
+                size += trace.size
+            self.blocks[phase] += blocks
+            self.bytes[phase] += size
+            if peak > self.peak[phase]:
+                self.peak[phase] = peak
+        # Descarta o que foi alocado até aqui (inclusive pelo próprio tracker)
+        tracemalloc.clear_traces()
+
+    def end_frame(self):
+        if self._counting:
+            self.frames += 1
+
+    @staticmethod
+    def _src_frame(traceback):
+        """Frame mais interno da pilha que está em src/ (a pilha vem do mais antigo ao mais novo)."""
+        for frame in reversed(traceback):
+            if frame.filename.startswith(SRC_DIR):
+                return frame
+        return traceback[-1]
+
+    # --- Resultados ---
+
+    def per_frame(self):
+        """
+        Returns:
+            dict: {fase: (blocos por frame, bytes por frame, pico de bytes)}
+        """
+        frames = max(self.frames, 1)
+        return {phase: (self.blocks[phase] / frames, self.bytes[phase] / frames, self.peak[phase])
+                for phase in self.timer.phases}
+
+    def top_lines(self, phase=None, limit=10):
+        """
+        Linhas que mais alocam por frame.
+
+        Args:
+            phase: Só uma fase (None = todas)
+            limit: Quantas linhas devolver
+
+        Returns:
+            list: (fase, arquivo relativo a src/, linha, blocos por frame, bytes por frame)
+        """
+        frames = max(self.frames, 1)
+        rows = [(p, os.path.relpath(filename, SRC_DIR), lineno, blocks / frames, size / frames)
+                for (p, filename, lineno), (blocks, size) in self.lines.items()
+                if phase is None or p == phase]
+        rows.sort(key=lambda row: -row[3])
+        return rows[:limit]
+
+    def over_budget(self):
+        """
+        Fases cuja média de blocos por frame passou do orçamento.
+
+        Returns:
+            list: (fase, blocos por frame, orçamento)
+        """
+        per_frame = self.per_frame()
+        return [(phase, per_frame[phase][0], budget)
+                for phase, budget in self.budgets.items()
+                if phase in per_frame and per_frame[phase][0] > budget]
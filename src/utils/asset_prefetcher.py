@@ -0,0 +1,149 @@
+"""
+Pré-carregamento dos assets de cada nível (fundos) do jogo Perfect Potion.
+
+As imagens de fundo são grandes (até 3840 px de largura) e decodificar e
+redimensionar uma delas leva dezenas de ms. Quando o nível N começa, o fundo
+do nível N+1 é decodificado e redimensionado numa thread de trabalho; na
+troca de nível ele já está pronto e só falta o convert() (rápido), feito na
+thread principal porque depende da janela.
+
+No máximo dois níveis ficam na memória: o atual e o próximo.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+import pygame as pg
+from src import settings
+from src.utils.log import get_logger
+from src.utils.tracing import traced
+
+log = get_logger(__name__)
+
+
+@traced('prefetch.decode', 'assets')
+def _decode(path, size):
+    """Lê e redimensiona uma imagem (roda na thread de trabalho)."""
+    return pg.transform.scale(pg.image.load(path), size)
+
+
+class LevelAssetPrefetcher:
+    """Carrega o fundo do próximo nível em segundo plano e troca na transição."""
+
+    def __init__(self, size, backgrounds=None, max_resident=2):
+        """
+        Args:
+            size: Tamanho final dos fundos (largura, altura)
+            backgrounds: Caminhos dos fundos, usados em ciclo pelos níveis
+                         (padrão: settings.LEVEL_BACKGROUNDS)
+            max_resident: Quantos níveis podem ficar carregados ao mesmo tempo
+        """
+        self.size = size
+        self.backgrounds = list(backgrounds if backgrounds is not None else settings.LEVEL_BACKGROUNDS)
+        self.max_resident = max_resident
+        self.overrides = {}    # nível -> caminho (ex: definido por um pacote de níveis)
+        self._pending = {}     # nível -> (caminho, Future)
+        self._resident = {}    # nível -> (caminho, Surface ou None)
+        self._executor = None
+        self.stalls = 0        # Trocas que tiveram de esperar ou carregar na hora
+
+    def path_for(self, level):
+        """Caminho do fundo de um nível (None se não houver fundos)."""
+        if level in self.overrides:
+            return self.overrides[level]
+        if not self.backgrounds:
+            return None
+        return os.path.join(settings.ASSETS_DIR, 'images', self.backgrounds[(level - 1) % len(self.backgrounds)])
+
+    def prefetch(self, level):
+        """
+        Agenda a decodificação do fundo de um nível na thread de trabalho.
+
+        Args:
+            level: Número do nível que vai começar em seguida
+        """
+        path = self.path_for(level)
+        if path is None or self._resident.get(level, (None,))[0] == path or level in self._pending:
+            return
+        if not os.path.exists(path):
+            log.warning("[AVISO] Fundo do nível %s não encontrado: %s", level, path)
+            self._resident[level] = (path, None)
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='prefetch')
+        self._pending[level] = (path, self._executor.submit(_decode, path, self.size))
+
+    def acquire(self, level):
+        """
+        Retorna o fundo de um nível, pronto para desenhar.
+
+        Se o pré-carregamento terminou, não há espera; se não foi agendado,
+        a imagem é carregada na hora (conta como stall). Níveis além do atual
+        e do próximo são descartados.
+
+        Returns:
+            pg.Surface ou None se não houver fundo
+        """
+        path = self.path_for(level)
+        if level in self._resident and self._resident[level][0] == path:
+            surface = self._resident[level][1]
+        else:
+            surface = self._finish(level, path)
+            self._resident[level] = (path, surface)
+        self._evict(level)
+        return surface
+
+    def _finish(self, level, path):
+        """Conclui (ou faz na hora) a decodificação e converte para o formato da tela."""
+        pending = self._pending.pop(level, None)
+        if path is None:
+            return None
+        try:
+            if pending is not None and pending[0] == path:
+                if not pending[1].done():
+                    self.stalls += 1
+                image = pending[1].result()
+            else:
+                self.stalls += 1
+                image = _decode(path, self.size)
+            return image.convert()
+        except Exception as e:
+            log.error("[ERRO] Falha ao carregar fundo do nível %s: %s", level, e)
+            return None
+
+    def _evict(self, level):
+        """Mantém só o nível atual e o seguinte (até max_resident níveis)."""
+        keep = set(range(level, level + self.max_resident))
+        for old in [l for l in self._resident if l not in keep]:
+            del self._resident[old]
+        for old in [l for l in self._pending if l not in keep]:
+            self._pending.pop(old)[1].cancel()
+
+    def resident_levels(self):
+        """Níveis com fundo carregado ou em carregamento."""
+        return sorted(set(self._resident) | set(self._pending))
+
+    def restart(self, level=1):
+        """
+        Prepara um jogo novo: descarta os fundos da partida anterior (fica no
+        máximo o nível pedido e o seguinte) e agenda o do nível pedido.
+
+        Chamar de novo não custa nada: o que já está carregado é mantido.
+
+        Args:
+            level: Nível em que o próximo jogo começa
+        """
+        self._evict(level)
+        self.prefetch(level)
+
+    def clear(self):
+        """Descarta tudo (ex: volta ao menu)."""
+        for _, future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        self._resident.clear()
+
+    def shutdown(self):
+        """Encerra a thread de trabalho."""
+        self.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
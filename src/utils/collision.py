@@ -0,0 +1,279 @@
+"""
+Testes de colisão vetorizados (fase estreita) do jogo Perfect Potion.
+
+Todas as funções recebem arrays NumPy paralelos (um elemento por par testado)
+e devolvem os resultados também como arrays, sem laços Python por par.
+"""
+import numpy as np
+
+# Formatos de área de colisão (hitbox) aceitos pelos tipos de entidade
+SHAPE_MASK = 0         # Máscara pixel a pixel (mais preciso e mais caro)
+SHAPE_RECT = 1         # Retângulo da parte opaca
+SHAPE_CIRCLE = 2       # Círculo inscrito na parte opaca
+SHAPE_CIRCLE_MASK = 3  # Círculo como pré-filtro e máscara só se o círculo tocar
+
+SHAPES = {
+    'mask': SHAPE_MASK,
+    'rect': SHAPE_RECT,
+    'circle': SHAPE_CIRCLE,
+    'circle_mask': SHAPE_CIRCLE_MASK,
+}
+
+
+def shape_id(name, profile=None):
+    """
+    Converte o nome de um formato em seu id, aplicando o perfil de colisão.
+
+    Args:
+        name: Formato declarado ('mask', 'rect', 'circle' ou 'circle_mask')
+        profile: Dicionário de substituições {formato declarado: formato usado}
+    """
+    if profile:
+        name = profile.get(name, name)
+    if name not in SHAPES:
+        raise ValueError(f"Formato de colisão desconhecido: {name}")
+    return SHAPES[name]
+
+
+def circle_vs_rect(cx, cy, radius, left, top, right, bottom):
+    """Círculos contra retângulos (arrays paralelos ou escalares)."""
+    dx = np.maximum(np.maximum(left - cx, 0), cx - right)
+    dy = np.maximum(np.maximum(top - cy, 0), cy - bottom)
+    return dx * dx + dy * dy <= radius * radius
+
+
+def circle_vs_circle(ax, ay, ar, bx, by, br):
+    """Círculos contra círculos (arrays paralelos ou escalares)."""
+    dx = ax - bx
+    dy = ay - by
+    reach = ar + br
+    return dx * dx + dy * dy <= reach * reach
+
+
+def narrow_phase(items, slots, rect, circle=None, shape=SHAPE_RECT):
+    """
+    Fase estreita vetorizada entre uma entidade e os itens candidatos.
+
+    O teste grosso usa o círculo de quem for circular ('circle' e
+    'circle_mask') e a caixa opaca nos outros casos. O par só é resolvido
+    aqui se nenhum dos dois lados pede precisão; se a entidade ou o item for
+    'mask' ou 'circle_mask', o par que passou no teste grosso segue para a
+    máscara.
+
+    Args:
+        items: ItemEngine
+        slots: Slots candidatos (vindos do índice espacial)
+        rect: Retângulo da entidade (pg.Rect ou tupla x, y, w, h)
+        circle: (cx, cy, raio) se a entidade usa hitbox circular
+        shape: Formato efetivo da entidade (SHAPE_*)
+
+    Returns:
+        tuple: (slots aceitos, slots que ainda precisam do teste de máscara)
+    """
+    if slots.size == 0:
+        return slots, slots
+
+    sprites = items.sprite_id[slots]
+
+    left = items.x[slots] + items.box_x[sprites]
+    top = items.y[slots] + items.box_y[sprites]
+    right = left + items.box_w[sprites]
+    bottom = top + items.box_h[sprites]
+    item_cx = (left + right) * 0.5
+    item_cy = (top + bottom) * 0.5
+    item_r = items.radius[sprites]
+
+    if circle is None:
+        x, y, w, h = rect
+        rect_hit = (left < x + w) & (right > x) & (top < y + h) & (bottom > y)
+        circle_hit = circle_vs_rect(item_cx, item_cy, item_r, x, y, x + w, y + h)
+    else:
+        cx, cy, r = circle
+        rect_hit = circle_vs_rect(cx, cy, r, left, top, right, bottom)
+        circle_hit = circle_vs_circle(item_cx, item_cy, item_r, cx, cy, r)
+
+    item_shape = items.shape[sprites]
+    round_items = (item_shape == SHAPE_CIRCLE) | (item_shape == SHAPE_CIRCLE_MASK)
+    coarse_hit = np.where(round_items, circle_hit, rect_hit)
+    if shape in (SHAPE_MASK, SHAPE_CIRCLE_MASK):
+        precise = np.ones(slots.size, dtype=bool)
+    else:
+        precise = (item_shape == SHAPE_MASK) | (item_shape == SHAPE_CIRCLE_MASK)
+    return slots[coarse_hit & ~precise], slots[coarse_hit & precise]
+
+
+def segment_vs_aabb(sx, sy, ex, ey, left, top, right, bottom):
+    """
+    Teste de segmento contra retângulo alinhado aos eixos (método dos slabs).
+
+    Args:
+        sx, sy: Início de cada segmento
+        ex, ey: Fim de cada segmento
+        left, top, right, bottom: Bordas de cada retângulo
+
+    Returns:
+        tuple: (hit, t) onde hit indica se o segmento toca o retângulo e t
+        (entre 0 e 1) é a fração do caminho no primeiro contato
+    """
+    dx = ex - sx
+    dy = ey - sy
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        tx1 = (left - sx) / dx
+        tx2 = (right - sx) / dx
+        ty1 = (top - sy) / dy
+        ty2 = (bottom - sy) / dy
+
+    # Eixo sem movimento: ou o ponto já está dentro do slab (sempre) ou nunca entra
+    inside_x = (sx >= left) & (sx <= right)
+    inside_y = (sy >= top) & (sy <= bottom)
+    moving_x = dx != 0
+    moving_y = dy != 0
+    tx_min = np.where(moving_x, np.minimum(tx1, tx2), np.where(inside_x, -np.inf, np.inf))
+    tx_max = np.where(moving_x, np.maximum(tx1, tx2), np.where(inside_x, np.inf, -np.inf))
+    ty_min = np.where(moving_y, np.minimum(ty1, ty2), np.where(inside_y, -np.inf, np.inf))
+    ty_max = np.where(moving_y, np.maximum(ty1, ty2), np.where(inside_y, np.inf, -np.inf))
+
+    t_enter = np.maximum(tx_min, ty_min)
+    t_exit = np.minimum(tx_max, ty_max)
+    hit = (t_enter <= t_exit) & (t_exit >= 0) & (t_enter <= 1)
+    return hit, np.clip(t_enter, 0.0, 1.0)
+
+
+def segment_vs_circle(sx, sy, ex, ey, cx, cy, radius):
+    """
+    Teste de segmento contra círculo.
+
+    Args:
+        sx, sy: Início de cada segmento
+        ex, ey: Fim de cada segmento
+        cx, cy: Centro de cada círculo
+        radius: Raio de cada círculo
+
+    Returns:
+        tuple: (hit, t) com o mesmo significado de segment_vs_aabb
+    """
+    dx = ex - sx
+    dy = ey - sy
+    fx = sx - cx
+    fy = sy - cy
+
+    a = dx * dx + dy * dy
+    b = 2 * (fx * dx + fy * dy)
+    c = fx * fx + fy * fy - radius * radius
+
+    # Segmento que já começa dentro do círculo acerta em t = 0
+    starts_inside = c <= 0
+    disc = b * b - 4 * a * c
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = (-b - np.sqrt(np.maximum(disc, 0))) / (2 * a)
+
+    crosses = (a > 0) & (disc >= 0) & (t >= 0) & (t <= 1)
+    hit = starts_inside | crosses
+    return hit, np.where(starts_inside, 0.0, np.nan_to_num(t, nan=1.0))
+
+
+def resolve_earliest(firsts, seconds, t):
+    """
+    Escolhe o primeiro contato de cada objeto ao longo do caminho.
+
+    Percorre os pares em ordem de t; cada objeto de 'firsts' e de 'seconds'
+    é usado no máximo uma vez (um projétil acerta um único item, e um item
+    não pode ser acertado por dois projéteis no mesmo frame).
+
+    Returns:
+        list: Pares (first, second, t) aceitos, em ordem de contato
+    """
+    order = np.argsort(t, kind='stable')
+    used_first, used_second = set(), set()
+    hits = []
+    for first, second, when in zip(firsts[order].tolist(), seconds[order].tolist(), t[order].tolist()):
+        if first in used_first or second in used_second:
+            continue
+        used_first.add(first)
+        used_second.add(second)
+        hits.append((first, second, when))
+    return hits
+
+
+def sweep_projectiles(projectiles, items, shape=SHAPE_RECT, telemetry=None):
+    """
+    Colisão contínua de todos os projéteis contra os itens neste frame.
+
+    O caminho de cada projétil é testado no referencial do item: como o item
+    também andou (speed_x, dy) neste frame, o segmento relativo vai de
+    (posição anterior + deslocamento do item) até a posição atual. O item é
+    expandido pela meia-extensão do projétil (soma de Minkowski), então o
+    teste vira segmento contra retângulo (ou contra círculo, para itens com
+    hitbox circular), exato sem subdividir o passo.
+
+    O formato do projétil escolhe a extensão usada: 'rect' usa a meia
+    caixa opaca e 'circle' o raio inscrito nela (o item é aumentado pelo
+    raio nos dois eixos e os itens circulares somam os dois raios). O teste
+    contínuo não tem versão com máscara: 'mask' segue como 'rect' e
+    'circle_mask' como 'circle'.
+
+    Args:
+        projectiles: Lista de Projectile (precisam de prev_pos, pos e half_size)
+        items: ItemEngine com os itens já movidos neste frame
+        shape: Formato efetivo dos projéteis (SHAPE_*)
+        telemetry: SessionTelemetry que recebe os pares testados e acertados
+
+    Returns:
+        list: Pares (índice do projétil, slot do item, t) do primeiro contato
+    """
+    if not projectiles or len(items) == 0:
+        return []
+
+    p0 = np.array([p.prev_pos for p in projectiles], dtype=np.float32).reshape(-1, 2)
+    p1 = np.array([p.pos for p in projectiles], dtype=np.float32).reshape(-1, 2)
+    half = np.array([p.half_size for p in projectiles], dtype=np.float32).reshape(-1, 2)
+    proj_r = np.min(half, axis=1)
+    if shape in (SHAPE_CIRCLE, SHAPE_CIRCLE_MASK):
+        half = np.repeat(proj_r[:, None], 2, axis=1)
+
+    # Fase ampla: retângulo que cobre todo o caminho, mais o quanto um item
+    # andou em cada eixo (padrões de movimento mexem em y)
+    live = items.live_slots()
+    if live.size:
+        reach = np.array([np.max(np.abs(items.speed_x[live])), np.max(np.abs(items.dy[live]))],
+                         dtype=np.float32)
+    else:
+        reach = np.zeros(2, dtype=np.float32)
+    lo = np.minimum(p0, p1) - half - reach
+    hi = np.maximum(p0, p1) + half + reach
+    rects = [(x0, y0, x1 - x0, y1 - y0) for (x0, y0), (x1, y1) in zip(lo.tolist(), hi.tolist())]
+    firsts, slots = items.query_pairs(rects)
+    if telemetry is not None:
+        telemetry.add('collision.projectile.tested', int(slots.size))
+    if slots.size == 0:
+        return []
+
+    sprites = items.sprite_id[slots]
+    left = items.x[slots] + items.box_x[sprites] - half[firsts, 0]
+    top = items.y[slots] + items.box_y[sprites] - half[firsts, 1]
+    right = left + items.box_w[sprites] + 2 * half[firsts, 0]
+    bottom = top + items.box_h[sprites] + 2 * half[firsts, 1]
+
+    sx = p0[firsts, 0] + items.speed_x[slots]
+    sy = p0[firsts, 1] + items.dy[slots]
+    ex = p1[firsts, 0]
+    ey = p1[firsts, 1]
+    hit, t = segment_vs_aabb(sx, sy, ex, ey, left, top, right, bottom)
+
+    # Itens com hitbox circular: segmento contra o círculo do item aumentado
+    # pelo raio do projétil
+    round_items = np.isin(items.shape[sprites], (SHAPE_CIRCLE, SHAPE_CIRCLE_MASK))
+    if round_items.any():
+        circle_hit, circle_t = segment_vs_circle(
+            sx, sy, ex, ey, (left + right) * 0.5, (top + bottom) * 0.5,
+            items.radius[sprites] + proj_r[firsts])
+        hit = np.where(round_items, circle_hit, hit)
+        t = np.where(round_items, circle_t, t)
+    if not hit.any():
+        return []
+    results = resolve_earliest(firsts[hit], slots[hit], t[hit])
+    if telemetry is not None:
+        telemetry.add('collision.projectile.hits', len(results))
+    return results
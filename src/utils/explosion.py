@@ -1,5 +1,19 @@
+"""
+Explosões de bombas do jogo Perfect Potion.
+
+Cada explosão consulta o índice espacial do ItemEngine pelos itens dentro do
+raio e calcula a força (queda linear com a distância) de todos eles de uma
+vez com NumPy. Bombas atingidas explodem em cadeia: elas entram numa fila
+processada em largura (as mais próximas primeiro), com um orçamento de
+trabalho por tick, então uma cadeia grande se espalha por vários frames em
+vez de causar um pico num só.
+"""
+from collections import deque
+import numpy as np
 import pygame as pg
 from src import settings
+from src.utils.item_engine import KIND_INGREDIENT, KIND_HAZARD, KIND_BOMB
+
 
 class Explosion:
     """
@@ -7,72 +21,193 @@ class Explosion:
     visual + efeito sonoro(tentei) + impacto nos itens.
     """
 
-    def __init__(self, game, position, radius):
+    def __init__(self, game, position, radius, depth=0):
+        """
+        Args:
+            game: Referência ao jogo principal
+            position: Centro da explosão (x, y)
+            radius: Raio de efeito em pixels
+            depth: Posição na cadeia (0 = explosão que iniciou a cadeia)
+        """
         self.game = game
         self.position = position
         self.radius = radius
+        self.depth = depth
+        self.affected = 0  # Itens atingidos (preenchido por explode)
 
     def explode(self):
         """
         Executa a explosão:
         - afeta itens próximos
         - cria efeito visual
-        - toca som
+
+        Returns:
+            list: Explosões das bombas atingidas (próximo passo da cadeia)
         """
-        self._damage_items()
+        chained = self._damage_items()
         self._create_effect()
-        self._play_sound()
+        return chained
 
     def _damage_items(self):
         """
         Verifica quais itens estão dentro do raio e aplica efeito.
-        Ingredientes/Hazards/Bomb recebem score ou dano.
+        Ingredientes/Hazards dão pontos proporcionais à força; bombas explodem.
         """
-        explosion_rect = pg.Rect(0, 0, self.radius*2, self.radius*2)
-        explosion_rect.center = self.position
-        affected_items = []
+        engine = self.game.items
+        cx, cy = self.position
+        slots = engine.query_radius(cx, cy, self.radius)
+        if slots.size == 0:
+            self.affected = 0
+            return []
 
-        for item in self.game.items:
-            if explosion_rect.colliderect(item.rect):
-                dx = item.rect.centerx - self.position[0]
-                dy = item.rect.centery - self.position[1]
-                distance = (dx*dx + dy*dy)**0.5
-                affected_items.append((item, distance))
+        # Distância do centro da explosão ao centro da parte opaca de cada item
+        sprites = engine.sprite_id[slots]
+        item_x = engine.x[slots] + engine.box_x[sprites] + engine.box_w[sprites] / 2
+        item_y = engine.y[slots] + engine.box_y[sprites] + engine.box_h[sprites] / 2
+        distance = np.hypot(item_x - cx, item_y - cy)
 
-        affected_items.sort(key=lambda x: x[1])
+        # A consulta é da fase ampla (células aumentadas pela maior meia-extensão):
+        # só os itens realmente dentro do raio são atingidos
+        inside = distance < self.radius
+        slots, sprites = slots[inside], sprites[inside]
+        item_x, item_y, distance = item_x[inside], item_y[inside], distance[inside]
+        self.affected = int(slots.size)
+        self.game.telemetry.add('explosion.items_hit', self.affected)
+        if slots.size == 0:
+            return []
+        force = 1.0 - distance / self.radius
 
-        for item, distance in affected_items:
-            if distance < self.radius:
-                force = 1.0 - (distance/self.radius)
+        kinds = engine.kind[slots]
+        points = settings.SCORE_INGREDIENT * force[kinds == KIND_INGREDIENT].sum() + \
+                 settings.SCORE_HAZARD * force[kinds == KIND_HAZARD].sum()
+        engine.kill_many(slots)
+        if points:
+            self.game.add_score(int(round(points)))
 
-                if hasattr(item, 'on_explosion'):
-                    item.on_explosion(force, self.position)
-
-                if isinstance(item, settings.Ingredient):
-                    self.game.add_score(settings.SCORE_INGREDIENT)
-                    item.kill()
-                elif isinstance(item, settings.Hazard):
-                    self.game.add_score(settings.SCORE_HAZARD)
-                    item.kill()
-                elif hasattr(item, 'take_damage'):
-                    item.take_damage(force*100)
+        # Bombas atingidas viram as próximas explosões, das mais próximas às mais distantes
+        bombs = np.flatnonzero(kinds == KIND_BOMB)
+        bombs = bombs[np.argsort(distance[bombs], kind='stable')]
+        chained = []
+        for i in bombs.tolist():
+            prototype = engine.prototypes[sprites[i]]
+            radius = getattr(prototype, 'explosion_radius', settings.BOMB_EXPLOSION_RADIUS)
+            position = (float(item_x[i]), float(item_y[i]))
+            chained.append(Explosion(self.game, position, radius, self.depth + 1))
+        return chained
 
     def _create_effect(self):
         """
-        Desenha a explosão na tela com gradiente amarelo->vermelho.
+        Registra o efeito visual da explosão (desenhado em ExplosionQueue.draw).
         """
-        size = self.radius * 2
-        surf = pg.Surface((size, size), pg.SRCALPHA)
-        for r in range(self.radius, 0, -2):
-            alpha = int(200 * (r/self.radius))
-            color = (255, int(255*(r/self.radius)), 0, alpha)
-            pg.draw.circle(surf, color, (self.radius, self.radius), r, width=2)
-        rect = surf.get_rect(center=self.position)
-        self.game.screen.blit(surf, rect)
-        pg.display.update(rect)
+        self.game.explosions.add_effect(self.position, self.radius)
 
     def _play_sound(self):
         """
         Toca o som da explosão, se habilitado.
         """
         self.game._play_sound('explosion')
+
+
+class ExplosionQueue:
+    """
+    Fila das explosões pendentes e dos efeitos visuais ativos.
+
+    A cada tick processa explosões na ordem da fila até gastar o orçamento
+    de trabalho (settings.EXPLOSION_WORK_BUDGET, em itens atingidos). Pelo
+    menos uma explosão é processada por tick, então a fila sempre anda.
+    """
+
+    def __init__(self, game, budget=None):
+        """
+        Args:
+            game: Referência ao jogo principal
+            budget: Itens atingidos por tick antes de deixar o resto para o próximo
+        """
+        self.game = game
+        self.budget = budget or settings.EXPLOSION_WORK_BUDGET
+        self.queue = deque()
+        self.effects = []       # (superfície, retângulo, início em ms)
+        self._surfaces = {}     # raio -> superfície do efeito (desenhada uma vez)
+        self.longest_chain = 0  # Maior profundidade de cadeia vista
+
+    def __len__(self):
+        return len(self.queue)
+
+    def trigger(self, position, radius=None):
+        """
+        Agenda uma explosão (processada no próximo update).
+
+        Args:
+            position: Centro da explosão (x, y)
+            radius: Raio em pixels (padrão: settings.BOMB_EXPLOSION_RADIUS)
+        """
+        self.queue.append(Explosion(self.game, position, radius or settings.BOMB_EXPLOSION_RADIUS))
+
+    def update(self):
+        """
+        Processa explosões da fila dentro do orçamento do tick.
+
+        Returns:
+            int: Quantidade de explosões processadas
+        """
+        self._expire_effects()
+        if not self.queue:
+            return 0
+
+        work = 0
+        processed = 0
+        chained_sound = False
+        while self.queue and (processed == 0 or work < self.budget):
+            explosion = self.queue.popleft()
+            self.queue.extend(explosion.explode())
+            work += explosion.affected + 1
+            processed += 1
+            chained_sound |= explosion.depth > 0
+            self.longest_chain = max(self.longest_chain, explosion.depth)
+
+        # Um som por tick para as explosões em cadeia (a primeira já tocou na colisão)
+        if chained_sound:
+            explosion._play_sound()
+        return processed
+
+    def add_effect(self, position, radius):
+        """Mostra o efeito visual de uma explosão por settings.EXPLOSION_EFFECT_MS."""
+        surface = self._effect_surface(int(radius))
+        rect = surface.get_rect(center=(int(position[0]), int(position[1])))
+        self.effects.append((surface, rect, self.game.sim_time))
+
+    def _effect_surface(self, radius):
+        """Gradiente amarelo->vermelho de um raio (criado uma vez por raio)."""
+        surf = self._surfaces.get(radius)
+        if surf is None:
+            size = radius * 2
+            surf = pg.Surface((size, size), pg.SRCALPHA)
+            for r in range(radius, 0, -2):
+                alpha = int(200 * (r/radius))
+                color = (255, int(255*(r/radius)), 0, alpha)
+                pg.draw.circle(surf, color, (radius, radius), r, width=2)
+            self._surfaces[radius] = surf
+        return surf
+
+    def _expire_effects(self):
+        if self.effects:
+            now = self.game.sim_time
+            self.effects = [e for e in self.effects if now - e[2] < settings.EXPLOSION_EFFECT_MS]
+
+    def draw(self, surface):
+        """
+        Desenha os efeitos ativos, sumindo aos poucos.
+
+        Args:
+            surface: Superfície onde os efeitos serão desenhados
+        """
+        now = self.game.sim_time
+        for surf, rect, start in self.effects:
+            fade = 1.0 - (now - start) / settings.EXPLOSION_EFFECT_MS
+            surf.set_alpha(int(255 * max(fade, 0.0)))
+            surface.blit(surf, rect)
+
+    def clear(self):
+        """Descarta explosões pendentes e efeitos (ex: troca de nível)."""
+        self.queue.clear()
+        self.effects.clear()
@@ -0,0 +1,164 @@
+"""
+Gravador de voo (flight recorder) do jogo Perfect Potion.
+
+Guarda, num buffer circular de tamanho fixo, os contadores e os eventos dos
+últimos settings.FLIGHT_RECORDER_FRAMES frames (os tempos por fase já estão
+no histórico do FrameTimer). Quando um frame passa de
+settings.FLIGHT_RECORDER_THRESHOLD_MS, tudo isso é salvo em
+SAVE_DIR/hitch-*.json junto com uma amostra da pilha Python.
+
+A amostra da pilha é tirada *durante* o frame lento: uma thread vigia
+acorda a cada meio limite e, se o frame atual já passou do limite, copia a
+pilha da thread principal (sys._current_frames). Assim a pilha mostra onde
+o jogo estava parado (ex: construindo ingredientes ou no pg.time.delay da
+troca de música), não o fim do frame.
+
+Os arquivos são escritos numa thread separada e limitados a um a cada
+FLIGHT_RECORDER_MIN_INTERVAL segundos (e FLIGHT_RECORDER_MAX_DUMPS por
+execução), para um nível ruim não encher o disco. Desligado por padrão:
+liga com settings.FLIGHT_RECORDER_ENABLED ou `python main.py --flight-recorder`.
+"""
+import json
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from datetime import datetime
+from time import perf_counter
+import pygame as pg
+from src import settings
+from src.utils.log import get_logger
+
+log = get_logger(__name__)
+
+
+class FlightRecorder:
+    """Buffer circular dos últimos frames, salvo em disco quando um frame demora demais."""
+
+    def __init__(self, timer, frames=None, threshold_ms=None):
+        """
+        Args:
+            timer: FrameTimer do jogo (fonte dos tempos por fase)
+            frames: Quantos frames guardar (padrão: settings.FLIGHT_RECORDER_FRAMES)
+            threshold_ms: Duração que dispara o registro (padrão: settings.FLIGHT_RECORDER_THRESHOLD_MS)
+        """
+        self.timer = timer
+        self.frames = min(frames or settings.FLIGHT_RECORDER_FRAMES, timer.history)
+        self.threshold_ms = threshold_ms or settings.FLIGHT_RECORDER_THRESHOLD_MS
+        self.enabled = settings.FLIGHT_RECORDER_ENABLED
+        self.counts = deque(maxlen=self.frames)        # Contadores de cada frame
+        self.events = deque(maxlen=4 * self.frames)    # (frame, tipo, tecla) dos eventos recentes
+        self.dumps = 0                                  # Arquivos salvos nesta execução
+        self.last_dump = None                           # Caminho do último arquivo
+        self._last_dump_time = -float('inf')
+        self._frame_start = None    # perf_counter() do início do frame em andamento
+        self._stack = None          # (ms no frame quando amostrou, linhas da pilha)
+        self._main_thread = threading.get_ident()
+        self._watchdog = None
+        self._stop = threading.Event()
+
+    # --- Thread principal ---
+
+    def begin_frame(self):
+        """Marca o início de um frame (a vigia passa a observar)."""
+        if not self.enabled:
+            return
+        if self._watchdog is None and not self._stop.is_set():
+            self._start_watchdog()
+        self._stack = None
+        self._frame_start = perf_counter()
+
+    def cancel_frame(self):
+        """Descarta o frame em andamento (ex: antes de abrir a tela de game over)."""
+        self._frame_start = None
+
+    def record_event(self, event):
+        """Guarda um evento SDL processado neste frame."""
+        if self.enabled:
+            self.events.append((self.timer.frame, event.type, getattr(event, 'key', None)))
+
+    def end_frame(self, counts):
+        """
+        Fecha o frame (depois de FrameTimer.end_frame) e salva o buffer se ele foi lento.
+
+        Args:
+            counts: Contadores do frame (itens, projéteis, ...)
+        """
+        if not self.enabled or self._frame_start is None:
+            return
+        self._frame_start = None
+        self.counts.append(counts)
+        frame_ms = self.timer.frame_ms
+        if frame_ms < self.threshold_ms:
+            return
+        now = time.monotonic()
+        if (now - self._last_dump_time < settings.FLIGHT_RECORDER_MIN_INTERVAL
+                or self.dumps >= settings.FLIGHT_RECORDER_MAX_DUMPS):
+            return
+        self._last_dump_time = now
+        self.dumps += 1
+        report = self._report(frame_ms)
+        threading.Thread(target=self._write, args=(report,), name='flight-recorder', daemon=True).start()
+
+    def _report(self, frame_ms):
+        """Copia o buffer para um dicionário serializável (rápido; a escrita é em outra thread)."""
+        timer = self.timer
+        rows = timer.last(self.frames).tolist()
+        first = timer.frame - len(rows)
+        stack_ms, stack = self._stack if self._stack else (None, None)
+        return {
+            'time': datetime.now().isoformat(timespec='milliseconds'),
+            'frame': timer.frame - 1,
+            'frame_ms': round(frame_ms, 3),
+            'threshold_ms': self.threshold_ms,
+            'phases': list(timer.phases),
+            'frames': [{'frame': first + i, 'ms': [round(v, 3) for v in row]}
+                       for i, row in enumerate(rows)],
+            'counts': list(self.counts),
+            'events': [{'frame': frame, 'type': pg.event.event_name(event_type), 'key': key}
+                       for frame, event_type, key in self.events],
+            'stack_sampled_at_ms': stack_ms,
+            'stack': stack,
+        }
+
+    def _write(self, report):
+        stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+        path = os.path.join(settings.SAVE_DIR, f"hitch-{stamp}-f{report['frame']}.json")
+        try:
+            os.makedirs(settings.SAVE_DIR, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, ensure_ascii=False, indent=1)
+        except IOError as e:
+            log.error("Erro ao salvar registro de frame lento: %s", e)
+            return
+        self.last_dump = path
+        log.warning("Frame lento (%.1f ms) registrado em %s", report['frame_ms'], path)
+
+    # --- Thread vigia ---
+
+    def _start_watchdog(self):
+        self._main_thread = threading.get_ident()
+        self._watchdog = threading.Thread(target=self._watch, name='flight-watchdog', daemon=True)
+        self._watchdog.start()
+
+    def _watch(self):
+        interval = self.threshold_ms / 2000.0
+        while not self._stop.wait(interval):
+            start = self._frame_start
+            if start is None or self._stack is not None:
+                continue
+            elapsed_ms = (perf_counter() - start) * 1000.0
+            if elapsed_ms < self.threshold_ms:
+                continue
+            frame = sys._current_frames().get(self._main_thread)
+            if frame is not None and self._frame_start == start:
+                self._stack = (round(elapsed_ms, 1), traceback.format_stack(frame))
+
+    def shutdown(self):
+        """Para a thread vigia (frames seguintes não a iniciam de novo)."""
+        self._stop.set()
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=1.0)
+            self._watchdog = None
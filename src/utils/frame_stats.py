@@ -0,0 +1,237 @@
+"""
+Medições por frame do jogo Perfect Potion.
+
+FrameTimer divide o tempo de cada frame em fases (eventos, atualização,
+desenho, flip) com marcações baratas (um perf_counter por marca) e guarda
+um histórico circular pré-alocado. AllocationCounter conta quantas
+Surfaces e renderizações de texto cada frame cria.
+
+Os dados alimentam o overlay de desempenho (F3) e as ferramentas de
+diagnóstico que vêm depois dele.
+"""
+import functools
+import threading
+from threading import get_ident
+from time import perf_counter
+import numpy as np
+import pygame as pg
+from src import settings
+from src.utils.tracing import TRACER
+
+# Fases do frame, na ordem em que aparecem no loop
+PHASES = (
+    'events',
+    'update.spawning',
+    'update.cleanup',
+    'update.collision',
+    'update.other',
+    'draw.background',
+    'draw.sprites',
+    'draw.effects',
+    'draw.hud',
+    'overlay',
+    'flip',
+)
+
+# Grupos mostrados no overlay (prefixo da fase)
+PHASE_GROUPS = ('events', 'update', 'draw', 'overlay', 'flip')
+
+
+class FrameTimer:
+    """
+    Tempo de cada fase por frame, num histórico circular de 'history' frames.
+
+    Uso no loop:
+        timer.begin_frame()
+        ...; timer.mark('events')
+        ...; timer.mark('update.collision')
+        timer.end_frame()
+
+    mark(fase) soma à fase o tempo desde a marca anterior. Com o tracing
+    ligado, cada marca e o frame inteiro também viram spans no TRACER.
+    """
+
+    def __init__(self, phases=PHASES, history=None):
+        """
+        Args:
+            phases: Nomes das fases
+            history: Quantos frames guardar (padrão: settings.PERF_HISTORY)
+        """
+        self.phases = tuple(phases)
+        self.index = {phase: i for i, phase in enumerate(self.phases)}
+        self.history = history or settings.PERF_HISTORY
+        self.samples = np.zeros((self.history, len(self.phases)), dtype=np.float32)  # ms
+        self.counts = {}  # Contadores do último frame (itens, projéteis, surfaces, ...)
+        self.listener = None  # Objeto avisado a cada begin_frame/mark/end_frame (ex: AllocationTracker)
+        self.frame = 0
+        self._current = [0.0] * len(self.phases)
+        self._last = perf_counter()
+        self._start = self._last
+
+    def begin_frame(self):
+        """Começa a medir um frame."""
+        self._current = [0.0] * len(self.phases)
+        if self.listener is not None:
+            self.listener.begin_frame()
+        self._last = self._start = perf_counter()
+
+    def mark(self, phase):
+        """Soma à fase o tempo desde a última marca."""
+        now = perf_counter()
+        self._current[self.index[phase]] += now - self._last
+        if TRACER.enabled:
+            TRACER.complete(phase, self._last, now, 'frame')
+        if self.listener is not None:
+            # O tempo do listener não entra em nenhuma fase
+            self.listener.mark(phase)
+            now = perf_counter()
+        self._last = now
+
+    def end_frame(self, **counts):
+        """
+        Fecha o frame e guarda os tempos no histórico.
+
+        Args:
+            counts: Contadores do frame (ex: items=120)
+        """
+        self.samples[self.frame % self.history] = self._current
+        self.samples[self.frame % self.history] *= 1000.0
+        if TRACER.enabled:
+            TRACER.complete('frame', self._start, perf_counter(), 'frame')
+        self.counts = counts
+        if self.listener is not None:
+            self.listener.end_frame()
+        self.frame += 1
+
+    @property
+    def frame_ms(self):
+        """Duração total do último frame medido (ms, sem a espera do clock)."""
+        if self.frame == 0:
+            return 0.0
+        return float(self.samples[(self.frame - 1) % self.history].sum())
+
+    def last(self, frames):
+        """
+        Tempos dos últimos 'frames' frames (do mais antigo ao mais novo).
+
+        Returns:
+            np.ndarray: Matriz (frames, fases) em ms
+        """
+        frames = min(frames, self.frame, self.history)
+        rows = (np.arange(self.frame - frames, self.frame)) % self.history
+        return self.samples[rows]
+
+    def group_totals(self, rows):
+        """Soma as fases de cada grupo (PHASE_GROUPS) para as linhas dadas."""
+        totals = np.zeros(rows.shape[:-1] + (len(PHASE_GROUPS),), dtype=np.float32)
+        for g, group in enumerate(PHASE_GROUPS):
+            cols = [i for i, phase in enumerate(self.phases) if phase.split('.')[0] == group]
+            totals[..., g] = rows[..., cols].sum(axis=-1)
+        return totals
+
+
+class AllocationCounter:
+    """
+    Conta Surfaces criadas e textos renderizados pela thread principal.
+
+    pg.Surface e pg.font.Font são tipos imutáveis, então o contador troca os
+    nomes do módulo pygame por subclasses que contam e devolvem o mesmo tipo
+    (isinstance(x, pg.Surface) continua aceitando Surfaces comuns).
+    Funções de pg.transform que criam Surfaces também são contadas. Só o
+    código que chama pg.Surface(...), pg.font.Font(...) e pg.transform.*
+    depois de install() é medido: textos de fontes criadas antes não entram.
+
+    Como a troca vale para o processo inteiro, o contador só é instalado
+    quando alguém lê a contagem (overlay visível, telemetria, benchmark ou
+    settings.PERF_COUNT_ALLOCATIONS) e uninstall() devolve os nomes originais.
+    """
+
+    _TRANSFORMS = ('scale', 'smoothscale', 'rotate', 'rotozoom', 'flip', 'scale2x')
+
+    def __init__(self):
+        self.surfaces = 0
+        self.renders = 0
+        self.installed = False
+        self._originals = {}
+        self._replacements = None  # Subclasses e wrappers (criados uma vez e reusados)
+        self._main_thread = threading.main_thread().ident
+
+    def install(self):
+        """Passa a contar (idempotente)."""
+        if self.installed:
+            return
+        if self._replacements is None:
+            self._replacements = self._build()
+        self._originals = {}
+        for (name, module), replacement in self._replacements.items():
+            self._originals[(name, module)] = getattr(module, name)
+            setattr(module, name, replacement)
+        self.installed = True
+
+    def _build(self):
+        """Cria as subclasses de contagem e os wrappers de pg.transform."""
+        counter = self
+        main_thread = self._main_thread
+        surface_type = pg.Surface
+        font_type = pg.font.Font
+
+        class _SurfaceType(type):
+            # isinstance(x, pg.Surface) continua valendo para qualquer Surface
+            def __instancecheck__(cls, instance):
+                return isinstance(instance, surface_type)
+
+            def __subclasscheck__(cls, subclass):
+                return issubclass(subclass, surface_type)
+
+        class CountingSurface(surface_type, metaclass=_SurfaceType):
+            def __init__(self, *args, **kwargs):
+                if get_ident() == main_thread:
+                    counter.surfaces += 1
+                super().__init__(*args, **kwargs)
+
+        class CountingFont(font_type):
+            def render(self, *args, **kwargs):
+                if get_ident() == main_thread:
+                    counter.renders += 1
+                    counter.surfaces += 1
+                return super().render(*args, **kwargs)
+
+        replacements = {('Surface', pg): CountingSurface, ('Font', pg.font): CountingFont}
+        for name in self._TRANSFORMS:
+            original = getattr(pg.transform, name, None)
+            if original is not None:
+                replacements[(name, pg.transform)] = self._counted(original)
+        return replacements
+
+    def _counted(self, function):
+        main_thread = self._main_thread
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            # Só a thread principal conta (ex: o prefetch de fundos não entra no frame)
+            if get_ident() == main_thread:
+                self.surfaces += 1
+            return function(*args, **kwargs)
+        return wrapper
+
+    def surface_types(self):
+        """Subclasses de Surface que o contador pode ter criado (ex: para o censo de memória)."""
+        if self._replacements is None:
+            return set()
+        return {self._replacements[('Surface', pg)]}
+
+    def uninstall(self):
+        """Restaura os nomes originais do pygame (Surfaces e fontes já criadas continuam válidas)."""
+        for (name, module), original in self._originals.items():
+            setattr(module, name, original)
+        self._originals = {}
+        self.installed = False
+
+    def snapshot(self):
+        """Retorna (surfaces, renders) acumulados até agora."""
+        return self.surfaces, self.renders
+
+
+# Contador do processo: troca nomes do próprio pygame, então é um só mesmo
+# com vários Games (instalado sob demanda, veja AllocationCounter)
+ALLOCATIONS = AllocationCounter()
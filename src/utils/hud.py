@@ -1,7 +1,7 @@
 # src/utils/hud.py
 import pygame as pg
-import os
 from src import settings
+from src.data.potion_catalog import CATALOG
 
 # Cores do tema vampiro
 BLOOD_RED = (136, 8, 8)
@@ -18,30 +18,37 @@ class HUD:
         self.potion_size = 50 # tamanho das imagens de poções no HUD
         self.heart_image = self._load_heart_image()
         self.potion_images = self._load_potion_images()
+        self._potion_icons = {}  # (id, tamanho, coletada) -> Surface pronta para o blit
         
     def _load_potion_images(self):
         """
         Carrega as imagens das poções que serão exibidas no HUD.
         
         Returns:
-            dict: Dicionário com as imagens das poções carregadas
+            dict: Dicionário {id da poção: imagem} com as imagens encontradas
         """
         potion_images = {}
-        
-        potion_dir = os.path.join(settings.ASSETS_DIR, 'items', 'potions')
-        try:
-            # carrega todos os ficheiros .png da pasta de poções
-            potion_files = [f for f in os.listdir(potion_dir) if f.endswith('.png')]
-            for filename in potion_files:
-                path = os.path.join(potion_dir, filename)
-                img = pg.image.load(path).convert_alpha()
-                img_scaled = pg.transform.scale(img, (self.potion_size, self.potion_size))
-                potion_name = os.path.splitext(filename)[0] # usa o nome do ficheiro sem .png como chave
-                potion_images[potion_name] = img_scaled
-        except Exception as e:
-            print(f"Erro ao carregar imagens de poções para o HUD: {e}")
+        for potion_id in range(len(CATALOG)):
+            image = CATALOG.image(potion_id, self.potion_size)
+            if image is not None:
+                potion_images[potion_id] = image
         return potion_images
 
+    def _potion_icon(self, potion_id, size, collected):
+        """
+        Retorna o ícone de uma poção da receita (escurecido se ainda não coletada).
+        
+        Os ícones são montados uma vez e reaproveitados nos próximos frames.
+        """
+        key = (potion_id, size, collected)
+        if key not in self._potion_icons:
+            icon = CATALOG.image(potion_id, size)
+            if icon is not None and not collected:
+                icon = icon.copy()
+                icon.fill((100, 100, 100, 180), None, pg.BLEND_RGBA_MULT)
+            self._potion_icons[key] = icon
+        return self._potion_icons[key]
+
     def _load_heart_image(self):
         # Cria um coração estilizado programaticamente
         size = 35
@@ -161,49 +168,58 @@ class HUD:
                 # title_rect = title_text.get_rect(center=(screen_width//2, screen_height - potion_bar_height + 15))
                 # self.screen.blit(title_text, title_rect)
                 
-                # Desenha as poções necessárias
+                # Desenha as poções de cada receita ativa (a mais adiantada embaixo,
+                # as outras empilhadas acima; todas andam ao mesmo tempo)
                 potion_size = 40
                 spacing = 10
-                total_width = len(lm.required_potions) * (potion_size + spacing) - spacing
-                start_x = (screen_width - total_width) // 2
+                rows = getattr(lm, 'recipe_rows', None) or [(lm.required_potions, len(lm.collected_potions))]
+                for row, (required, collected) in enumerate(rows):
+                    self._draw_recipe_row(required, collected, potion_size, spacing,
+                                          screen_height - potion_bar_height + 30 - row * (potion_size + 25))
+
+    def _draw_recipe_row(self, required, collected, potion_size, spacing, y_pos):
+        """
+        Desenha uma receita centralizada na tela.
+
+        Args:
+            required: Ids das poções da receita
+            collected: Quantas delas já foram coletadas
+            potion_size: Tamanho dos ícones em pixels
+            spacing: Espaço entre os ícones
+            y_pos: Altura dos ícones
+        """
+        screen_width = self.screen.get_width()
+        total_width = len(required) * (potion_size + spacing) - spacing
+        start_x = (screen_width - total_width) // 2
+        
+        for i, potion_id in enumerate(required):
+            is_collected = i < collected
+            x_pos = start_x + i * (potion_size + spacing)
+            
+            # Ícone da poção no tamanho certo (escurecido se não foi coletada)
+            potion_img = self._potion_icon(potion_id, potion_size, is_collected)
+            
+            if potion_img:
+                self.screen.blit(potion_img, (x_pos, y_pos))
+                
+                # Número da ordem (1, 2, 3...)
+                order_text = self.small_font.render(str(i+1), True, settings.WHITE)
+                order_rect = order_text.get_rect(center=(x_pos + potion_size//2, y_pos - 15))
+                self.screen.blit(order_text, order_rect)
                 
-                for i, potion_name in enumerate(lm.required_potions):
-                    is_collected = i < len(lm.collected_potions)
-                    x_pos = start_x + i * (potion_size + spacing)
-                    y_pos = screen_height - potion_bar_height + 30
-                    
-                    # Tenta carregar a imagem da poção
-                    potion_img = self.potion_images.get(os.path.splitext(potion_name)[0])
-                    
-                    if potion_img:
-                        # Escala a imagem para o tamanho desejado
-                        potion_img = pg.transform.scale(potion_img, (potion_size, potion_size))
-                        
-                        # Se não foi coletada, deixa mais escura
-                        if not is_collected:
-                            potion_img = potion_img.copy()
-                            potion_img.fill((100, 100, 100, 180), None, pg.BLEND_RGBA_MULT)
-                        
-                        self.screen.blit(potion_img, (x_pos, y_pos))
-                        
-                        # Número da ordem (1, 2, 3...)
-                        order_text = self.small_font.render(str(i+1), True, settings.WHITE)
-                        order_rect = order_text.get_rect(center=(x_pos + potion_size//2, y_pos - 15))
-                        self.screen.blit(order_text, order_rect)
-                        
-                        # Marcação de concluído
-                        if is_collected:
-                            check = pg.Surface((potion_size, potion_size), pg.SRCALPHA)
-                            pg.draw.circle(check, (0, 255, 0, 150), 
-                                         (potion_size//2, potion_size//2), 
-                                         potion_size//2 - 5, 3)
-                            pg.draw.line(check, (0, 255, 0), 
-                                        (potion_size//4, potion_size//2),
-                                        (potion_size//2, potion_size*3//4), 3)
-                            pg.draw.line(check, (0, 255, 0), 
-                                        (potion_size//2, potion_size*3//4),
-                                        (potion_size*3//4, potion_size//4), 3)
-                            self.screen.blit(check, (x_pos, y_pos))
+                # Marcação de concluído
+                if is_collected:
+                    check = pg.Surface((potion_size, potion_size), pg.SRCALPHA)
+                    pg.draw.circle(check, (0, 255, 0, 150), 
+                                 (potion_size//2, potion_size//2), 
+                                 potion_size//2 - 5, 3)
+                    pg.draw.line(check, (0, 255, 0), 
+                                (potion_size//4, potion_size//2),
+                                (potion_size//2, potion_size*3//4), 3)
+                    pg.draw.line(check, (0, 255, 0), 
+                                (potion_size//2, potion_size*3//4),
+                                (potion_size*3//4, potion_size//4), 3)
+                    self.screen.blit(check, (x_pos, y_pos))
 
     def _draw_potion_sequence(self):
         # desenha a sequência de poções necessárias para o nível
@@ -230,10 +246,10 @@ class HUD:
         # desenha as imagens das poções do objetivo
         start_x = box_x + padding
         start_y = box_y + 35
-        for i, potion_name in enumerate(lm.required_potions):
+        for i, potion_id in enumerate(lm.required_potions):
             is_collected = i < len(lm.collected_potions)
             
-            potion_img = self.potion_images.get(os.path.splitext(potion_name)[0])
+            potion_img = self.potion_images.get(potion_id)
             if potion_img:
                 # deixa a imagem mais escura/transparente se ainda não foi coletada
                 if not is_collected:
@@ -260,29 +276,8 @@ class HUD:
         # Atualiza as poções necessárias e coletadas no level_manager
         if hasattr(self.game, 'level_manager'):
             if required_potions is not None:
+                # As poções são ids do catálogo, cujas imagens já foram carregadas
                 self.game.level_manager.required_potions = required_potions
-                
-                # Se temos novas poções necessárias, carregamos suas imagens
-                if isinstance(required_potions, list) and len(required_potions) > 0:
-                    for potion_file in required_potions:
-                        if not potion_file:
-                            continue
-                        try:
-                            # Remove a extensão do arquivo se existir
-                            potion_name = os.path.splitext(os.path.basename(potion_file))[0]
-                            
-                            # Verifica se já temos essa poção carregada
-                            if potion_name not in self.potion_images:
-                                # Tenta carregar a imagem da poção
-                                potion_path = os.path.join(settings.ASSETS_DIR, 'items', 'potions', f"{potion_name}.png")
-                                if os.path.exists(potion_path):
-                                    img = pg.image.load(potion_path).convert_alpha()
-                                    img_scaled = pg.transform.scale(img, (self.potion_size, self.potion_size))
-                                    self.potion_images[potion_name] = img_scaled
-                                else:
-                                    print(f"Aviso: Imagem da poção não encontrada: {potion_path}")
-                        except Exception as e:
-                            print(f"Erro ao carregar imagem da poção {potion_file}: {e}")
             
             if collected_potions is not None:
                 self.game.level_manager.collected_potions = collected_potions
@@ -0,0 +1,183 @@
+"""
+Latência de entrada até a tela (input-to-photon) do jogo Perfect Potion.
+
+Cada KEYDOWN que deveria mover o jogador ou disparar uma poção ganha um
+carimbo de tempo em Game.events(). Uma tecla de movimento guarda a posição
+do jogador; uma de tiro é ligada ao tiro que ela disparou (shot_result(),
+logo depois de player.shoot()). Depois de cada pg.display.flip() a sonda
+olha se a reação já aconteceu (o jogador andou no sentido que a tecla pede,
+o tiro da tecla saiu) e, se sim, registra:
+- ms entre a entrada e a volta do flip;
+- quantos frames se passaram entre o frame que leu o evento e o que
+  mostrou a reação (0 = o mesmo frame).
+
+O pygame 2 não expõe o timestamp do SDL, então uma tecla real é carimbada
+quando a fila é esvaziada em events(). Ela pode ter chegado a qualquer
+momento desde o esvaziamento anterior, então também é guardado o limite
+superior (desde o início do frame anterior), que inclui a espera do
+clock.tick: é essa parte que ler a entrada mais tarde no frame diminuiria.
+Eventos com o atributo 'posted' (perf_counter de quem os postou, como o
+benchmark) usam esse tempo exato.
+
+Um tiro apertado durante a recarga conta na hora como 'sem reação' (o
+próximo tiro não fecha a entrada dele); movimentos sem reação em
+settings.INPUT_LATENCY_MAX_FRAMES frames (jogador encostado na borda)
+também. Liga com
+settings.INPUT_LATENCY, `python main.py --latency` ou
+`python benchmark.py --latency`; desligada, cada chamada só testa uma flag.
+"""
+from time import perf_counter
+import numpy as np
+import pygame as pg
+from src import settings
+
+# Teclas acompanhadas e o tipo de reação esperado; teclas de movimento
+# guardam o sentido (dx, dy) que precisam causar, para um movimento que já
+# vinha acontecendo (outra tecla segurada) não contar como reação
+MOVE_KEYS = {
+    pg.K_LEFT: (-1, 0), pg.K_a: (-1, 0),
+    pg.K_RIGHT: (1, 0), pg.K_d: (1, 0),
+    pg.K_UP: (0, -1), pg.K_w: (0, -1),
+    pg.K_DOWN: (0, 1), pg.K_s: (0, 1),
+}
+SHOOT_KEYS = frozenset({pg.K_SPACE})
+KINDS = ('move', 'shoot')
+
+
+class InputLatencyProbe:
+    """Mede quantos ms e frames separam uma tecla da reação visível."""
+
+    def __init__(self, game, enabled=None, max_frames=None):
+        """
+        Args:
+            game: Instância de Game (o jogador é lido a cada frame)
+            enabled: Se a sonda mede (padrão: settings.INPUT_LATENCY)
+            max_frames: Frames esperando a reação (padrão: settings.INPUT_LATENCY_MAX_FRAMES)
+        """
+        self.game = game
+        self.enabled = settings.INPUT_LATENCY if enabled is None else enabled
+        self.max_frames = max_frames or settings.INPUT_LATENCY_MAX_FRAMES
+        self.frame = 0
+        self._frame_start = self._previous_start = perf_counter()
+        self._pending = []  # [tipo, frame, entrada (s), limite (s), linha de base, sentido]
+        self.reset()
+
+    def reset(self):
+        """Zera as medidas (início de uma partida)."""
+        self._pending = []
+        self.samples = {kind: [] for kind in KINDS}  # tipo -> [(ms, ms limite, frames)]
+        self.missed = {kind: 0 for kind in KINDS}
+
+    # --- Chamados pelo loop do jogo ---
+
+    def begin_frame(self):
+        """Início do frame (antes de events())."""
+        if not self.enabled:
+            return
+        self.frame += 1
+        self._previous_start = self._frame_start
+        self._frame_start = perf_counter()
+
+    def record_input(self, event):
+        """Carimba um evento antes de ele ser tratado (a linha de base é o estado de antes)."""
+        if not self.enabled or event.type != pg.KEYDOWN:
+            return
+        player = self.game.player
+        if player is None:
+            return
+        if event.key in SHOOT_KEYS:
+            kind, baseline, direction = 'shoot', None, None  # Hora do tiro (shot_result)
+        elif event.key in MOVE_KEYS:
+            kind, baseline, direction = 'move', player.rect.topleft, MOVE_KEYS[event.key]
+        else:
+            return
+        posted = getattr(event, 'posted', None)
+        if posted is not None:
+            stamp = bound = posted
+        else:
+            stamp, bound = perf_counter(), self._previous_start
+        self._pending.append([kind, self.frame, stamp, bound, baseline, direction])
+
+    def shot_result(self, shot_time):
+        """
+        Liga a última tecla de tiro ao tiro que ela disparou (logo depois de player.shoot()).
+
+        Args:
+            shot_time: player.last_shot_time do tiro disparado (None se estava em recarga)
+        """
+        if not self.enabled or not self._pending or self._pending[-1][0] != 'shoot':
+            return
+        entry = self._pending[-1]
+        if entry[4] is not None:
+            return
+        if shot_time is None:
+            self._pending.pop()
+            self.missed['shoot'] += 1
+        else:
+            entry[4] = shot_time
+
+    def presented(self):
+        """Logo depois do pg.display.flip(): fecha as entradas cuja reação já está na tela."""
+        if not self.enabled or not self._pending:
+            return
+        now = perf_counter()
+        player = self.game.player
+        still_pending = []
+        for entry in self._pending:
+            kind, frame, stamp, bound, baseline, direction = entry
+            if player is None:
+                self.missed[kind] += 1
+                continue
+            if self._reacted(player, baseline, direction):
+                self.samples[kind].append(((now - stamp) * 1000, (now - bound) * 1000, self.frame - frame))
+            elif self.frame - frame >= self.max_frames:
+                self.missed[kind] += 1
+            else:
+                still_pending.append(entry)
+        self._pending = still_pending
+
+    @staticmethod
+    def _reacted(player, baseline, direction):
+        """
+        Se a reação a uma entrada já está na tela.
+
+        Args:
+            player: Jogador atual
+            baseline: Hora do tiro da tecla ou posição do jogador na entrada
+            direction: Sentido (dx, dy) pedido pela tecla (None para tiro)
+
+        Returns:
+            bool: Tiro da tecla disparado ou deslocamento no sentido pedido desde a entrada
+        """
+        if direction is None:
+            return baseline is not None and player.last_shot_time >= baseline
+        x, y = player.rect.topleft
+        return (x - baseline[0]) * direction[0] + (y - baseline[1]) * direction[1] > 0
+
+    # --- Resultados ---
+
+    def summary(self):
+        """
+        Percentis de latência por tipo de entrada.
+
+        Returns:
+            dict: {tipo: {count, missed, p50_ms, p90_ms, p99_ms, max_ms,
+                   p50_bound_ms, p99_bound_ms, frames}} (None se desligada)
+        """
+        if not self.enabled:
+            return None
+        result = {}
+        for kind in KINDS:
+            rows = self.samples[kind]
+            entry = {'count': len(rows), 'missed': self.missed[kind]}
+            if rows:
+                values = np.array(rows, dtype=np.float64)
+                p50, p90, p99 = np.percentile(values[:, 0], (50, 90, 99))
+                bound50, bound99 = np.percentile(values[:, 1], (50, 99))
+                frames, counts = np.unique(values[:, 2].astype(np.int64), return_counts=True)
+                entry.update(p50_ms=round(float(p50), 2), p90_ms=round(float(p90), 2),
+                             p99_ms=round(float(p99), 2), max_ms=round(float(values[:, 0].max()), 2),
+                             p50_bound_ms=round(float(bound50), 2), p99_bound_ms=round(float(bound99), 2),
+                             frames={int(f): int(c) for f, c in zip(frames, counts)})
+            result[kind] = entry
+        return result
@@ -0,0 +1,521 @@
+"""
+Motor de itens do jogo Perfect Potion.
+
+Guarda todos os itens (poções e bombas) em arrays NumPy pré-alocados
+(estrutura de arrays) em vez de um objeto Sprite por item. O movimento e a
+remoção dos itens que saíram da tela são feitos em poucas operações
+vetorizadas por frame, o que permite milhares de itens simultâneos.
+
+As classes Ingredient, Hazard e Bomb continuam existindo, mas agora servem
+como protótipos: uma instância por tipo de item fornece a imagem, a máscara
+e os atributos (dano, nome da poção) compartilhados por todos os itens
+daquele tipo.
+"""
+import numpy as np
+import pygame as pg
+from src import settings
+from src.utils.spatial_hash import SpatialHash
+from src.utils.collision import shape_id
+from src.utils.timer_service import TimingWheel
+from src.utils.movement import PATTERN_LINEAR, step_patterns
+
+# Tipos de item guardados no array 'kind'
+KIND_INGREDIENT = 0
+KIND_HAZARD = 1
+KIND_BOMB = 2
+
+# Margem além da tela usada para descartar itens parados ou fora da área
+OFFSCREEN_MARGIN = 100
+
+
+class ItemView:
+    """
+    Visão leve de um item do motor.
+
+    Criada apenas quando é preciso tratar um item individualmente (colisões,
+    explosões). Expõe rect, image e mask, então funciona com as funções de
+    colisão do pygame como se fosse um Sprite.
+    """
+
+    __slots__ = ('engine', 'slot', 'kind', 'potion_id', 'prototype', 'image', 'mask', 'rect')
+
+    def __init__(self, engine, slot):
+        self.engine = engine
+        self.slot = slot
+        self.kind = int(engine.kind[slot])
+        self.potion_id = int(engine.potion_id[slot])
+        sprite_id = engine.sprite_id[slot]
+        self.prototype = engine.prototypes[sprite_id]
+        self.image = engine.images[sprite_id]
+        self.mask = engine.masks[sprite_id]
+        self.rect = self.image.get_rect(topleft=(int(engine.x[slot]), int(engine.y[slot])))
+
+    @property
+    def potion_file_name(self):
+        return getattr(self.prototype, 'potion_file_name', None)
+
+    @property
+    def damage(self):
+        return getattr(self.prototype, 'damage', 0)
+
+    def alive(self):
+        return bool(self.engine.alive[self.slot])
+
+    def kill(self):
+        """Remove o item do motor."""
+        self.engine.kill(self.slot)
+
+
+class ItemEngine:
+    """
+    Armazena e simula todos os itens do jogo em arrays NumPy.
+
+    Cada item ocupa um slot fixo nos arrays x, y, speed_x, kind, potion_id,
+    sprite_id e alive. Slots liberados são reaproveitados pelos próximos
+    spawns, e o contador de geração de cada slot permite detectar
+    referências antigas a um item que já foi removido.
+    """
+
+    def __init__(self, capacity=None):
+        """
+        Pré-aloca os arrays do motor.
+
+        Args:
+            capacity: Número máximo de itens simultâneos (padrão: settings.ITEM_ENGINE_CAPACITY)
+        """
+        self.capacity = capacity or settings.ITEM_ENGINE_CAPACITY
+
+        self.x = np.zeros(self.capacity, dtype=np.float32)
+        self.y = np.zeros(self.capacity, dtype=np.float32)
+        self.speed_x = np.zeros(self.capacity, dtype=np.float32)
+        self.kind = np.zeros(self.capacity, dtype=np.int8)
+        self.potion_id = np.full(self.capacity, -1, dtype=np.int16)
+        self.sprite_id = np.zeros(self.capacity, dtype=np.int16)
+        self.alive = np.zeros(self.capacity, dtype=bool)
+        self.generation = np.zeros(self.capacity, dtype=np.uint32)
+
+        # Padrão de movimento de cada item (src/utils/movement.py) e seus parâmetros
+        self.pattern = np.zeros(self.capacity, dtype=np.int8)
+        self.p0 = np.zeros(self.capacity, dtype=np.float32)
+        self.p1 = np.zeros(self.capacity, dtype=np.float32)
+        self.phase = np.zeros(self.capacity, dtype=np.float32)
+        self.base_y = np.zeros(self.capacity, dtype=np.float32)
+        self.speed_y = np.zeros(self.capacity, dtype=np.float32)
+        self.spawn_tick = np.zeros(self.capacity, dtype=np.int64)
+        # Deslocamento vertical no último step() (o horizontal é sempre speed_x);
+        # a colisão contínua dos projéteis usa os dois
+        self.dy = np.zeros(self.capacity, dtype=np.float32)
+        self._patterned = False  # Algum item com padrão não linear desde o último empty()
+
+        # Tabela de sprites compartilhados (um por tipo de item)
+        self.prototypes = []
+        self.images = []
+        self.masks = []
+        self._surface_table = np.empty(0, dtype=object)
+        self.width = np.zeros(0, dtype=np.float32)
+        self.height = np.zeros(0, dtype=np.float32)
+
+        # Retângulo justo da parte opaca de cada sprite (relativo ao canto do item)
+        self.box_x = np.zeros(0, dtype=np.float32)
+        self.box_y = np.zeros(0, dtype=np.float32)
+        self.box_w = np.zeros(0, dtype=np.float32)
+        self.box_h = np.zeros(0, dtype=np.float32)
+
+        # Formato de colisão de cada sprite (declarado e efetivo) e raio do círculo
+        self.hitboxes = []
+        self.shape = np.zeros(0, dtype=np.int8)
+        self.radius = np.zeros(0, dtype=np.float32)
+        self.collision_profile = None
+
+        # Índice espacial para a fase ampla das colisões
+        self.index = SpatialHash()
+        self._index_dirty = True
+
+        # Slots em uso ficam todos abaixo de 'top'
+        self.top = 0
+        self.live_count = 0
+        self.high_water = 0    # Maior número de itens vivos ao mesmo tempo
+        self._free = []
+
+        # Tick de saída da tela de cada item, calculado no spawn: a remoção
+        # visita só os itens que vencem no tick, em vez de varrer todos
+        self.tick = 0
+        self.exit_wheel = TimingWheel()
+
+    # --- Tabela de sprites ---
+
+    def register_sprite(self, prototype, hitbox='mask'):
+        """
+        Registra um protótipo de item e retorna o id do seu sprite.
+
+        Args:
+            prototype: Instância de Item que fornece image e mask
+            hitbox: Formato de colisão ('mask', 'rect', 'circle' ou 'circle_mask')
+
+        Returns:
+            int: Id usado no array sprite_id
+        """
+        self.prototypes.append(prototype)
+        self.images.append(prototype.image)
+        mask = getattr(prototype, 'mask', None)
+        if mask is None:
+            mask = pg.mask.from_surface(prototype.image)
+        self.masks.append(mask)
+
+        self._surface_table = np.empty(len(self.images), dtype=object)
+        self._surface_table[:] = self.images
+        w, h = prototype.image.get_size()
+        self.width = np.append(self.width, np.float32(w))
+        self.height = np.append(self.height, np.float32(h))
+
+        # A fase ampla usa só a área opaca, mais justa que o retângulo da imagem
+        opaque = mask.get_bounding_rects()
+        box = opaque[0].unionall(opaque[1:]) if opaque else pg.Rect(0, 0, w, h)
+        self.box_x = np.append(self.box_x, np.float32(box.x))
+        self.box_y = np.append(self.box_y, np.float32(box.y))
+        self.box_w = np.append(self.box_w, np.float32(box.width))
+        self.box_h = np.append(self.box_h, np.float32(box.height))
+
+        # Círculo inscrito na parte opaca
+        self.hitboxes.append(hitbox)
+        self.shape = np.append(self.shape, np.int8(shape_id(hitbox, self.collision_profile)))
+        self.radius = np.append(self.radius, np.float32(min(box.width, box.height) / 2))
+        return len(self.prototypes) - 1
+
+    def apply_collision_profile(self, profile):
+        """
+        Troca os formatos de colisão efetivos segundo um perfil.
+
+        Args:
+            profile: Dicionário {formato declarado: formato usado}, ou None
+        """
+        self.collision_profile = profile
+        self.shape = np.array([shape_id(name, profile) for name in self.hitboxes], dtype=np.int8)
+
+    def sprite_size(self, sprite_id):
+        """Retorna (largura, altura) do sprite registrado."""
+        return self.images[sprite_id].get_size()
+
+    # --- Criação e remoção ---
+
+    def spawn(self, x, y, speed_x, kind, sprite_id, potion_id=-1):
+        """
+        Cria um item num slot livre.
+
+        Returns:
+            int: Slot do novo item, ou -1 se o motor estiver cheio
+        """
+        if self._free:
+            slot = self._free.pop()
+        elif self.top < self.capacity:
+            slot = self.top
+            self.top += 1
+        else:
+            return -1
+
+        self.x[slot] = x
+        self.y[slot] = y
+        self.speed_x[slot] = speed_x
+        self.kind[slot] = kind
+        self.sprite_id[slot] = sprite_id
+        self.potion_id[slot] = potion_id
+        self.pattern[slot] = PATTERN_LINEAR
+        self.dy[slot] = 0.0
+        self.alive[slot] = True
+        self.generation[slot] += 1
+        self.live_count += 1
+        if self.live_count > self.high_water:
+            self.high_water = self.live_count
+        self._index_dirty = True
+        self._schedule_exits(np.array([slot], dtype=np.intp))
+        return slot
+
+    def spawn_many(self, x, y, speed_x, kind, sprite_id, potion_id,
+                   pattern=None, p0=None, p1=None, phase=None):
+        """
+        Cria uma onda inteira de itens de uma vez (arrays paralelos).
+
+        Itens que não couberem no motor são descartados. Sem 'pattern', todos
+        os itens andam só na horizontal.
+
+        Returns:
+            np.ndarray: Slots dos itens criados
+        """
+        count = len(x)
+        reused = min(count, len(self._free))
+        fresh = min(count - reused, self.capacity - self.top)
+        slots = np.empty(reused + fresh, dtype=np.intp)
+        if reused:
+            slots[:reused] = self._free[-reused:]
+            del self._free[-reused:]
+        if fresh:
+            slots[reused:] = np.arange(self.top, self.top + fresh)
+            self.top += fresh
+
+        n = slots.size
+        self.x[slots] = x[:n]
+        self.y[slots] = y[:n]
+        self.speed_x[slots] = speed_x[:n]
+        self.kind[slots] = kind[:n]
+        self.sprite_id[slots] = sprite_id[:n]
+        self.potion_id[slots] = potion_id[:n]
+        if pattern is None:
+            self.pattern[slots] = PATTERN_LINEAR
+        else:
+            self.pattern[slots] = pattern[:n]
+            self.p0[slots] = p0[:n]
+            self.p1[slots] = p1[:n]
+            self.phase[slots] = phase[:n] if phase is not None else 0.0
+            self.base_y[slots] = y[:n]
+            self.speed_y[slots] = 0.0
+            self.spawn_tick[slots] = self.tick
+            self._patterned = self._patterned or bool(np.any(pattern[:n] != PATTERN_LINEAR))
+        self.dy[slots] = 0.0
+        self.alive[slots] = True
+        self.generation[slots] += 1
+        self.live_count += n
+        if self.live_count > self.high_water:
+            self.high_water = self.live_count
+        self._index_dirty = True
+        self._schedule_exits(slots)
+        return slots
+
+    def _schedule_exits(self, slots):
+        """
+        Agenda o tick em que cada item sai da tela pelo lado para onde anda.
+
+        Como x só muda por speed_x a cada step(), o tick é calculado uma vez:
+        indo para a direita sai quando x passa da largura da janela, indo para
+        a esquerda quando x + largura fica negativo. Itens parados não são
+        agendados (cull() ainda os remove se for chamado).
+        """
+        x = self.x[slots].astype(np.float64)
+        speed = self.speed_x[slots].astype(np.float64)
+        w = self.width[self.sprite_id[slots]]
+        moving = speed != 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            steps = np.where(speed > 0, (settings.WINDOW_WIDTH - x) / speed, (x + w) / -speed)
+        # +1 para garantir que já saiu mesmo com o arredondamento de float32
+        exits = self.tick + np.floor(np.maximum(steps, 0)) + 2
+        for slot, generation, tick in zip(slots[moving].tolist(),
+                                          self.generation[slots[moving]].tolist(),
+                                          exits[moving].tolist()):
+            self.exit_wheel.schedule(tick, (slot, generation))
+
+    def kill(self, slot):
+        """Remove um item pelo slot (ignorado se já estiver morto)."""
+        if self.alive[slot]:
+            self.alive[slot] = False
+            self._free.append(int(slot))
+            self.live_count -= 1
+
+    def kill_many(self, slots):
+        """Remove vários itens de uma vez."""
+        slots = np.asarray(slots, dtype=np.intp)
+        if slots.size == 0:
+            return
+        slots = slots[self.alive[slots]]
+        slots = np.unique(slots)
+        self.alive[slots] = False
+        self._free.extend(slots.tolist())
+        self.live_count -= int(slots.size)
+
+    def empty(self):
+        """Remove todos os itens (mesma interface de pg.sprite.Group)."""
+        self.alive[:self.top] = False
+        self.top = 0
+        self.live_count = 0
+        self._free.clear()
+        self.index.clear()
+        self._index_dirty = False
+        self.exit_wheel.clear()
+        self._patterned = False
+        self.dy[:] = 0.0
+
+    clear = empty
+
+    def reset_stats(self):
+        """Zera a marca de uso máximo (ex: no início de um nível)."""
+        self.high_water = self.live_count
+
+    def stats(self):
+        """
+        Returns:
+            dict: Uso do motor, no mesmo formato de ObjectPool.stats()
+        """
+        return {
+            'name': 'items',
+            'active': self.live_count,
+            'free': self.capacity - self.live_count,
+            'created': self.capacity,
+            'high_water': self.high_water,
+        }
+
+    # --- Simulação ---
+
+    def step(self, target_y=None):
+        """
+        Avança todos os itens um frame e remove os que saíram da tela.
+
+        Args:
+            target_y: Altura do centro do jogador (usada pelo padrão homing)
+
+        Returns:
+            int: Quantidade de itens removidos
+        """
+        self.tick += 1
+        expired = self.exit_wheel.advance()
+        n = self.top
+        if n == 0:
+            return 0
+
+        # Movimento horizontal (itens mortos também andam, mas são ignorados)
+        self.x[:n] += self.speed_x[:n]
+        self._index_dirty = True
+
+        # Movimento vertical dos padrões (um passo vetorizado por padrão)
+        removed = 0
+        if self._patterned:
+            # dy = y depois - y antes, sem alocar (o buffer guarda o y de antes)
+            dy = self.dy[:n]
+            dy[:] = self.y[:n]
+            gone = step_patterns(self, n, target_y)
+            np.subtract(self.y[:n], dy, out=dy)
+            if gone is not None:
+                before = self.live_count
+                self.kill_many(gone)
+                removed = before - self.live_count
+        return removed + self._expire(expired)
+
+    def _expire(self, expired):
+        """Remove os itens cujo tick de saída venceu (se o slot não foi reusado)."""
+        if not expired:
+            return 0
+        slots, generations = np.array(expired, dtype=np.int64).T
+        current = self.alive[slots] & (self.generation[slots] == generations)
+        slots = slots[current]
+        if slots.size == 0:
+            return 0
+        self.kill_many(slots)
+        self._shrink_top()
+        return int(slots.size)
+
+    def cull(self):
+        """
+        Remove de uma vez todos os itens que saíram da tela.
+
+        Returns:
+            int: Quantidade de itens removidos
+        """
+        n = self.top
+        if n == 0:
+            return 0
+
+        x = self.x[:n]
+        y = self.y[:n]
+        speed_x = self.speed_x[:n]
+        sprites = self.sprite_id[:n]
+        w = self.width[sprites]
+        h = self.height[sprites]
+
+        # Saiu pelo lado para onde estava indo
+        offscreen = ((speed_x > 0) & (x > settings.WINDOW_WIDTH)) | \
+                    ((speed_x < 0) & (x + w < 0))
+
+        # Saiu completamente da área com margem (parados, empurrados, etc.)
+        offscreen |= (x + w < -OFFSCREEN_MARGIN) | (x > settings.WINDOW_WIDTH + OFFSCREEN_MARGIN) | \
+                     (y + h < -OFFSCREEN_MARGIN) | (y > settings.WINDOW_HEIGHT + OFFSCREEN_MARGIN)
+
+        dead = np.flatnonzero(offscreen & self.alive[:n])
+        if dead.size:
+            self.alive[dead] = False
+            self._free.extend(dead.tolist())
+            self.live_count -= int(dead.size)
+        self._shrink_top()
+        return int(dead.size)
+
+    def _shrink_top(self):
+        """Recolhe 'top' quando os últimos slots estão livres."""
+        if self.live_count == 0:
+            self.top = 0
+            self._free.clear()
+            return
+        if self.alive[self.top - 1]:
+            return
+        alive = np.flatnonzero(self.alive[:self.top])
+        new_top = int(alive[-1]) + 1
+        if new_top < self.top:
+            self._free = [s for s in self._free if s < new_top]
+            self.top = new_top
+
+    # --- Consultas ---
+
+    def live_slots(self):
+        """Retorna os slots de todos os itens vivos."""
+        return np.flatnonzero(self.alive[:self.top])
+
+    def rebuild_index(self):
+        """Reconstrói o índice espacial com as posições atuais dos itens vivos."""
+        slots = self.live_slots()
+        sprites = self.sprite_id[slots]
+        left = self.x[slots] + self.box_x[sprites]
+        top = self.y[slots] + self.box_y[sprites]
+        self.index.rebuild(left, top, left + self.box_w[sprites], top + self.box_h[sprites], ids=slots)
+        self._index_dirty = False
+
+    def _indexed(self):
+        if self._index_dirty:
+            self.rebuild_index()
+        return self.index
+
+    def query_rect(self, rect):
+        """
+        Retorna os slots dos itens cuja área opaca intersecta 'rect'.
+
+        Args:
+            rect: pg.Rect (ou tupla x, y, w, h) a ser testado
+        """
+        slots = self._indexed().query_rect(rect)
+        return slots[self.alive[slots]]
+
+    def query_radius(self, cx, cy, radius):
+        """Retorna os slots dos itens que tocam o círculo de centro (cx, cy)."""
+        slots = self._indexed().query_radius(cx, cy, radius)
+        return slots[self.alive[slots]]
+
+    def query_pairs(self, rects):
+        """
+        Retorna os pares candidatos (índice em 'rects', slot do item).
+
+        Usado para testar todos os projéteis de uma vez contra os itens.
+        """
+        firsts, slots = self._indexed().query_pairs(rects)
+        keep = self.alive[slots]
+        return firsts[keep], slots[keep]
+
+    def view(self, slot):
+        """Cria uma visão leve (ItemView) do item no slot."""
+        return ItemView(self, int(slot))
+
+    def __len__(self):
+        return self.live_count
+
+    def __iter__(self):
+        for slot in self.live_slots():
+            yield ItemView(self, int(slot))
+
+    # --- Renderização ---
+
+    def draw(self, surface):
+        """
+        Desenha todos os itens vivos com uma única chamada a blits().
+
+        Args:
+            surface: Superfície onde os itens serão desenhados
+        """
+        slots = self.live_slots()
+        if slots.size == 0:
+            return
+        images = self._surface_table[self.sprite_id[slots]]
+        coords = np.stack((self.x[slots], self.y[slots]), axis=1).astype(np.int32).tolist()
+        surface.blits(zip(images, coords), doreturn=False)
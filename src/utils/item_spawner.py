@@ -1,10 +1,14 @@
-import pygame as pg
-import random
 from src.items.ingredient import Ingredient
 from src.items.hazard import Hazard
 from src.items.bomb import Bomb
-from src import settings
-from src.data.potions import POTION_DATA  # ← IMPORTAÇÃO ADICIONADA
+from src.data.potions import BOMB_HITBOX
+from src.data.potion_catalog import CATALOG
+from src.utils.item_engine import KIND_INGREDIENT, KIND_HAZARD, KIND_BOMB
+from src.utils.spawn_director import SpawnDirector
+from src.utils.tracing import traced
+from src.utils.log import get_logger
+
+log = get_logger(__name__)
 
 
 class ItemSpawner:
@@ -15,129 +19,175 @@ class ItemSpawner:
 
     def __init__(self, game):
         self.game = game
-        self.last_spawn_time = 0  # Controla o tempo do último spawn
-        self.spawn_delay = 2000   # 2 segundos entre spawns (em ms)
+        self.profile = None       # DifficultyProfile do nível atual
+        self.next_spawn_time = 0  # Instante (relógio da simulação) da próxima onda
+        self._sprite_ids = {}     # (tipo, poção) -> id do sprite no motor de itens
+        self.entries = []         # Catálogo de entradas (tipo, poção, sprite, id, largura, altura)
+        self.director = SpawnDirector()  # Decide o conteúdo de cada onda
+        self.schedule = None      # Ondas pré-compiladas do nível (pacote de níveis) ou None
+        self.level_start = 0      # Instante (relógio da simulação) em que o nível começou
+
+    def update(self, now):
+        """
+        Dispara as ondas de spawn cujo horário já chegou.
+
+        O horário vem do relógio da simulação (Game.sim_time), não do relógio
+        do sistema, então o spawn é o mesmo com ou sem janela e em replays.
+
+        Args:
+            now: Tempo atual da simulação em ms
+        """
+        if self.profile is None:
+            return
+        if self.schedule is not None:
+            # Nível de pacote: só avança o cursor nas ondas compiladas
+            due = self.schedule.due(now - self.level_start)
+            if due is not None:
+                self._spawn_scheduled(due)
+            return
+        while now >= self.next_spawn_time:
+            self.spawn_item()
+            self.next_spawn_time += self.profile.spawn_interval
 
+    @traced('spawn_item', 'spawn')
     def spawn_item(self):
         """
-        Cria múltiplos itens aleatórios de uma vez, baseado nas configurações.
-        Gera entre 2 a 4 itens por chamada para um jogo mais dinâmico.
+        Cria uma onda de itens aleatórios de uma vez, baseado nas configurações.
+        Gera entre profile.wave_size itens por chamada para um jogo mais dinâmico.
         """
-        current_time = pg.time.get_ticks()
-        
-        # Verifica se já passou tempo suficiente desde o último spawn
-        if current_time - self.last_spawn_time < self.spawn_delay:
+        if self.profile is None:
             return
-            
-        # Atualiza o tempo do último spawn
-        self.last_spawn_time = current_time
-        
-        # Gera entre 2 a 4 itens por chamada
-        num_items = random.randint(2, 4)
-        
-        # Prepara a lista de tipos de itens baseado nos pesos
-        item_types = []
-        for item_type, weight in settings.ITEM_SPAWN_WEIGHTS.items():
-            item_types.extend([item_type] * weight)
-
-        # Tenta criar até num_items itens, respeitando o limite máximo
-        for _ in range(num_items):
-            # Verifica se ainda pode adicionar mais itens
-            if len(self.game.items) >= settings.MAX_ITEMS_ON_SCREEN:
-                break
-                
-            chosen_type = random.choice(item_types)
-            new_item = None
-            
-            try:
-                if chosen_type == 'ingredient':
-                    # Filtra poções boas do POTION_DATA
-                    good_potions = [k for k, v in POTION_DATA.items() if v['type'] == 'good']
-                    if good_potions:
-                        chosen_potion = random.choice(good_potions)
-                        new_item = Ingredient(self.game, chosen_potion)
-                    else:
-                        new_item = Ingredient(self.game)  # Fallback
-
-                elif chosen_type == 'hazard':
-                    # Filtra poções ruins do POTION_DATA
-                    bad_potions = [k for k, v in POTION_DATA.items() if v['type'] == 'bad']
-                    if bad_potions:
-                        chosen_potion = random.choice(bad_potions)
-                        new_item = Hazard(self.game, chosen_potion)
-                    else:
-                        new_item = Hazard(self.game)  # Fallback
-
-                elif chosen_type == 'bomb':
-                    new_item = Bomb(self.game)
-
-                if new_item:
-                    # --- Configura a posição dentro da área de spawn ---
-                    # Escolhe de qual lado o item vai aparecer (esquerda ou direita)
-                    spawn_side = random.choice(['left', 'right'])
-                    
-                    # Adiciona variação na posição horizontal para evitar sobreposição
-                    x_offset = random.randint(0, 50)
-                    
-                    if spawn_side == 'left':
-                        # Aparece do lado esquerdo, se move para a direita
-                        new_item.rect.x = settings.SPAWN_AREA_X - new_item.rect.width - x_offset
-                        new_item.speed_x = random.randrange(settings.ITEM_SPEED_MIN, settings.ITEM_SPEED_MAX)
-                    else:
-                        # Aparece do lado direito, se move para a esquerda
-                        new_item.rect.x = settings.SPAWN_AREA_X + settings.SPAWN_AREA_WIDTH + x_offset
-                        new_item.speed_x = -random.randrange(settings.ITEM_SPEED_MIN, settings.ITEM_SPEED_MAX)
-
-                    # Define a posição Y para aparecer apenas abaixo da área do jogador (390px)
-                    # Adiciona mais variação na posição vertical
-                    min_y = settings.ARENA_FLOOR_Y + 10  # 10px abaixo do chão da arena
-                    max_y = settings.WINDOW_HEIGHT - new_item.rect.height - 10  # 10px de margem do fundo
-                    
-                    # Garante que max_y não seja menor que min_y
-                    if max_y < min_y:
-                        max_y = min_y
-                        
-                    # Se ainda assim estiver acima da área permitida, força para o mínimo
-                    if min_y < settings.ARENA_FLOOR_Y:
-                        min_y = settings.ARENA_FLOOR_Y
-                        
-                    # Distribui os itens verticalmente para evitar sobreposição
-                    vertical_step = (max_y - min_y) / num_items
-                    base_y = min_y + vertical_step * _
-                    new_item.rect.y = int(random.uniform(base_y, min(base_y + vertical_step, max_y)))
-
-                    # Adiciona um pouco de variação na velocidade para criar mais dinâmica
-                    if random.random() > 0.5:  # 50% de chance de ajustar a velocidade
-                        new_item.speed_x *= random.uniform(0.8, 1.2)
-
-                    # Adiciona aos grupos
-                    self.game.all_sprites.add(new_item)
-                    self.game.items.add(new_item)
-
-                    if settings.DEBUG:
-                        item_name = getattr(new_item, 'potion_file_name', chosen_type)
-                        print(f"Item criado: {chosen_type} ({item_name}) na posição ({new_item.rect.x}, {new_item.rect.y})")
-
-            except Exception as e:
-                print(f"Erro ao criar item {chosen_type}: {e}")
 
-    def cleanup_off_screen_items(self):
+        # Respeita o limite máximo de itens na tela
+        wave_min, wave_max = self.profile.wave_size
+        num_items = int(self.director.rng.integers(wave_min, wave_max + 1))
+        num_items = min(num_items, self.profile.max_items - len(self.game.items))
+        if num_items <= 0:
+            return
+
+        # O diretor puxa parte dos ingredientes para a próxima poção da receita
+        self.director.set_next_required(self._next_required_potion())
+
+        wave = self.director.plan_wave(num_items)
+        slots = self.game.items.spawn_many(wave.x, wave.y, wave.speed_x, wave.kind,
+                                           wave.sprite_id, wave.potion_id,
+                                           wave.pattern, wave.p0, wave.p1, wave.phase)
+        self.game.telemetry.count_spawns(self.game.items.kind[slots])
+
+        if slots.size:
+            log.debug("Onda de spawn: %s itens (tipos %s)", slots.size, wave.kind)
+
+    @traced('spawn_scheduled', 'spawn')
+    def _spawn_scheduled(self, due):
+        """Cria o trecho 'due' das ondas compiladas, respeitando o limite de itens."""
+        schedule = self.schedule
+        room = self.profile.max_items - len(self.game.items)
+        if room <= 0:
+            return
+        due = slice(due.start, min(due.stop, due.start + room))
+        pattern = schedule.pattern[due] if schedule.pattern is not None else None
+        slots = self.game.items.spawn_many(schedule.x[due], schedule.y[due], schedule.speed_x[due],
+                                   schedule.kind[due], schedule.sprite_id[due], schedule.potion_id[due],
+                                   pattern,
+                                   schedule.p0[due] if pattern is not None else None,
+                                   schedule.p1[due] if pattern is not None else None,
+                                   schedule.phase[due] if pattern is not None else None)
+        self.game.telemetry.count_spawns(self.game.items.kind[slots])
+
+    def start_level(self, profile, now=0, schedule=None):
         """
-        Remove itens que saíram completamente da tela.
+        Prepara o diretor de spawn e agenda a primeira onda de um nível.
 
-        Se não vai ficando muito pesado e acaba travando
+        Args:
+            profile: DifficultyProfile do nível (cadência, velocidades, pesos, limites)
+            now: Tempo atual da simulação em ms
+            schedule: LevelSchedule do pacote de níveis (None = ondas sorteadas)
+        """
+        if not self.director.entry_kind.size:
+            self.prewarm()
+        self.profile = profile
+        self.schedule = schedule
+        self.level_start = now
+        self.director.configure(profile)
+        self.next_spawn_time = now + profile.first_wave_delay
+
+    def _next_required_potion(self):
+        """Retorna o id da próxima poção da receita do nível atual (ou None)."""
+        level_manager = getattr(self.game, 'level_manager', None)
+        if level_manager is None or level_manager.level_complete:
+            return None
+        required = level_manager.required_potions
+        collected = len(level_manager.collected_potions)
+        return required[collected] if collected < len(required) else None
+
+    def prewarm(self):
         """
-        margin = 100  # Margem além da tela para garantir que o item saiu completamente
+        Carrega antes do nível começar os protótipos de todos os tipos de item.
 
-        for item in list(self.game.items):  # Cria uma cópia da lista para iteração segura
-            if (item.rect.right < -margin or
-                    item.rect.left > self.game.WINDOW_WIDTH + margin or
-                    item.rect.bottom < -margin or
-                    item.rect.top > self.game.WINDOW_HEIGHT + margin):
+        Assim nenhum spawn precisa ler imagens do disco no meio do jogo; o
+        próprio motor de itens já funciona como pool pré-alocado de slots.
+        """
+        entries = []
+        for potion_id, potion_name in enumerate(CATALOG.names):
+            kind = KIND_INGREDIENT if CATALOG.is_good(potion_id) else KIND_HAZARD
+            entries.append(self._entry(kind, potion_name))
+        entries.append(self._entry(KIND_BOMB))
+
+        # O catálogo só muda se algum protótipo novo foi carregado
+        if len(entries) != self.director.entry_kind.size:
+            self.director.set_entries(entries)
+        self.entries = entries
+
+    def _entry(self, kind, potion_name=None):
+        """Monta a entrada do catálogo do diretor para um tipo de item."""
+        sprite_id = self._get_sprite(kind, potion_name)
+        width, height = self.game.items.sprite_size(sprite_id)
+
+        # O protótipo sabe qual poção foi carregada de fato
+        prototype = self.game.items.prototypes[sprite_id]
+        potion_id = CATALOG.id_of(getattr(prototype, 'potion_file_name', None))
+        return kind, potion_name, sprite_id, potion_id, width, height
+
+    def _get_sprite(self, kind, potion_name=None):
+        """
+        Retorna o id do sprite de um tipo de item, criando o protótipo na primeira vez.
 
-                # Remove o item de todos os grupos
-                item.kill()
+        Cada combinação (tipo, poção) é carregada do disco uma única vez; todos os
+        itens daquele tipo compartilham a mesma imagem e máscara no motor.
+
+        Args:
+            kind: Tipo do item (KIND_INGREDIENT, KIND_HAZARD ou KIND_BOMB)
+            potion_name: Nome do arquivo da poção (None para bombas)
+
+        Returns:
+            int: Id do sprite registrado no motor de itens
+        """
+        key = (kind, potion_name)
+        sprite_id = self._sprite_ids.get(key)
+        if sprite_id is None:
+            if kind == KIND_INGREDIENT:
+                prototype = Ingredient(self.game, potion_name)
+                hitbox = CATALOG.hitboxes[CATALOG.id_of(prototype.potion_file_name)]
+            elif kind == KIND_HAZARD:
+                prototype = Hazard(self.game, potion_name)
+                hitbox = CATALOG.hitboxes[CATALOG.id_of(prototype.potion_file_name)]
+            else:
+                prototype = Bomb(self.game)
+                hitbox = BOMB_HITBOX
+            sprite_id = self.game.items.register_sprite(prototype, hitbox)
+            self._sprite_ids[key] = sprite_id
+        return sprite_id
+
+    def cleanup_off_screen_items(self):
+        """
+        Remove itens que saíram completamente da tela.
+
+        O motor de itens já faz isso em ItemEngine.step(); este método só força
+        uma passada extra (vetorizada) quando necessário.
+        """
+        removed = self.game.items.cull()
+        self.game.telemetry.add('items.culled', removed)
 
-                # Debug opcional
-                if settings.DEBUG:
-                    print(f"Item removido por sair da tela: {type(item).__name__}")
\ No newline at end of file
+        # Debug opcional
+        if removed:
+            log.debug("Itens removidos por sair da tela: %s", removed)
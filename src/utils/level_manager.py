@@ -1,7 +1,13 @@
 import random
 from typing import List, Dict, Tuple, Optional
 import pygame as pg
-from src.data.potions import good_potions, POTION_DATA
+from src import settings
+from src.data.potion_catalog import CATALOG
+from src.data.difficulty import DifficultyProfile, difficulty_for, recipe_length_for
+from src.utils.recipe_engine import Recipe, RecipeAutomaton
+from src.utils.log import get_logger
+
+log = get_logger(__name__)
 
 class LevelManager:
     """
@@ -11,38 +17,44 @@ class LevelManager:
     - Nível 10: Receitas com 4 ingredientes
     - Erros só são contados quando o jogador pega um item fora de ordem
     - A cada nível, a velocidade dos itens aumenta
+    
+    As receitas do nível (uma ou várias, ordenadas ou não) são compiladas num
+    RecipeAutomaton e andam ao mesmo tempo; recipe_rows tem o progresso de
+    cada receita ativa (o HUD mostra todas) e required_potions e
+    collected_potions repetem a mais adiantada.
     """
     
     def __init__(self):
         self.current_level = 1
-        self.required_potions: List[str] = []
-        self.collected_potions: List[str] = []
+        self.required_potions: List[int] = []   # Ids das poções da receita (CATALOG)
+        self.collected_potions: List[int] = []  # Ids das poções já coletadas
+        self.recipe_rows: List[Tuple[List[int], int]] = []  # (ids, coletadas) de cada receita ativa
+        self.recipes: List[Recipe] = []          # Receitas que ainda faltam no nível
+        self.completed_recipes: List[Recipe] = []
+        self.automaton: Optional[RecipeAutomaton] = None
         self.level_complete = False
         self.font = pg.font.Font(None, 30)
-        self.base_speed = 1.0  # Velocidade base dos itens que caem
-        self.level_speed_increase = 0.1  # Aumento de velocidade por nível
+        self.profile: Optional[DifficultyProfile] = None  # Perfil de dificuldade do nível
         
     def get_recipe_length(self, level: int) -> int:
         """Retorna o número de ingredientes necessários para o nível atual."""
-        if level >= 10:
-            return 4
-        elif level >= 5:
-            return 3
-        else:
-            return 2
+        if self.profile is not None and self.profile.level == level:
+            return self.profile.recipe_length
+        return recipe_length_for(level)
             
     def get_fall_speed(self) -> float:
-        """Retorna a velocidade de queda dos itens para o nível atual."""
-        return self.base_speed + (self.current_level - 1) * self.level_speed_increase
+        """Retorna o multiplicador de velocidade dos itens para o nível atual."""
+        profile = self.profile or difficulty_for(self.current_level)
+        return profile.speed_scale
     
-    def generate_level_requirements(self, level: int) -> List[str]:
+    def generate_level_requirements(self, level: int) -> List[int]:
         """
-        Gera uma lista de poções necessárias para completar o nível.
+        Gera uma lista de poções (ids) necessárias para completar o nível.
         """
         num_potions = self.get_recipe_length(level)
         
-        # Usa todas as poções disponíveis
-        available_potions = good_potions.copy()
+        # Usa todas as poções boas disponíveis
+        available_potions = list(CATALOG.good_ids)
         
         # Se não houver poções suficientes, repete algumas
         if len(available_potions) < num_potions:
@@ -53,47 +65,96 @@ class LevelManager:
         
         return required
     
-    def start_level(self, level: int):
+    def generate_recipes(self, level: int) -> List[Recipe]:
+        """
+        Gera as receitas do nível segundo o perfil de dificuldade
+        (quantidade de receitas e se a ordem importa).
+        """
+        profile = self.profile or difficulty_for(level)
+        return [Recipe(self.generate_level_requirements(level), ordered=profile.recipe_ordered)
+                for _ in range(profile.recipe_count)]
+    
+    def set_recipes(self, recipes: List[Recipe]):
+        """
+        Define as receitas ativas e compila o autômato.
+
+        Args:
+            recipes: Receitas ativas
+        """
+        self.recipes = list(recipes)
+        self.automaton = RecipeAutomaton(self.recipes, mistake_mode=settings.RECIPE_MISTAKE_MODE) \
+            if self.recipes else None
+        self._sync_progress()
+    
+    def _sync_progress(self):
+        """Atualiza as listas exibidas pelo HUD a partir do estado do autômato."""
+        if self.automaton is None:
+            self.collected_potions = list(self.required_potions) if self.level_complete else []
+            self.recipe_rows = [(self.required_potions, len(self.collected_potions))] \
+                if self.required_potions else []
+            return
+        self.recipe_rows = [(path, done) for _, path, done in self.automaton.progress()]
+        path, done = self.recipe_rows[0]
+        self.required_potions = path
+        self.collected_potions = path[:done]
+    
+    def start_level(self, level: int, profile: Optional[DifficultyProfile] = None,
+                    recipes: Optional[List[Recipe]] = None):
         """
         Inicia um novo nível com uma nova sequência de poções.
+        
+        Args:
+            level: Número do nível
+            profile: Perfil de dificuldade do nível (padrão: tabela compartilhada)
+            recipes: Receitas prontas (ex: de um pacote de níveis); padrão: sorteadas
         """
         self.current_level = level
-        self.required_potions = self.generate_level_requirements(level)
-        self.collected_potions = []
+        self.profile = profile or difficulty_for(level)
         self.level_complete = False
+        self.completed_recipes = []
+        self.set_recipes(recipes or self.generate_recipes(level))
         
-        print(f"[NÍVEL {level}] Iniciando com {len(self.required_potions)} ingredientes")
-        print(f"[NÍVEL {level}] Velocidade: {self.get_fall_speed():.1f}x")
+        log.info("[NÍVEL %s] Iniciando com %d receita(s) de %d ingredientes",
+                 level, len(self.recipes), len(self.required_potions))
+        log.info("[NÍVEL %s] Velocidade: %.1fx", level, self.get_fall_speed())
     
-    def register_potion_collected(self, potion_name: str) -> Tuple[bool, bool]:
+    def register_potion_collected(self, potion_id: int) -> Tuple[bool, bool]:
         """
-        Registra uma poção coletada e verifica se está na ordem correta.
+        Registra uma poção coletada (pelo id) e verifica se está na ordem correta.
         
         Retorna:
             (acertou, level_complete)
             - acertou: True se a poção está na ordem correta
             - level_complete: True se o nível foi completado
         """
-        if self.level_complete or not self.required_potions:
+        if self.level_complete or self.automaton is None:
             return False, False
             
-        # Verifica se é a próxima poção correta
-        next_required = self.required_potions[len(self.collected_potions)]
+        # Avança todas as receitas ativas que aceitam a poção
+        correct, completed = self.automaton.feed(potion_id)
         
-        if potion_name == next_required:
-            # Acertou na ordem correta
-            self.collected_potions.append(potion_name)
-            
-            # Verifica se completou o nível
-            if len(self.collected_potions) == len(self.required_potions):
+        if completed >= 0:
+            # Uma receita foi completada; as restantes continuam com o progresso
+            # que já tinham (nada é recompilado)
+            self.completed_recipes.append(self.automaton.recipes[completed])
+            self.recipes = self.automaton.remaining_recipes()
+            if not self.recipes:
+                # Mostra a última receita inteira como coletada
+                self.required_potions = self.automaton.last_path
+                self.automaton = None
                 self.level_complete = True
+                self._sync_progress()
                 return True, True  # Nível completo sem falha
-                
+            self._sync_progress()
+            return True, False
+        
+        self._sync_progress()
+        if correct:
             return True, False  # Item correto, mas nível não completo
-        else:
-            # Errou a ordem - apenas retorna que houve falha sem afetar vidas
-            print("[ERRO] Ordem incorreta! Tente novamente.")
-            return False, False
+        
+        # Errou a ordem - apenas retorna que houve falha sem afetar vidas
+        log.debug("[ERRO] Ordem incorreta! Tente novamente.")
+        return False, False
     
     def get_level_progress(self) -> Tuple[int, int]:
         """Retorna (poções coletadas, total de poções necessárias)."""
@@ -112,6 +173,6 @@ class LevelManager:
         # Poções necessárias
         for i, potion in enumerate(self.required_potions):
             color = (0, 255, 0) if i < len(self.collected_potions) else (255, 255, 255)
-            potion_name = POTION_DATA.get(potion, {}).get('effect', f'Poção {i+1}')
+            potion_name = CATALOG.effects[potion] or f'Poção {i+1}'
             text = self.font.render(f"{i+1}. {potion_name}", True, color)
             screen.blit(text, (x, y + 70 + i * 25))
@@ -0,0 +1,312 @@
+"""
+Pacotes de níveis do jogo Perfect Potion.
+
+Um pacote é um arquivo JSON (assets/levels/<nome>.json) que descreve, para
+cada nível, as receitas, a dificuldade e as ondas de spawn. Cada nível é
+compilado uma única vez em arrays de spawn ordenados pelo tempo; durante o
+jogo o spawner só avança um cursor nesses arrays, sem nenhum sorteio.
+
+Formato:
+    {
+      "name": "tutorial",
+      "seed": 7,
+      "levels": [
+        {
+          "level": 1,
+          "duration_ms": 8000,          # Tamanho do ciclo de ondas
+          "background": "background/4/2.png",
+          "loop": true,                 # Recomeça as ondas ao fim do ciclo
+          "difficulty": {"speed_scale": 1.0, "max_items": 12},
+          "recipes": [{"steps": ["potion_1.png", ["potion_2.png", "potion_4.png"]],
+                       "ordered": true}],
+          "waves": [
+            {"at": 500, "items": [{"kind": "ingredient", "potion": "potion_1.png",
+                                   "side": "left", "lane": 0.3, "speed": 4,
+                                   "pattern": "sine"}]},
+            {"every": 2000, "from": 1500, "random": 3}
+          ]
+        }
+      ]
+    }
+
+Ondas "random" são sorteadas na compilação pelo SpawnDirector com a semente
+do pacote, então o resultado é o mesmo em toda partida. Os níveis são
+compilados sob demanda, no máximo um nível à frente do atual.
+"""
+import dataclasses
+import json
+import os
+import numpy as np
+from src import settings
+from src.data.difficulty import DifficultyProfile, build_profile
+from src.data.potion_catalog import CATALOG, NO_POTION
+from src.utils.item_engine import KIND_BOMB
+from src.utils.movement import PATTERN_NAMES, PATTERN_LINEAR, pattern_params
+from src.utils.recipe_engine import Recipe
+from src.utils.spawn_director import KIND_NAMES, SpawnDirector, SpawnWave
+
+# Campos do DifficultyProfile que não podem vir do pacote (derivados das receitas)
+_DERIVED_FIELDS = ('level', 'recipe_length', 'recipe_count', 'recipe_ordered')
+
+
+class LevelSchedule:
+    """
+    Ondas de um nível compiladas em arrays paralelos ordenados por 'time'.
+
+    due(t) devolve o trecho dos arrays que vence até o instante t (ms desde
+    o início do nível); com 'loop', o ciclo recomeça a cada 'duration' ms.
+    """
+
+    __slots__ = ('time', 'x', 'y', 'speed_x', 'kind', 'sprite_id', 'potion_id',
+                 'pattern', 'p0', 'p1', 'phase', 'duration', 'loop', 'cursor', 'offset')
+
+    def __init__(self, time, x, y, speed_x, kind, sprite_id, potion_id,
+                 pattern, p0, p1, phase, duration, loop=True):
+        self.time = time
+        self.x = x
+        self.y = y
+        self.speed_x = speed_x
+        self.kind = kind
+        self.sprite_id = sprite_id
+        self.potion_id = potion_id
+        self.pattern = pattern
+        self.p0 = p0
+        self.p1 = p1
+        self.phase = phase
+        self.duration = duration
+        self.loop = loop
+        self.reset()
+
+    def __len__(self):
+        return self.time.size
+
+    def reset(self):
+        """Volta o cursor para o início do nível."""
+        self.cursor = 0
+        self.offset = 0.0  # Início do ciclo atual (ms desde o início do nível)
+
+    def due(self, elapsed):
+        """
+        Avança o cursor até o instante 'elapsed'.
+
+        Args:
+            elapsed: ms desde o início do nível
+
+        Returns:
+            slice ou None: Trecho dos arrays a ser criado agora
+        """
+        start = self.cursor
+        end = int(np.searchsorted(self.time, elapsed - self.offset, side='right'))
+        if end == self.time.size and self.loop and self.duration > 0 and \
+                elapsed - self.offset >= self.duration:
+            # Fim do ciclo: o que sobrou sai agora e o próximo ciclo começa
+            self.offset += self.duration
+            self.cursor = 0
+        else:
+            self.cursor = end
+        return slice(start, end) if end > start else None
+
+
+class LevelPack:
+    """Pacote de níveis carregado de um JSON, compilado nível a nível sob demanda."""
+
+    def __init__(self, path):
+        """
+        Args:
+            path: Caminho do arquivo JSON do pacote
+        """
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        self.name = data.get('name', os.path.splitext(os.path.basename(path))[0])
+        self.seed = int(data.get('seed', 0))
+        self.levels = {int(level['level']): level for level in data.get('levels', [])}
+        self._recipes = {}
+        self._profiles = {}
+        self._schedules = {}  # nível -> LevelSchedule (no máximo o atual e o próximo)
+
+    @classmethod
+    def load(cls, name):
+        """Carrega o pacote assets/levels/<name>.json."""
+        return cls(os.path.join(settings.ASSETS_DIR, 'levels', f'{name}.json'))
+
+    def __len__(self):
+        return len(self.levels)
+
+    def has_level(self, level):
+        return level in self.levels
+
+    def background(self, level):
+        """Caminho do fundo do nível ('background', relativo a assets/images), ou None."""
+        name = self.levels.get(level, {}).get('background')
+        return os.path.join(settings.ASSETS_DIR, 'images', name) if name else None
+
+    def recipes(self, level):
+        """Receitas do nível como Recipe sobre os ids do catálogo."""
+        if level not in self._recipes:
+            self._recipes[level] = [
+                Recipe([self._potion_step(step, level) for step in recipe['steps']],
+                       ordered=recipe.get('ordered', True), name=recipe.get('name'))
+                for recipe in self.levels[level].get('recipes', [])
+            ]
+        return self._recipes[level]
+
+    def profile(self, level):
+        """
+        DifficultyProfile do nível: o perfil padrão com os campos do pacote por cima.
+        """
+        if level not in self._profiles:
+            overrides = dict(self.levels[level].get('difficulty', {}))
+            for name in overrides:
+                if name in _DERIVED_FIELDS or name not in DifficultyProfile.__dataclass_fields__:
+                    raise ValueError(f"Pacote '{self.name}', nível {level}: campo de dificuldade inválido '{name}'")
+            if 'wave_size' in overrides:
+                overrides['wave_size'] = tuple(overrides['wave_size'])
+            if 'spawn_weights' in overrides:
+                overrides['spawn_weights'] = tuple(overrides['spawn_weights'].items())
+            if 'movement_patterns' in overrides:
+                overrides['movement_patterns'] = tuple(sorted(
+                    (kind, tuple(weights.items())) for kind, weights in overrides['movement_patterns'].items()))
+
+            recipes = self.recipes(level)
+            if recipes:
+                overrides['recipe_length'] = max(len(r) for r in recipes)
+                overrides['recipe_count'] = len(recipes)
+                overrides['recipe_ordered'] = all(r.ordered for r in recipes)
+            self._profiles[level] = dataclasses.replace(build_profile(level), **overrides)
+        return self._profiles[level]
+
+    def schedule(self, level, entries):
+        """
+        Ondas compiladas do nível (compila na primeira vez).
+
+        Args:
+            level: Número do nível
+            entries: Catálogo de entradas do ItemSpawner (mesmo formato de SpawnDirector.set_entries)
+        """
+        schedule = self._schedules.get(level)
+        if schedule is None:
+            schedule = self._schedules[level] = self.compile(level, entries)
+        # Mantém só o nível atual e o próximo
+        for old in [l for l in self._schedules if l not in (level, level + 1)]:
+            del self._schedules[old]
+        schedule.reset()
+        return schedule
+
+    def prefetch(self, level, entries):
+        """Compila um nível antes de ele começar (se existir no pacote)."""
+        if self.has_level(level) and level not in self._schedules:
+            self._schedules[level] = self.compile(level, entries)
+
+    def compile(self, level, entries):
+        """
+        Compila as ondas de um nível em arrays de spawn ordenados pelo tempo.
+
+        Returns:
+            LevelSchedule
+        """
+        data = self.levels[level]
+        profile = self.profile(level)
+        rng = np.random.default_rng((self.seed, level))
+        director = SpawnDirector(rng)
+        director.set_entries(entries)
+        director.configure(profile)
+        bomb_entry = next((i for i, e in enumerate(entries) if e[0] == KIND_BOMB), -1)
+
+        duration = float(data.get('duration_ms', 0))
+        hints = [p for r in self.recipes(level) for p in r.hint()]
+        parts = []
+        for wave in data.get('waves', []):
+            for index, at in enumerate(self._wave_times(wave, duration, level)):
+                if 'random' in wave:
+                    # Puxa os ingredientes para as poções das receitas, em ciclo
+                    director.set_next_required(hints[index % len(hints)] if hints else None)
+                    planned = director.plan_wave(int(wave['random']))
+                else:
+                    planned = self._explicit_wave(wave.get('items', []), entries, bomb_entry, profile, level)
+                parts.append((np.full(len(planned), at, dtype=np.float64), planned))
+
+        if not parts:
+            empty = np.zeros(0)
+            return LevelSchedule(empty, empty, empty, empty, empty.astype(np.int8), empty.astype(np.int16),
+                                 empty.astype(np.int16), empty.astype(np.int8), empty, empty, empty, duration,
+                                 data.get('loop', True))
+
+        def column(name, default_dtype):
+            arrays = []
+            for times, planned in parts:
+                value = getattr(planned, name)
+                arrays.append(value if value is not None else np.zeros(times.size, dtype=default_dtype))
+            return np.concatenate(arrays)
+
+        time = np.concatenate([times for times, _ in parts])
+        order = np.argsort(time, kind='stable')
+        columns = [column(name, dtype)[order] for name, dtype in (
+            ('x', np.float32), ('y', np.float32), ('speed_x', np.float32), ('kind', np.int8),
+            ('sprite_id', np.int16), ('potion_id', np.int16), ('pattern', np.int8),
+            ('p0', np.float32), ('p1', np.float32), ('phase', np.float32))]
+        duration = duration or float(time.max()) + 1
+        return LevelSchedule(time[order], *columns, duration=duration, loop=data.get('loop', True))
+
+    def _wave_times(self, wave, duration, level):
+        """Instantes (ms) de uma onda: 'at' único ou 'every' de 'from' até 'until'."""
+        if 'every' in wave:
+            every = float(wave['every'])
+            if every <= 0:
+                raise ValueError(f"Pacote '{self.name}', nível {level}: 'every' precisa ser positivo")
+            start = float(wave.get('from', 0))
+            until = float(wave.get('until', duration or start + every))
+            return list(np.arange(start, until, every))
+        return [float(wave.get('at', 0))]
+
+    def _explicit_wave(self, items, entries, bomb_entry, profile, level):
+        """Monta uma onda a partir dos itens descritos no pacote."""
+        count = len(items)
+        entry = np.empty(count, dtype=np.intp)
+        left = np.empty(count, dtype=bool)
+        lane = np.empty(count, dtype=np.float64)
+        speed = np.empty(count, dtype=np.float64)
+        pattern = np.empty(count, dtype=np.int8)
+        entry_of = {(e[0], e[3]): i for i, e in enumerate(entries)}
+        for i, item in enumerate(items):
+            kind = KIND_NAMES.get(item.get('kind'))
+            if kind is None:
+                raise ValueError(f"Pacote '{self.name}', nível {level}: tipo de item inválido {item.get('kind')!r}")
+            if kind == KIND_BOMB:
+                entry[i] = bomb_entry
+            else:
+                entry[i] = entry_of.get((kind, self._potion_id(item.get('potion'), level)), -1)
+            if entry[i] < 0:
+                raise ValueError(f"Pacote '{self.name}', nível {level}: item sem sprite {item}")
+            left[i] = item.get('side', 'left') == 'left'
+            lane[i] = item.get('lane', (i + 0.5) / count)
+            speed[i] = item.get('speed', (profile.speed_min + profile.speed_max) / 2)
+            pattern[i] = PATTERN_NAMES[item.get('pattern', 'linear')]
+
+        width = np.array([entries[e][4] for e in entry], dtype=np.float32)
+        height = np.array([entries[e][5] for e in entry], dtype=np.float32)
+        x = np.where(left, settings.SPAWN_AREA_X - width, settings.SPAWN_AREA_X + settings.SPAWN_AREA_WIDTH)
+        min_y = settings.ARENA_FLOOR_Y + 10
+        max_y = np.maximum(settings.WINDOW_HEIGHT - height - 10, min_y)
+        y = np.floor(min_y + (max_y - min_y) * np.clip(lane, 0.0, 1.0))
+        speed_x = speed * profile.speed_scale
+        speed_x = np.where(left, speed_x, -speed_x)
+        p0, p1 = pattern_params(pattern, profile.speed_scale)
+        has_pattern = bool(np.any(pattern != PATTERN_LINEAR))
+
+        return SpawnWave(x, y, speed_x,
+                         np.array([entries[e][0] for e in entry], dtype=np.int8),
+                         np.array([entries[e][2] for e in entry], dtype=np.int16),
+                         np.array([entries[e][3] for e in entry], dtype=np.int16),
+                         *((pattern, p0, p1, np.zeros(count, dtype=np.float32)) if has_pattern else ()))
+
+    def _potion_id(self, name, level):
+        potion_id = CATALOG.id_of(name)
+        if potion_id == NO_POTION:
+            raise ValueError(f"Pacote '{self.name}', nível {level}: poção desconhecida {name!r}")
+        return potion_id
+
+    def _potion_step(self, step, level):
+        """Um passo de receita: nome ou lista de nomes alternativos."""
+        if isinstance(step, list):
+            return tuple(self._potion_id(name, level) for name in step)
+        return self._potion_id(step, level)
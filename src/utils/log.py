@@ -0,0 +1,183 @@
+"""
+Logs do jogo Perfect Potion.
+
+Camada fina sobre o módulo logging da biblioteca padrão:
+- O nível vem de settings.LOG_LEVEL; mensagens abaixo dele são descartadas
+  antes de qualquer formatação (use log.debug("x=%s", x), não f-strings).
+- Mensagens habilitadas não são escritas na hora: o registro vai para um
+  buffer circular em memória e uma thread de fundo formata e escreve tudo a
+  cada settings.LOG_FLUSH_INTERVAL segundos. O loop do jogo nunca espera por
+  escrita no terminal ou em arquivo.
+- Campos estruturados podem ir em extra={'fields': {...}} e saem como
+  chave=valor no fim da linha.
+
+Uso:
+    from src.utils.log import get_logger
+    log = get_logger(__name__)
+    log.debug("Onda de spawn: %d itens", count)
+"""
+import atexit
+import logging
+import sys
+import threading
+from collections import deque
+from src import settings
+
+LOGGER_NAME = 'perfect_potion'
+
+_handler = None
+
+
+class StructuredFormatter(logging.Formatter):
+    """Formato de linha única com os campos de extra={'fields': ...} no fim."""
+
+    def __init__(self):
+        super().__init__('%(asctime)s %(levelname)-7s %(name)s: %(message)s', '%H:%M:%S')
+
+    def format(self, record):
+        line = super().format(record)
+        fields = getattr(record, 'fields', None)
+        if fields:
+            line += ' ' + ' '.join(f'{key}={value}' for key, value in fields.items())
+        return line
+
+
+class RingBufferHandler(logging.Handler):
+    """
+    Guarda os registros num buffer circular e os escreve numa thread de fundo.
+
+    Se o buffer encher antes de ser esvaziado, os registros mais antigos são
+    descartados e contados em 'dropped'; a escrita seguinte começa com um
+    aviso de quantos se perderam. Erros acordam a thread na hora.
+    """
+
+    def __init__(self, targets, capacity=None, interval=None):
+        """
+        Args:
+            targets: Handlers que formatam e escrevem (terminal, arquivo)
+            capacity: Tamanho do buffer (padrão: settings.LOG_BUFFER_SIZE)
+            interval: Segundos entre escritas (padrão: settings.LOG_FLUSH_INTERVAL)
+        """
+        super().__init__()
+        self.targets = targets
+        self.records = deque(maxlen=capacity or settings.LOG_BUFFER_SIZE)
+        self.interval = interval or settings.LOG_FLUSH_INTERVAL
+        self.dropped = 0
+        self._reported = 0  # Descartes já avisados na saída
+        self._wake = threading.Event()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name='log-flush', daemon=True)
+        self._thread.start()
+
+    def emit(self, record):
+        # Só guarda o registro; a formatação fica para a thread de fundo
+        if len(self.records) == self.records.maxlen:
+            self.dropped += 1
+        self.records.append(record)
+        if record.levelno >= logging.ERROR:
+            self._wake.set()
+
+    def _run(self):
+        while not self._closed:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            self.flush()
+
+    def flush(self):
+        """Escreve tudo o que está no buffer (antes, o aviso de descartes novos)."""
+        dropped = self.dropped
+        if dropped > self._reported:
+            self._write(self._dropped_record(dropped - self._reported))
+            self._reported = dropped
+        records = self.records
+        while records:
+            try:
+                record = records.popleft()
+            except IndexError:
+                break
+            self._write(record)
+        for target in self.targets:
+            target.flush()
+
+    def _write(self, record):
+        for target in self.targets:
+            if record.levelno >= target.level:
+                target.handle(record)
+
+    def _dropped_record(self, count):
+        """Registro de aviso com a quantidade de registros perdidos desde o último aviso."""
+        return logging.LogRecord(f'{LOGGER_NAME}.log', logging.WARNING, __file__, 0,
+                                 "%d registro(s) de log descartado(s): buffer cheio (settings.LOG_BUFFER_SIZE=%d)",
+                                 (count, self.records.maxlen), None)
+
+    def close(self):
+        """Para a thread e escreve o que sobrou."""
+        if not self._closed:
+            self._closed = True
+            self._wake.set()
+            self._thread.join(timeout=1.0)
+            self.flush()
+            for target in self.targets:
+                target.close()
+        super().close()
+
+
+def configure(level=None, log_file=None):
+    """
+    Configura o logger do jogo (chamado automaticamente por get_logger).
+
+    Args:
+        level: Nível mínimo (padrão: settings.LOG_LEVEL)
+        log_file: Arquivo extra de log (padrão: settings.LOG_FILE; None = só terminal)
+    """
+    global _handler
+    logger = logging.getLogger(LOGGER_NAME)
+    logger.setLevel(level or settings.LOG_LEVEL)
+    logger.propagate = False
+    if _handler is not None:
+        logger.removeHandler(_handler)
+        _handler.close()
+
+    formatter = StructuredFormatter()
+    targets = [logging.StreamHandler(sys.stdout)]
+    log_file = log_file or settings.LOG_FILE
+    if log_file:
+        targets.append(logging.FileHandler(log_file, encoding='utf-8'))
+    for target in targets:
+        target.setFormatter(formatter)
+
+    _handler = RingBufferHandler(targets)
+    logger.addHandler(_handler)
+    return logger
+
+
+def get_logger(name):
+    """
+    Retorna o logger de um módulo (filho de 'perfect_potion').
+
+    Args:
+        name: Normalmente __name__ (ex: 'src.items.bomb' vira 'perfect_potion.items.bomb')
+    """
+    if _handler is None:
+        configure()
+    if name.startswith('src.'):
+        name = name[4:]
+    return logging.getLogger(f'{LOGGER_NAME}.{name}')
+
+
+def flush():
+    """Escreve agora tudo o que está no buffer (ex: antes de encerrar)."""
+    if _handler is not None:
+        _handler.flush()
+
+
+def shutdown():
+    """Para a thread de escrita e esvazia o buffer."""
+    global _handler
+    if _handler is not None:
+        logging.getLogger(LOGGER_NAME).removeHandler(_handler)
+        _handler.close()
+        _handler = None
+
+
+atexit.register(shutdown)
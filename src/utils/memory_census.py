@@ -0,0 +1,191 @@
+"""
+Censo de memória do jogo Perfect Potion (para quiosques que ficam ligados dias).
+
+Em pontos fixos da partida (start_level, next_level, game_over,
+cleanup_game) o censo:
+- tira um snapshot do tracemalloc e compara com o anterior, agrupado por
+  arquivo (o subsistema que cresceu aparece no topo);
+- conta as pg.Surface vivas por tamanho e por tipo do dono (o objeto que a
+  referencia, ex: Alchemist, MainMenu, dict) e compara com o censo anterior.
+
+Cada ponto vira uma linha em SAVE_DIR/settings.MEMORY_CENSUS_FILE, então
+centenas de sessões podem ser comparadas para mostrar que a memória fica
+estável.
+
+Surfaces não participam do coletor de lixo e dicionários que só guardam
+Surfaces também não são rastreados, então o censo percorre os objetos do
+gc e desce pelos contêineres não rastreados até achar as Surfaces. Com o
+tracemalloc ligado, cada ponto leva algumas centenas de ms: o censo só roda
+com settings.MEMORY_CENSUS ligado.
+"""
+import gc
+import importlib.machinery
+import json
+import os
+import tracemalloc
+import types
+import weakref
+from datetime import datetime
+import pygame as pg
+from src import settings
+from src.utils.frame_stats import ALLOCATIONS
+from src.utils.log import get_logger
+
+log = get_logger(__name__)
+
+# Tipos que não guardam Surfaces: o censo não olha o que eles referenciam
+_SKIP_TYPES = frozenset({
+    type, types.FunctionType, types.BuiltinFunctionType, types.ModuleType,
+    types.WrapperDescriptorType, types.MethodDescriptorType, types.GetSetDescriptorType,
+    types.MemberDescriptorType, property, weakref.ReferenceType, importlib.machinery.ModuleSpec,
+})
+
+
+def surface_census():
+    """
+    Conta as Surfaces alcançáveis a partir dos objetos do gc.
+
+    Returns:
+        tuple: ({'LxA@bits': [quantidade, bytes]}, {tipo do dono: quantidade})
+    """
+    # Tipo base e a subclasse de contagem (frame_stats), instalada ou não
+    surface_types = {pg.surface.Surface, pg.Surface} | ALLOCATIONS.surface_types()
+    containers = (dict, list, tuple, set)
+    is_tracked = gc.is_tracked
+    get_referents = gc.get_referents
+    seen = {}     # id -> (Surface, tipo do dono)
+    visited = set()
+    for obj in gc.get_objects():
+        if type(obj) in _SKIP_TYPES:
+            continue
+        stack = None
+        for ref in get_referents(obj):
+            kind = type(ref)
+            if kind in surface_types:
+                if id(ref) not in seen:
+                    seen[id(ref)] = (ref, type(obj).__name__)
+            elif kind in containers and not is_tracked(ref):
+                # Contêiner fora do gc (ex: dict só com Surfaces): desce nele depois
+                if stack is None:
+                    stack = []
+                stack.append(ref)
+        while stack:
+            ref = stack.pop()
+            if id(ref) in visited:
+                continue
+            visited.add(id(ref))
+            for inner in get_referents(ref):
+                kind = type(inner)
+                if kind in surface_types:
+                    if id(inner) not in seen:
+                        seen[id(inner)] = (inner, type(obj).__name__)
+                elif kind in containers and not is_tracked(inner):
+                    stack.append(inner)
+
+    by_size = {}
+    by_owner = {}
+    for surface, owner in seen.values():
+        width, height = surface.get_size()
+        key = f'{width}x{height}@{surface.get_bitsize()}'
+        entry = by_size.setdefault(key, [0, 0])
+        entry[0] += 1
+        entry[1] += surface.get_pitch() * height
+        by_owner[owner] = by_owner.get(owner, 0) + 1
+    return by_size, by_owner
+
+
+def _count_diff(previous, current):
+    """Diferença {chave: variação} só das chaves que mudaram."""
+    keys = set(previous) | set(current)
+    diff = {}
+    for key in keys:
+        before = previous.get(key, 0)
+        after = current.get(key, 0)
+        if isinstance(before, list):
+            before = before[0]
+        if isinstance(after, list):
+            after = after[0]
+        if after != before:
+            diff[key] = after - before
+    return dict(sorted(diff.items(), key=lambda kv: -abs(kv[1])))
+
+
+class MemoryCensus:
+    """Snapshots de tracemalloc e censo de Surfaces, comparados com o ponto anterior."""
+
+    def __init__(self, enabled=None, path=None, top=None):
+        """
+        Args:
+            enabled: Se o censo roda (padrão: settings.MEMORY_CENSUS)
+            path: Arquivo JSONL (padrão: SAVE_DIR/settings.MEMORY_CENSUS_FILE)
+            top: Quantos arquivos mostrar na diferença (padrão: settings.MEMORY_CENSUS_TOP)
+        """
+        self.enabled = settings.MEMORY_CENSUS if enabled is None else enabled
+        self.path = path or os.path.join(settings.SAVE_DIR, settings.MEMORY_CENSUS_FILE)
+        self.top = top or settings.MEMORY_CENSUS_TOP
+        self.checkpoints = 0
+        self._snapshot = None
+        self._sizes = {}
+        self._owners = {}
+
+    def start(self):
+        """Liga o tracemalloc (o quanto antes, para ver todas as alocações)."""
+        if self.enabled and not tracemalloc.is_tracing():
+            tracemalloc.start(1)
+
+    def checkpoint(self, label, **info):
+        """
+        Registra um ponto do censo e compara com o anterior.
+
+        Args:
+            label: Nome do ponto (ex: 'start_level')
+            info: Dados extras gravados junto (ex: level=3)
+
+        Returns:
+            dict: Registro gravado (None se o censo estiver desligado)
+        """
+        if not self.enabled:
+            return None
+        self.start()
+        gc.collect()
+
+        snapshot = tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap*>'),
+        ])
+        current, peak = tracemalloc.get_traced_memory()
+        sizes, owners = surface_census()
+
+        files = []
+        if self._snapshot is not None:
+            for stat in snapshot.compare_to(self._snapshot, 'filename')[:self.top]:
+                if stat.size_diff:
+                    files.append({'file': stat.traceback[0].filename, 'size_diff': stat.size_diff,
+                                  'count_diff': stat.count_diff, 'size': stat.size})
+
+        record = {
+            'time': datetime.now().isoformat(timespec='seconds'),
+            'checkpoint': label,
+            'index': self.checkpoints,
+            **info,
+            'traced_bytes': current,
+            'traced_peak': peak,
+            'surfaces': sum(count for count, _ in sizes.values()),
+            'surface_bytes': sum(size for _, size in sizes.values()),
+            'file_diff': files,
+            'surface_size_diff': _count_diff(self._sizes, sizes),
+            'surface_owner_diff': _count_diff(self._owners, owners),
+        }
+        self._snapshot, self._sizes, self._owners = snapshot, sizes, owners
+        self.checkpoints += 1
+
+        log.info("Memória [%s]: %.1f MB rastreados, %d Surfaces (%.1f MB)",
+                 label, current / 1e6, record['surfaces'], record['surface_bytes'] / 1e6,
+                 extra={'fields': {'surfaces_diff': record['surface_owner_diff'] or 0}})
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+        except IOError as e:
+            log.error("Erro ao salvar censo de memória: %s", e)
+        return record
@@ -0,0 +1,110 @@
+"""
+Padrões de movimento dos itens do jogo Perfect Potion.
+
+Cada item do ItemEngine tem um id de padrão e dois parâmetros (p0, p1) em
+arrays. A cada tick, cada padrão atualiza todos os seus itens com uma única
+expressão NumPy, sem laço Python por item.
+
+Os padrões só mexem no eixo vertical: x continua andando só por speed_x,
+então o tick de saída da tela calculado no spawn continua valendo. Itens que
+saem por baixo (gravidade) são removidos aqui mesmo.
+
+Padrões:
+- linear: só anda na horizontal (comportamento original)
+- sine: ondula em torno da altura de spawn (p0 = amplitude, p1 = rad/tick)
+- gravity: cai acelerando (p0 = aceleração por tick)
+- homing: persegue a altura do jogador (p0 = aceleração, p1 = velocidade máxima)
+"""
+import numpy as np
+from src import settings
+
+# Ids de padrão guardados no array 'pattern' do ItemEngine
+PATTERN_LINEAR = 0
+PATTERN_SINE = 1
+PATTERN_GRAVITY = 2
+PATTERN_HOMING = 3
+
+# Nome usado nas configurações -> id do padrão
+PATTERN_NAMES = {
+    'linear': PATTERN_LINEAR,
+    'sine': PATTERN_SINE,
+    'gravity': PATTERN_GRAVITY,
+    'homing': PATTERN_HOMING,
+}
+
+
+def _sine(engine, slots, target_y):
+    age = (engine.tick - engine.spawn_tick[slots]).astype(np.float32)
+    engine.y[slots] = engine.base_y[slots] + engine.p0[slots] * np.sin(age * engine.p1[slots] + engine.phase[slots])
+    return None
+
+
+def _gravity(engine, slots, target_y):
+    engine.speed_y[slots] += engine.p0[slots]
+    engine.y[slots] += engine.speed_y[slots]
+    # Caiu abaixo da tela: não vai voltar, remove já
+    return slots[engine.y[slots] > settings.WINDOW_HEIGHT]
+
+
+def _homing(engine, slots, target_y):
+    if target_y is None:
+        return None
+    center = engine.y[slots] + engine.height[engine.sprite_id[slots]] / 2
+    speed = engine.speed_y[slots] + np.sign(target_y - center) * engine.p0[slots]
+    engine.speed_y[slots] = np.clip(speed, -engine.p1[slots], engine.p1[slots])
+    engine.y[slots] += engine.speed_y[slots]
+    return None
+
+
+# Função de atualização de cada padrão (linear não precisa de nenhuma)
+PATTERN_UPDATES = {
+    PATTERN_SINE: _sine,
+    PATTERN_GRAVITY: _gravity,
+    PATTERN_HOMING: _homing,
+}
+
+
+def pattern_params(pattern, speed_scale=1.0):
+    """
+    Parâmetros (p0, p1) de cada item segundo settings.MOVEMENT_PATTERN_PARAMS.
+
+    Args:
+        pattern: Array com o id de padrão de cada item
+        speed_scale: Multiplicador de velocidade do nível (aplicado à queda)
+
+    Returns:
+        tuple: (p0, p1) como arrays float32
+    """
+    table = np.zeros((len(PATTERN_NAMES), 2), dtype=np.float32)
+    for name, pattern_id in PATTERN_NAMES.items():
+        params = settings.MOVEMENT_PATTERN_PARAMS.get(name, (0.0, 0.0))
+        table[pattern_id] = params
+    table[PATTERN_GRAVITY, 0] *= speed_scale
+    return table[pattern, 0], table[pattern, 1]
+
+
+def step_patterns(engine, n, target_y=None):
+    """
+    Aplica os padrões não lineares aos itens vivos abaixo de 'n'.
+
+    Args:
+        engine: ItemEngine
+        n: Limite de slots em uso (engine.top)
+        target_y: Altura do centro do jogador (para homing)
+
+    Returns:
+        np.ndarray ou None: Slots que saíram da tela e devem ser removidos
+    """
+    patterns = engine.pattern[:n]
+    moving = np.flatnonzero((patterns != PATTERN_LINEAR) & engine.alive[:n])
+    if moving.size == 0:
+        return None
+
+    gone = []
+    for pattern_id, update in PATTERN_UPDATES.items():
+        slots = moving[patterns[moving] == pattern_id]
+        if slots.size:
+            out = update(engine, slots, target_y)
+            if out is not None and out.size:
+                gone.append(out)
+    return np.concatenate(gone) if gone else None
@@ -0,0 +1,156 @@
+"""
+Overlay de desempenho do jogo Perfect Potion (liga/desliga com F3).
+
+Mostra o tempo de cada fase do frame (FrameTimer), um gráfico rolante dos
+últimos frames e contadores ao vivo (itens, projéteis, indicadores,
+Surfaces criadas por frame).
+
+O overlay foi feito para não distorcer o que mede: o gráfico é uma
+Surface pré-alocada que só rola um pixel e ganha uma coluna nova por frame,
+e os textos só são renderizados de novo a cada settings.PERF_TEXT_REFRESH
+frames (e só se mudaram). O custo dele aparece na fase 'overlay'.
+"""
+import pygame as pg
+from src import settings
+from src.utils.frame_stats import PHASE_GROUPS
+
+# Cor de cada grupo de fases no gráfico
+GROUP_COLORS = {
+    'events': (120, 120, 255),
+    'update': (80, 200, 120),
+    'draw': (240, 180, 60),
+    'overlay': (200, 80, 200),
+    'flip': (160, 160, 160),
+}
+
+# Nomes curtos das fases no texto
+SHORT_NAMES = {
+    'update.spawning': 'spawn',
+    'update.cleanup': 'cleanup',
+    'update.collision': 'collision',
+    'update.other': 'other',
+    'draw.background': 'bg',
+    'draw.sprites': 'sprites',
+    'draw.effects': 'effects',
+    'draw.hud': 'hud',
+}
+
+PADDING = 6
+LINE_HEIGHT = 16
+
+
+class PerfOverlay:
+    """Painel com tempos por fase, gráfico de frames e contadores."""
+
+    def __init__(self, timer, position=(8, 60)):
+        """
+        Args:
+            timer: FrameTimer com os tempos dos frames
+            position: Canto superior esquerdo do painel
+        """
+        self.timer = timer
+        self.position = position
+        self.visible = settings.PERF_OVERLAY
+        self.fps = 0.0
+        self.graph_width = settings.PERF_HISTORY
+        self.graph_height = 60
+        # Altura do gráfico = 2 frames de orçamento
+        self.ms_per_pixel = (2 * 1000 / settings.FPS) / self.graph_height
+
+        # Criados no primeiro draw (precisam de pg.font e da janela)
+        self.font = None
+        self.panel = None
+        self.graph = None
+        self._lines = []         # Surfaces das linhas de texto atuais
+        self._text_cache = {}    # texto -> Surface
+
+    def toggle(self):
+        """Mostra ou esconde o overlay."""
+        self.visible = not self.visible
+
+    def _setup(self):
+        self.font = pg.font.Font(None, 18)
+        width = self.graph_width + 2 * PADDING + 220
+        height = self.graph_height + 2 * PADDING + 5 * LINE_HEIGHT + PADDING
+        self.panel = pg.Surface((width, height), pg.SRCALPHA)
+        self.panel.fill((0, 0, 0, 170))
+        self.graph = pg.Surface((self.graph_width, self.graph_height))
+        self.graph.fill((20, 20, 20))
+
+    def draw(self, surface):
+        """
+        Desenha o overlay (não faz nada se estiver escondido).
+
+        Args:
+            surface: Superfície onde o painel será desenhado
+        """
+        if not self.visible or self.timer.frame == 0:
+            return
+        if self.panel is None:
+            self._setup()
+
+        self._push_column()
+        if self.timer.frame % settings.PERF_TEXT_REFRESH == 0 or not self._lines:
+            self._refresh_text()
+
+        x, y = self.position
+        surface.blit(self.panel, (x, y))
+        surface.blit(self.graph, (x + PADDING, y + PADDING))
+        text_y = y + self.graph_height + 2 * PADDING
+        for line in self._lines:
+            surface.blit(line, (x + PADDING, text_y))
+            text_y += LINE_HEIGHT
+
+    def _push_column(self):
+        """Rola o gráfico um pixel e desenha a coluna do último frame (barras empilhadas)."""
+        graph = self.graph
+        column = self.graph_width - 1
+        graph.scroll(-1, 0)
+        graph.fill((20, 20, 20), (column, 0, 1, self.graph_height))
+
+        totals = self.timer.group_totals(self.timer.last(1))[0]
+        bottom = self.graph_height
+        for group, ms in zip(PHASE_GROUPS, totals):
+            height = int(ms / self.ms_per_pixel + 0.5)
+            if height <= 0:
+                continue
+            top = max(bottom - height, 0)
+            graph.fill(GROUP_COLORS[group], (column, top, 1, bottom - top))
+            bottom = top
+            if bottom == 0:
+                break
+
+        # Linha do orçamento de um frame
+        budget_y = self.graph_height - int(1000 / settings.FPS / self.ms_per_pixel)
+        graph.fill((255, 60, 60), (column, budget_y, 1, 1))
+
+    def _refresh_text(self):
+        """Recalcula as médias e renderiza as linhas que mudaram."""
+        timer = self.timer
+        rows = timer.last(settings.PERF_TEXT_REFRESH)
+        average = rows.mean(axis=0)
+        by_phase = dict(zip(timer.phases, average))
+        groups = dict(zip(PHASE_GROUPS, timer.group_totals(average)))
+        frame_total = rows.sum(axis=1)
+        counts = timer.counts
+
+        texts = [
+            f"FPS {self.fps:4.0f}   frame {frame_total.mean():5.2f} ms   max {frame_total.max():5.2f} ms",
+            '  '.join(f"{g} {groups[g]:.2f}" for g in PHASE_GROUPS),
+            'update: ' + '  '.join(f"{SHORT_NAMES[p]} {by_phase[p]:.2f}"
+                                   for p in timer.phases if p.startswith('update.')),
+            'draw: ' + '  '.join(f"{SHORT_NAMES[p]} {by_phase[p]:.2f}"
+                                 for p in timer.phases if p.startswith('draw.')),
+            f"itens {counts.get('items', 0)}  proj {counts.get('projectiles', 0)}  "
+            f"ind {counts.get('indicators', 0)}  surf/frame {counts.get('surfaces', 0)}  "
+            f"text/frame {counts.get('renders', 0)}",
+        ]
+        if len(self._text_cache) > 256:
+            self._text_cache.clear()
+        self._lines = [self._text(text) for text in texts]
+
+    def _text(self, text):
+        surface = self._text_cache.get(text)
+        if surface is None:
+            surface = self._text_cache[text] = self.font.render(text, True, (230, 230, 230))
+        return surface
@@ -0,0 +1,88 @@
+"""
+Pools de objetos reutilizáveis (projéteis, indicadores de dano, etc).
+
+Em vez de criar um objeto novo a cada tiro ou dano e jogá-lo fora no kill(),
+os objetos são criados antes do nível começar (pre-warm) e reinicializados no
+lugar quando são pegos do pool. Isso evita picos de alocação e de coleta de
+lixo no meio do jogo.
+"""
+
+
+class ObjectPool:
+    """
+    Pool genérico de objetos.
+
+    Os objetos guardados precisam ter um método reset(...) que os reinicializa
+    com os mesmos argumentos que seriam passados ao construtor.
+    """
+
+    def __init__(self, factory, name=None):
+        """
+        Args:
+            factory: Função sem argumentos que cria um objeto novo (inativo)
+            name: Nome usado nos relatórios de uso
+        """
+        self.factory = factory
+        self.name = name or getattr(factory, '__name__', 'pool')
+        self._free = []
+        self.active = 0        # Objetos emprestados no momento
+        self.created = 0       # Total de objetos já criados
+        self.high_water = 0    # Maior número de objetos ativos ao mesmo tempo
+
+    def _create(self):
+        obj = self.factory()
+        obj.pool = self
+        obj._in_pool = False
+        self.created += 1
+        return obj
+
+    def prewarm(self, count):
+        """
+        Garante que o pool tenha pelo menos 'count' objetos criados.
+
+        Args:
+            count: Quantidade total de objetos desejada (ativos + livres)
+        """
+        while self.active + len(self._free) < count:
+            obj = self._create()
+            obj._in_pool = True
+            self._free.append(obj)
+
+    def acquire(self, *args, **kwargs):
+        """
+        Pega um objeto do pool e o reinicializa com os argumentos dados.
+
+        Se o pool estiver vazio, cria um objeto novo (e isso aparece em 'created').
+        """
+        obj = self._free.pop() if self._free else self._create()
+        obj._in_pool = False
+        obj.reset(*args, **kwargs)
+        self.active += 1
+        if self.active > self.high_water:
+            self.high_water = self.active
+        return obj
+
+    def release(self, obj):
+        """Devolve um objeto ao pool (ignorado se já tiver sido devolvido)."""
+        if getattr(obj, '_in_pool', True):
+            return
+        obj._in_pool = True
+        self.active -= 1
+        self._free.append(obj)
+
+    def reset_stats(self):
+        """Zera a marca de uso máximo (ex: no início de um nível)."""
+        self.high_water = self.active
+
+    def stats(self):
+        """
+        Returns:
+            dict: Uso do pool (ativos, livres, criados e máximo simultâneo)
+        """
+        return {
+            'name': self.name,
+            'active': self.active,
+            'free': len(self._free),
+            'created': self.created,
+            'high_water': self.high_water,
+        }
@@ -0,0 +1,137 @@
+"""
+Profiler por amostragem do jogo Perfect Potion.
+
+Uma thread acorda a cada settings.PROFILER_INTERVAL_MS, copia a pilha da
+thread principal (sys._current_frames) e conta a amostra no estado atual do
+jogo (Game.state: SPLASH, MENU, GAME, RANKING, GAME_OVER). Funciona em
+qualquer sistema (não usa sinais) e não exige reiniciar o jogo sob uma
+ferramenta externa.
+
+Ao parar, grava um arquivo por estado em SAVE_DIR no formato de pilhas
+colapsadas ("main;run;_run_game_loop;update 42"), aceito por flamegraph.pl,
+speedscope e inferno.
+
+Liga/desliga com `python main.py --profile` (a sessão inteira) ou F9
+durante a partida.
+"""
+import os
+import sys
+import threading
+from datetime import datetime
+from src import settings
+from src.utils.log import get_logger
+
+log = get_logger(__name__)
+
+
+class SamplingProfiler:
+    """Amostra a pilha da thread principal e agrupa as amostras por Game.state."""
+
+    def __init__(self, game, interval_ms=None):
+        """
+        Args:
+            game: Instância de Game (o estado é lido a cada amostra)
+            interval_ms: Intervalo entre amostras (padrão: settings.PROFILER_INTERVAL_MS)
+        """
+        self.game = game
+        self.interval = (interval_ms or settings.PROFILER_INTERVAL_MS) / 1000.0
+        self.samples = {}     # estado -> {pilha (tupla de code objects): amostras}
+        self.started = None   # Quando a gravação atual começou
+        self._main_thread = threading.get_ident()
+        self._thread = None
+        self._stop = threading.Event()
+
+    @property
+    def running(self):
+        return self._thread is not None
+
+    def start(self):
+        """Começa a amostrar (ignorado se já estiver rodando)."""
+        if self.running:
+            return
+        self.samples = {}
+        self.started = datetime.now()
+        self._main_thread = threading.get_ident()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='profiler', daemon=True)
+        self._thread.start()
+        log.info("Profiler ligado (amostra a cada %.1f ms)", self.interval * 1000)
+
+    def stop(self):
+        """
+        Para de amostrar e grava os arquivos.
+
+        Returns:
+            list: Caminhos dos arquivos gravados
+        """
+        if not self.running:
+            return []
+        self._stop.set()
+        self._thread.join(timeout=1.0)
+        self._thread = None
+        return self.write()
+
+    def toggle(self):
+        """Liga ou desliga o profiler (ex: tecla F9)."""
+        if self.running:
+            self.stop()
+        else:
+            self.start()
+
+    def _run(self):
+        main = self._main_thread
+        samples = self.samples
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(main)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(frame.f_code)
+                frame = frame.f_back
+            by_state = samples.setdefault(getattr(self.game, 'state', None) or 'NONE', {})
+            key = tuple(stack)
+            by_state[key] = by_state.get(key, 0) + 1
+
+    @staticmethod
+    def _label(code):
+        return f"{os.path.splitext(os.path.basename(code.co_filename))[0]}:{code.co_name}"
+
+    def collapsed(self, state):
+        """
+        Pilhas de um estado no formato colapsado (raiz primeiro).
+
+        Returns:
+            list: Linhas "f1;f2;f3 amostras", da pilha mais comum para a menos comum
+        """
+        merged = {}
+        for stack, count in self.samples.get(state, {}).items():
+            line = ';'.join(self._label(code) for code in reversed(stack))
+            merged[line] = merged.get(line, 0) + count
+        return [f"{line} {count}" for line, count in sorted(merged.items(), key=lambda kv: -kv[1])]
+
+    def write(self, directory=None):
+        """
+        Grava um arquivo .folded por estado.
+
+        Args:
+            directory: Pasta de saída (padrão: settings.SAVE_DIR)
+
+        Returns:
+            list: Caminhos dos arquivos gravados
+        """
+        directory = directory or settings.SAVE_DIR
+        stamp = (self.started or datetime.now()).strftime('%Y%m%d-%H%M%S')
+        paths = []
+        try:
+            os.makedirs(directory, exist_ok=True)
+            for state in sorted(self.samples):
+                path = os.path.join(directory, f'profile-{stamp}-{state}.folded')
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write('\n'.join(self.collapsed(state)) + '\n')
+                paths.append(path)
+        except IOError as e:
+            log.error("Erro ao salvar profile: %s", e)
+        totals = {state: sum(stacks.values()) for state, stacks in self.samples.items()}
+        log.info("Profiler desligado: amostras por estado %s", totals)
+        return paths
@@ -0,0 +1,343 @@
+"""
+Motor de receitas do jogo Perfect Potion.
+
+As receitas ordenadas de um nível são compiladas numa trie sobre os ids de
+poção do catálogo, com uma tabela de transições por nó. Todas as receitas
+ativas andam ao mesmo tempo: cada uma fica num nó da trie (receitas com o
+mesmo começo dividem o nó), e uma poção coletada avança, com uma consulta
+de tabela por nó vivo, todas as receitas que a aceitam. O custo por coleta
+depende de quantos nós estão vivos (no máximo um por receita ordenada),
+não do tamanho das receitas. Receitas sem ordem não são expandidas em
+permutações: cada uma vira um multiconjunto (Counter) e só as que usam a
+poção coletada são testadas; passos com alternativas precisam de um
+pequeno emparelhamento.
+
+Formatos aceitos:
+- Ordenada: [a, b, c] precisa ser coletada nessa ordem
+- Sem ordem: as mesmas poções em qualquer ordem
+- Com ramificação: um passo pode aceitar alternativas, ex: [a, (b, c), d]
+- Várias receitas ao mesmo tempo, intercaladas em qualquer ordem
+
+Uma poção pode contar para várias receitas (uma menor que é prefixo de uma
+maior é completada e a maior continua), mas completa no máximo uma: as
+outras que também terminariam nela voltam para o maior sufixo que não as
+completa, para as mesmas poções não valerem duas receitas.
+"""
+from collections import Counter
+from itertools import product
+from typing import List, Optional, Sequence, Tuple, Union
+from src.data.potion_catalog import CATALOG
+
+# O que acontece com o progresso quando o jogador pega a poção errada
+MISTAKE_KEEP = 'keep'        # Mantém o progresso (regra original do jogo)
+MISTAKE_RESTART = 'restart'  # Cada receita volta ao maior sufixo que ainda vale para ela
+
+Step = Union[int, Tuple[int, ...]]
+
+
+class Recipe:
+    """Uma receita: passos (id ou tupla de ids alternativos) e se a ordem importa."""
+
+    __slots__ = ('name', 'steps', 'ordered')
+
+    def __init__(self, steps: Sequence[Step], ordered: bool = True, name: Optional[str] = None):
+        self.steps = tuple(tuple(s) if isinstance(s, (tuple, list, set, frozenset)) else (s,)
+                           for s in steps)
+        self.ordered = ordered
+        self.name = name
+
+    def __len__(self):
+        return len(self.steps)
+
+    def paths(self) -> List[Tuple[int, ...]]:
+        """Todas as sequências de ids que completam uma receita ordenada (uma por alternativa)."""
+        if not self.ordered:
+            raise ValueError("Receitas sem ordem são comparadas como multiconjunto, não por caminhos")
+        return list(dict.fromkeys(product(*self.steps)))
+
+    def hint(self) -> List[int]:
+        """Uma sequência de exemplo (primeira alternativa de cada passo)."""
+        return [step[0] for step in self.steps]
+
+
+class UnorderedMatcher:
+    """
+    Receita sem ordem vista como multiconjunto.
+
+    Passos de um só id ficam num Counter (teste O(1) por poção). Poções que
+    sobram para passos com alternativas são distribuídas por emparelhamento
+    bipartido, que só roda quando a receita tem alternativas.
+    """
+
+    __slots__ = ('size', 'need', 'choices')
+
+    def __init__(self, recipe: Recipe):
+        self.size = len(recipe.steps)
+        self.need = Counter(step[0] for step in recipe.steps if len(step) == 1)
+        self.choices = [frozenset(step) for step in recipe.steps if len(step) > 1]
+
+    def accepts(self, counts: Counter, potion_id: int) -> bool:
+        """Se as poções em 'counts' mais potion_id ainda cabem na receita."""
+        if sum(counts.values()) >= self.size:
+            return False
+        if counts[potion_id] < self.need[potion_id]:
+            return True
+        if not self.choices:
+            return False
+        counts[potion_id] += 1
+        try:
+            return self.fits(counts)
+        finally:
+            counts[potion_id] -= 1
+
+    def fits(self, counts: Counter) -> bool:
+        """Se todas as poções em 'counts' cabem em passos distintos da receita."""
+        extra = []
+        for potion_id, count in counts.items():
+            over = count - self.need[potion_id]
+            if over > 0:
+                extra.extend([potion_id] * over)
+        if len(extra) > len(self.choices):
+            return False
+        # Poções repetidas de passos simples vão primeiro para eles (nunca piora o
+        # emparelhamento); o resto procura caminhos aumentantes (Kuhn)
+        owner = [-1] * len(self.choices)
+
+        def place(i, seen):
+            for j, options in enumerate(self.choices):
+                if j not in seen and extra[i] in options:
+                    seen.add(j)
+                    if owner[j] < 0 or place(owner[j], seen):
+                        owner[j] = i
+                        return True
+            return False
+
+        return all(place(i, set()) for i in range(len(extra)))
+
+    def complete(self, counts: Counter) -> bool:
+        """Se 'counts' (que já cabe na receita) completa todos os passos."""
+        return sum(counts.values()) == self.size
+
+    def remaining(self, counts: Counter) -> List[int]:
+        """Poções que ainda faltam (primeira alternativa dos passos com opções)."""
+        missing = list((self.need - counts).elements())
+        used_choices = sum(counts.values()) - (sum(self.need.values()) - len(missing))
+        missing.extend(sorted(options)[0] for options in self.choices[used_choices:])
+        return missing
+
+
+class RecipeAutomaton:
+    """
+    Progresso simultâneo de um conjunto de receitas.
+
+    'edge[s][p]' é o próximo nó da trie das receitas ordenadas (ou -1),
+    'through[s]' as receitas cujos caminhos passam pelo nó s e 'ends[s]' as
+    que terminam nele. 'live' guarda, para cada nó vivo, as receitas
+    ordenadas que estão nele; as sem ordem guardam as poções coletadas.
+    Receitas completadas saem do conjunto ativo sem recompilar nada.
+    """
+
+    def __init__(self, recipes: Sequence[Recipe], alphabet_size: Optional[int] = None,
+                 mistake_mode: str = MISTAKE_KEEP):
+        """
+        Args:
+            recipes: Receitas ativas
+            alphabet_size: Quantidade de ids de poção (padrão: tamanho do catálogo)
+            mistake_mode: MISTAKE_KEEP ou MISTAKE_RESTART
+        """
+        self.recipes = list(recipes)
+        self.mistake_mode = mistake_mode
+        size = alphabet_size or len(CATALOG)
+
+        # Receitas sem ordem: índice da receita -> multiconjunto, e quais usam cada poção
+        self.unordered = {index: UnorderedMatcher(recipe)
+                          for index, recipe in enumerate(self.recipes) if not recipe.ordered}
+        self.wanted_by = [[] for _ in range(size)]
+        for index, recipe in enumerate(self.recipes):
+            if not recipe.ordered:
+                for potion_id in sorted({p for step in recipe.steps for p in step if 0 <= p < size}):
+                    self.wanted_by[potion_id].append(index)
+
+        # Trie das receitas ordenadas: filhos, receitas que passam e que terminam em
+        # cada nó, profundidade e, por receita, um caminho completo pelo nó
+        children = [{}]
+        self.through = [set()]
+        self.ends = [set()]
+        self.depth = [0]
+        self.hints = [{}]
+        for index, recipe in enumerate(self.recipes):
+            if not recipe.ordered:
+                continue
+            for path in recipe.paths():
+                node = 0
+                self.through[0].add(index)
+                self.hints[0].setdefault(index, path)
+                for potion_id in path:
+                    nxt = children[node].get(potion_id)
+                    if nxt is None:
+                        nxt = len(children)
+                        children[node][potion_id] = nxt
+                        children.append({})
+                        self.through.append(set())
+                        self.ends.append(set())
+                        self.depth.append(self.depth[node] + 1)
+                        self.hints.append({})
+                    node = nxt
+                    self.through[node].add(index)
+                    self.hints[node].setdefault(index, path)
+                self.ends[node].add(index)
+
+        # Tabela completa de transições por nó (consulta O(1) por nó vivo)
+        self.edge = [[-1] * size for _ in range(len(children))]
+        for node, kids in enumerate(children):
+            for potion_id, nxt in kids.items():
+                self.edge[node][potion_id] = nxt
+
+        self.reset()
+
+    def reset(self):
+        """Todas as receitas ativas de novo e nada coletado."""
+        self.active = set(range(len(self.recipes)))   # Receitas ainda não completadas
+        ordered = {i for i, recipe in enumerate(self.recipes) if recipe.ordered}
+        self.live = {0: ordered} if ordered else {}    # nó -> receitas ordenadas nele
+        self.node_of = dict.fromkeys(ordered, 0)       # receita ordenada -> nó
+        self.taken = {i: [] for i in self.unordered}   # receita sem ordem -> poções, em ordem
+        self.counts = {i: Counter() for i in self.unordered}
+        self.last_path = []                            # Poções que completaram a última receita
+
+    def feed(self, potion_id: int) -> Tuple[bool, int]:
+        """
+        Avança todas as receitas que aceitam a poção coletada.
+
+        Args:
+            potion_id: Id da poção coletada
+
+        Returns:
+            tuple: (acertou, índice da receita completada ou -1)
+        """
+        if not 0 <= potion_id < len(self.edge[0]):
+            return False, -1
+
+        moves = []
+        for node, members in self.live.items():
+            nxt = self.edge[node][potion_id]
+            if nxt >= 0:
+                moved = members & self.through[nxt]
+                if moved:
+                    moves.append((node, nxt, moved))
+        accepted = [i for i in self.wanted_by[potion_id]
+                    if i in self.counts and self.unordered[i].accepts(self.counts[i], potion_id)]
+        if not moves and not accepted:
+            if self.mistake_mode == MISTAKE_RESTART:
+                for index in sorted(self.active):
+                    self._rewind(index, self.path_of(index) + [potion_id])
+            return False, -1
+
+        finished = []
+        for node, nxt, moved in moves:
+            for index in moved:
+                self._place(index, nxt)
+            finished.extend(moved & self.ends[nxt])
+        for index in accepted:
+            self.taken[index].append(potion_id)
+            self.counts[index][potion_id] += 1
+            if self.unordered[index].complete(self.counts[index]):
+                finished.append(index)
+        if not finished:
+            return True, -1
+
+        # Uma poção completa uma receita só; as outras que terminariam aqui
+        # voltam para o maior sufixo que não as completa
+        completed = min(finished)
+        self.last_path = self.path_of(completed)
+        self._retire(completed)
+        for index in sorted(set(finished) - {completed}):
+            self._rewind(index, self.path_of(index))
+        return True, completed
+
+    def path_of(self, index: int) -> List[int]:
+        """Poções que já contam para uma receita ativa, em ordem."""
+        if index in self.node_of:
+            node = self.node_of[index]
+            return list(self.hints[node][index][:self.depth[node]])
+        return list(self.taken[index])
+
+    def remaining_recipes(self) -> List[Recipe]:
+        """Receitas ainda não completadas, na ordem original."""
+        return [recipe for index, recipe in enumerate(self.recipes) if index in self.active]
+
+    def _place(self, index: int, node: int):
+        """Move uma receita ordenada para um nó da trie."""
+        old = self.node_of[index]
+        members = self.live[old]
+        members.discard(index)
+        if not members:
+            del self.live[old]
+        self.live.setdefault(node, set()).add(index)
+        self.node_of[index] = node
+
+    def _retire(self, index: int):
+        """Tira uma receita completada do conjunto ativo."""
+        self.active.discard(index)
+        if index in self.node_of:
+            node = self.node_of.pop(index)
+            members = self.live[node]
+            members.discard(index)
+            if not members:
+                del self.live[node]
+        else:
+            del self.taken[index]
+            del self.counts[index]
+
+    def _walk(self, index: int, path: Sequence[int]) -> int:
+        """Nó da trie alcançado pelo caminho sem sair da receita 'index' (ou -1)."""
+        node = 0
+        for potion_id in path:
+            if not 0 <= potion_id < len(self.edge[0]):
+                return -1
+            node = self.edge[node][potion_id]
+            if node < 0 or index not in self.through[node]:
+                return -1
+        return node
+
+    def _rewind(self, index: int, path: List[int]):
+        """
+        Põe uma receita no maior sufixo de 'path' que ainda vale para ela e
+        não a completa (nada coletado se nenhum valer).
+
+        Args:
+            index: Receita ativa
+            path: Poções candidatas, em ordem
+        """
+        for start in range(len(path) + 1):
+            suffix = path[start:]
+            if index in self.node_of:
+                node = self._walk(index, suffix)
+                if node >= 0 and index not in self.ends[node]:
+                    self._place(index, node)
+                    return
+            else:
+                matcher = self.unordered[index]
+                counts = Counter(suffix)
+                if matcher.fits(counts) and not matcher.complete(counts):
+                    self.taken[index] = suffix
+                    self.counts[index] = counts
+                    return
+
+    def progress(self) -> List[Tuple[int, List[int], int]]:
+        """
+        Progresso de cada receita ativa, as mais adiantadas primeiro.
+
+        Returns:
+            list: (índice da receita, ids a mostrar, quantidade já coletada)
+        """
+        rows = []
+        for index in sorted(self.active):
+            if index in self.node_of:
+                node = self.node_of[index]
+                rows.append((index, list(self.hints[node][index]), self.depth[node]))
+            else:
+                taken = self.taken[index]
+                rows.append((index, taken + self.unordered[index].remaining(self.counts[index]), len(taken)))
+        rows.sort(key=lambda row: -row[2])
+        return rows
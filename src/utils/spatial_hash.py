@@ -0,0 +1,163 @@
+"""
+Índice espacial em grade uniforme (spatial hash) para a fase ampla de colisões.
+
+Cada objeto é colocado na célula que contém o centro do seu retângulo. As
+consultas expandem a área procurada pela maior meia-extensão dos objetos, de
+modo que só as células vizinhas precisam ser visitadas. A reconstrução é toda
+vetorizada: calcula a chave de célula de cada objeto e ordena uma vez.
+"""
+import numpy as np
+from src import settings
+
+
+class SpatialHash:
+    """
+    Grade uniforme que devolve candidatos a colisão por retângulo ou raio.
+
+    Os objetos são passados como arrays (left, top, right, bottom) e
+    identificados pelo seu índice nesses arrays (ou por 'ids', se fornecido).
+    """
+
+    def __init__(self, cell_size=None, width=None, height=None, margin=200):
+        """
+        Args:
+            cell_size: Tamanho de cada célula em pixels (padrão: settings.SPATIAL_CELL_SIZE)
+            width: Largura da área coberta (padrão: largura da janela)
+            height: Altura da área coberta (padrão: altura da janela)
+            margin: Margem extra fora da tela coberta pela grade
+        """
+        self.cell_size = cell_size or settings.SPATIAL_CELL_SIZE
+        width = width or settings.WINDOW_WIDTH
+        height = height or settings.WINDOW_HEIGHT
+
+        # Objetos fora da grade caem nas células da borda (continua correto)
+        self.origin_x = -margin
+        self.origin_y = -margin
+        self.cols = int((width + 2 * margin) // self.cell_size) + 1
+        self.rows = int((height + 2 * margin) // self.cell_size) + 1
+
+        self.clear()
+
+    def clear(self):
+        """Esvazia o índice."""
+        empty_f = np.empty(0, dtype=np.float32)
+        self.left = self.top = self.right = self.bottom = empty_f
+        self.ids = np.empty(0, dtype=np.intp)
+        self._keys = np.empty(0, dtype=np.int32)
+        self._order = np.empty(0, dtype=np.intp)
+        self._ext_x = 0.0
+        self._ext_y = 0.0
+
+    def __len__(self):
+        return int(self.ids.size)
+
+    def _cell_x(self, x):
+        return np.clip(((np.asarray(x) - self.origin_x) // self.cell_size).astype(np.int32), 0, self.cols - 1)
+
+    def _cell_y(self, y):
+        return np.clip(((np.asarray(y) - self.origin_y) // self.cell_size).astype(np.int32), 0, self.rows - 1)
+
+    def rebuild(self, left, top, right, bottom, ids=None):
+        """
+        Reconstrói o índice a partir dos retângulos dos objetos.
+
+        Args:
+            left, top, right, bottom: Arrays com as bordas de cada retângulo
+            ids: Identificador de cada objeto (padrão: posição no array)
+        """
+        self.left = np.asarray(left, dtype=np.float32)
+        self.top = np.asarray(top, dtype=np.float32)
+        self.right = np.asarray(right, dtype=np.float32)
+        self.bottom = np.asarray(bottom, dtype=np.float32)
+        n = self.left.size
+        self.ids = np.arange(n, dtype=np.intp) if ids is None else np.asarray(ids, dtype=np.intp)
+
+        if n == 0:
+            self._keys = np.empty(0, dtype=np.int32)
+            self._order = np.empty(0, dtype=np.intp)
+            self._ext_x = self._ext_y = 0.0
+            return
+
+        cx = self._cell_x((self.left + self.right) * 0.5)
+        cy = self._cell_y((self.top + self.bottom) * 0.5)
+        keys = cy * self.cols + cx
+
+        self._order = np.argsort(keys, kind='stable')
+        self._keys = keys[self._order]
+
+        # Maior meia-extensão: quanto uma consulta precisa se expandir
+        self._ext_x = float(np.max(self.right - self.left)) * 0.5
+        self._ext_y = float(np.max(self.bottom - self.top)) * 0.5
+
+    def _candidates(self, left, top, right, bottom):
+        """Índices (nos arrays internos) dos objetos nas células vizinhas à área."""
+        if self._keys.size == 0:
+            return np.empty(0, dtype=np.intp)
+
+        cx0 = int(self._cell_x(left - self._ext_x))
+        cx1 = int(self._cell_x(right + self._ext_x))
+        cy0 = int(self._cell_y(top - self._ext_y))
+        cy1 = int(self._cell_y(bottom + self._ext_y))
+
+        # Em cada linha da grade as células [cx0, cx1] têm chaves contíguas
+        rows = np.arange(cy0, cy1 + 1, dtype=np.int32) * self.cols
+        lo = np.searchsorted(self._keys, rows + cx0, side='left')
+        hi = np.searchsorted(self._keys, rows + cx1, side='right')
+
+        if len(rows) == 1:
+            return self._order[lo[0]:hi[0]]
+        return np.concatenate([self._order[a:b] for a, b in zip(lo, hi) if b > a] or
+                              [np.empty(0, dtype=np.intp)])
+
+    def query_rect(self, rect):
+        """
+        Retorna os ids dos objetos cujo retângulo intersecta 'rect'.
+
+        Args:
+            rect: pg.Rect ou tupla (x, y, w, h)
+        """
+        x, y, w, h = rect
+        cand = self._candidates(x, y, x + w, y + h)
+        if cand.size == 0:
+            return self.ids[cand]
+        hit = (self.left[cand] < x + w) & (self.right[cand] > x) & \
+              (self.top[cand] < y + h) & (self.bottom[cand] > y)
+        return self.ids[cand[hit]]
+
+    def query_radius(self, cx, cy, radius):
+        """
+        Retorna os ids dos objetos cujo retângulo toca o círculo dado.
+
+        Args:
+            cx, cy: Centro do círculo
+            radius: Raio em pixels
+        """
+        cand = self._candidates(cx - radius, cy - radius, cx + radius, cy + radius)
+        if cand.size == 0:
+            return self.ids[cand]
+        # Ponto do retângulo mais próximo do centro do círculo
+        dx = np.maximum(np.maximum(self.left[cand] - cx, 0), cx - self.right[cand])
+        dy = np.maximum(np.maximum(self.top[cand] - cy, 0), cy - self.bottom[cand])
+        hit = dx * dx + dy * dy <= radius * radius
+        return self.ids[cand[hit]]
+
+    def query_pairs(self, rects):
+        """
+        Retorna os pares candidatos entre uma lista de retângulos e o índice.
+
+        Args:
+            rects: Sequência de pg.Rect (ex: os projéteis do frame)
+
+        Returns:
+            tuple: (índices em 'rects', ids do índice) como dois arrays paralelos
+        """
+        firsts, seconds = [], []
+        for i, rect in enumerate(rects):
+            ids = self.query_rect(rect)
+            if ids.size:
+                firsts.append(np.full(ids.size, i, dtype=np.intp))
+                seconds.append(ids)
+        if not firsts:
+            empty = np.empty(0, dtype=np.intp)
+            return empty, empty
+        return np.concatenate(firsts), np.concatenate(seconds)
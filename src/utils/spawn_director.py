@@ -0,0 +1,272 @@
+"""
+Diretor de spawn do jogo Perfect Potion.
+
+Decide o que aparece em cada onda de itens. As probabilidades de cada nível
+são compiladas uma única vez em tabelas do método alias (Vose), então cada
+sorteio custa O(1) independentemente de quantos tipos de item existem. Uma
+onda inteira (tipos, poções, posições e velocidades) é gerada como arrays
+NumPy, sem laço Python por item.
+"""
+from dataclasses import replace
+import numpy as np
+from src import settings
+from src.data.potion_catalog import CATALOG
+from src.utils.item_engine import KIND_INGREDIENT, KIND_HAZARD, KIND_BOMB
+from src.utils.movement import PATTERN_NAMES, PATTERN_LINEAR, PATTERN_SINE, PATTERN_GRAVITY, pattern_params
+
+# Tipo de item de cada nome usado em ITEM_SPAWN_WEIGHTS
+KIND_NAMES = {
+    'ingredient': KIND_INGREDIENT,
+    'hazard': KIND_HAZARD,
+    'bomb': KIND_BOMB,
+}
+
+
+class AliasTable:
+    """
+    Tabela de sorteio pelo método alias: O(n) para montar, O(1) por sorteio.
+    """
+
+    def __init__(self, weights):
+        """
+        Args:
+            weights: Peso relativo de cada opção (não precisa somar 1)
+        """
+        weights = np.asarray(weights, dtype=np.float64)
+        n = weights.size
+        if n == 0 or weights.sum() <= 0:
+            raise ValueError("A tabela de sorteio precisa de pelo menos um peso positivo")
+
+        scaled = weights * n / weights.sum()
+        self.prob = np.ones(n, dtype=np.float64)
+        self.alias = np.arange(n, dtype=np.intp)
+
+        small = [i for i in range(n) if scaled[i] < 1.0]
+        large = [i for i in range(n) if scaled[i] >= 1.0]
+        while small and large:
+            s = small.pop()
+            l = large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+        # Sobras (erro de arredondamento) ficam com probabilidade 1
+
+    def __len__(self):
+        return self.prob.size
+
+    def sample(self, rng, count):
+        """
+        Sorteia 'count' índices de uma vez.
+
+        Args:
+            rng: np.random.Generator
+            count: Quantidade de sorteios
+
+        Returns:
+            np.ndarray: Índices sorteados
+        """
+        column = rng.integers(0, self.prob.size, count)
+        keep = rng.random(count) < self.prob[column]
+        return np.where(keep, column, self.alias[column])
+
+
+class SpawnWave:
+    """Uma onda de itens pronta para o motor (arrays paralelos)."""
+
+    __slots__ = ('x', 'y', 'speed_x', 'kind', 'sprite_id', 'potion_id', 'pattern', 'p0', 'p1', 'phase')
+
+    def __init__(self, x, y, speed_x, kind, sprite_id, potion_id,
+                 pattern=None, p0=None, p1=None, phase=None):
+        self.x = x
+        self.y = y
+        self.speed_x = speed_x
+        self.kind = kind
+        self.sprite_id = sprite_id
+        self.potion_id = potion_id
+        self.pattern = pattern
+        self.p0 = p0
+        self.p1 = p1
+        self.phase = phase
+
+    def __len__(self):
+        return self.x.size
+
+
+class SpawnDirector:
+    """
+    Monta as ondas de spawn de cada nível.
+
+    Trabalha sobre um catálogo de entradas (tipo, poção, sprite) registrado
+    pelo ItemSpawner. Ingredientes podem ser puxados para a próxima poção da
+    receita (DifficultyProfile.recipe_bias), para que o jogador não dependa só
+    da sorte para completar o nível.
+    """
+
+    def __init__(self, rng=None):
+        """
+        Args:
+            rng: np.random.Generator usado nos sorteios (padrão: um novo gerador)
+        """
+        self.rng = rng if rng is not None else np.random.default_rng()
+
+        # Catálogo de entradas sorteáveis (uma por sprite registrado)
+        self.entry_kind = np.zeros(0, dtype=np.int8)
+        self.entry_sprite = np.zeros(0, dtype=np.int16)
+        self.entry_potion = np.zeros(0, dtype=np.int16)
+        self.entry_width = np.zeros(0, dtype=np.float32)
+        self.entry_height = np.zeros(0, dtype=np.float32)
+        self._entry_of_potion = {}  # id da poção -> índice da entrada
+
+        # Tabelas do nível atual
+        self.profile = None
+        self.kind_table = None
+        self.kind_choices = np.zeros(0, dtype=np.int8)
+        self.kind_entries = {}      # tipo -> array de entradas daquele tipo
+        self.entry_tables = {}      # tipo -> AliasTable sobre kind_entries[tipo]
+        self.pattern_tables = {}    # tipo -> (ids de padrão, AliasTable)
+        self._target_entry = -1     # Entrada da próxima poção da receita
+        self._cache = {}            # perfil sem o número do nível -> tabelas já compiladas
+
+    def set_entries(self, entries):
+        """
+        Define o catálogo de entradas sorteáveis.
+
+        Args:
+            entries: Lista de tuplas (tipo, nome da poção, sprite_id, potion_id, largura, altura)
+        """
+        self.entry_kind = np.array([e[0] for e in entries], dtype=np.int8)
+        self.entry_sprite = np.array([e[2] for e in entries], dtype=np.int16)
+        self.entry_potion = np.array([e[3] for e in entries], dtype=np.int16)
+        self.entry_width = np.array([e[4] for e in entries], dtype=np.float32)
+        self.entry_height = np.array([e[5] for e in entries], dtype=np.float32)
+        self._entry_of_potion = {e[3]: i for i, e in enumerate(entries) if e[3] >= 0}
+        self._cache.clear()
+        self.profile = None
+
+    def configure(self, profile):
+        """
+        Prepara as tabelas de sorteio de um nível (compiladas uma vez e reaproveitadas).
+
+        Args:
+            profile: DifficultyProfile do nível
+        """
+        # As tabelas não dependem do número do nível: os níveis além da tabela
+        # de dificuldade (cópias do último perfil) reaproveitam a mesma entrada
+        key = replace(profile, level=0)
+        tables = self._cache.get(key)
+        if tables is None:
+            tables = self._cache[key] = self._compile(profile)
+        self.profile = profile
+        self.kind_table, self.kind_choices, self.kind_entries, self.entry_tables, self.pattern_tables = tables
+        self._target_entry = -1
+
+    def _compile(self, profile):
+        """Monta as tabelas alias de um nível a partir do perfil de dificuldade."""
+        kind_entries, entry_tables = {}, {}
+        for kind in KIND_NAMES.values():
+            entries = np.flatnonzero(self.entry_kind == kind)
+            if entries.size:
+                kind_entries[kind] = entries
+                entry_tables[kind] = AliasTable([self._entry_weight(e) for e in entries])
+
+        # Só entram no sorteio os tipos com peso e com alguma entrada registrada
+        kinds = [(KIND_NAMES[name], w) for name, w in profile.spawn_weights
+                 if w > 0 and KIND_NAMES.get(name) in kind_entries]
+        if not kinds:
+            raise ValueError(f"Nenhum tipo de item pode aparecer no nível {profile.level}")
+        kind_choices = np.array([k for k, _ in kinds], dtype=np.int8)
+        kind_table = AliasTable([w for _, w in kinds])
+
+        # Padrões de movimento sorteados por tipo de item
+        pattern_tables = {}
+        for name, weights in profile.movement_patterns:
+            weights = [(PATTERN_NAMES[p], w) for p, w in weights if w > 0]
+            if KIND_NAMES.get(name) in kind_entries and any(p != PATTERN_LINEAR for p, _ in weights):
+                pattern_tables[KIND_NAMES[name]] = (np.array([p for p, _ in weights], dtype=np.int8),
+                                                    AliasTable([w for _, w in weights]))
+        return kind_table, kind_choices, kind_entries, entry_tables, pattern_tables
+
+    def _entry_weight(self, entry):
+        """Peso de uma entrada dentro do seu tipo ('spawn_weight' no POTION_DATA, padrão 1)."""
+        potion_id = int(self.entry_potion[entry])
+        return CATALOG.spawn_weights[potion_id] if potion_id >= 0 else 1
+
+    def set_next_required(self, potion_id):
+        """
+        Informa qual poção a receita precisa agora (None se nenhuma).
+
+        Args:
+            potion_id: Id da próxima poção da receita
+        """
+        self._target_entry = self._entry_of_potion.get(potion_id, -1) if potion_id is not None else -1
+
+    def plan_wave(self, count):
+        """
+        Gera uma onda de 'count' itens: tipos, sprites, posições e velocidades.
+
+        Args:
+            count: Quantidade de itens da onda
+
+        Returns:
+            SpawnWave: Arrays prontos para ItemEngine.spawn_many
+        """
+        rng = self.rng
+        profile = self.profile
+
+        # Tipo de cada item e, dentro do tipo, qual entrada (poção) aparece
+        kinds = self.kind_choices[self.kind_table.sample(rng, count)]
+        entries = np.empty(count, dtype=np.intp)
+        for kind, table in self.entry_tables.items():
+            picked = np.flatnonzero(kinds == kind)
+            if picked.size:
+                entries[picked] = self.kind_entries[kind][table.sample(rng, picked.size)]
+
+        # Puxa parte dos ingredientes para a próxima poção da receita
+        if self._target_entry >= 0 and profile.recipe_bias > 0:
+            bias = (kinds == KIND_INGREDIENT) & (rng.random(count) < profile.recipe_bias)
+            entries[bias] = self._target_entry
+
+        width = self.entry_width[entries]
+        height = self.entry_height[entries]
+
+        # Lado de onde cada item aparece: a esquerda anda para a direita e vice-versa
+        from_left = rng.random(count) < 0.5
+        x_offset = rng.integers(0, 51, count)
+        x = np.where(from_left,
+                     settings.SPAWN_AREA_X - width - x_offset,
+                     settings.SPAWN_AREA_X + settings.SPAWN_AREA_WIDTH + x_offset)
+        speed_x = rng.integers(profile.speed_min, profile.speed_max, count) * profile.speed_scale
+        speed_x = np.where(from_left, speed_x, -speed_x)
+
+        # Pequena variação de velocidade em metade dos itens
+        jitter = rng.random(count) > 0.5
+        speed_x = np.where(jitter, speed_x * rng.uniform(0.8, 1.2, count), speed_x)
+
+        # Itens distribuídos em faixas verticais abaixo do chão da arena
+        min_y = settings.ARENA_FLOOR_Y + 10
+        max_y = np.maximum(settings.WINDOW_HEIGHT - height - 10, min_y)
+        step = (max_y - min_y) / count
+        base_y = min_y + step * np.arange(count)
+        y = np.floor(rng.uniform(base_y, np.minimum(base_y + step, max_y)))
+
+        if not self.pattern_tables:
+            return SpawnWave(x, y, speed_x, kinds, self.entry_sprite[entries], self.entry_potion[entries])
+
+        # Padrão de movimento de cada item, sorteado dentro do seu tipo
+        pattern = np.full(count, PATTERN_LINEAR, dtype=np.int8)
+        for kind, (choices, table) in self.pattern_tables.items():
+            picked = np.flatnonzero(kinds == kind)
+            if picked.size:
+                pattern[picked] = choices[table.sample(rng, picked.size)]
+        p0, p1 = pattern_params(pattern, profile.speed_scale)
+        phase = rng.uniform(0.0, 2 * np.pi, count).astype(np.float32)
+
+        # Itens ondulando ficam com a onda inteira dentro da faixa
+        amplitude = np.where(pattern == PATTERN_SINE, p0, 0.0)
+        y = np.clip(y, min_y + amplitude, np.maximum(max_y - amplitude, min_y + amplitude))
+        # Itens com gravidade começam no topo da faixa e caem
+        y = np.where(pattern == PATTERN_GRAVITY, min_y, y)
+
+        return SpawnWave(x, y, speed_x, kinds, self.entry_sprite[entries], self.entry_potion[entries],
+                         pattern, p0, p1, phase)
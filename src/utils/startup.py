@@ -0,0 +1,151 @@
+"""
+Relatório de inicialização do jogo Perfect Potion (python main.py --startup-report).
+
+Marca o tempo de cada import (com um finder no início de sys.meta_path que
+mede o exec_module de cada módulo) e de cada etapa de inicialização
+(display, mixer, fontes, assets, ...) até o primeiro frame da tela de
+splash. Nesse frame o relatório é impresso e os módulos adiados (telas de
+ranking e de perfis, banco de dados) são carregados de propósito, para
+medir quanto tempo deixaram de custar antes do primeiro frame.
+
+Fora do modo de relatório, STARTUP.step() e STARTUP.finish() não fazem nada.
+Este módulo só usa a biblioteca padrão, para poder ser importado antes de
+pygame e do resto do jogo.
+"""
+import importlib
+import sys
+from time import perf_counter
+
+# Carregados só depois do primeiro frame: (descrição, função que carrega)
+DEFERRED = (
+    ('src.menu.ranking_screen', lambda: importlib.import_module('src.menu.ranking_screen')),
+    ('src.menu.profile_screen', lambda: importlib.import_module('src.menu.profile_screen')),
+    ('src.data.db (conexão e tabelas)', lambda: importlib.import_module('src.data.db').db._load()),
+)
+
+
+class _TimedLoader:
+    """Envolve o loader de um módulo e mede o exec_module."""
+
+    def __init__(self, loader, name, report):
+        self._loader = loader
+        self._name = name
+        self._report = report
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        report = self._report
+        start = perf_counter()
+        report._stack.append(0.0)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            inclusive = perf_counter() - start
+            children = report._stack.pop()
+            if report._stack:
+                report._stack[-1] += inclusive
+            report.imports.append((self._name, start - report.origin, inclusive, inclusive - children,
+                                   len(report._stack)))
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+
+class _ImportTimer:
+    """Finder que pede o módulo aos outros finders e troca o loader por _TimedLoader."""
+
+    def __init__(self, report):
+        self.report = report
+
+    def find_spec(self, name, path=None, target=None):
+        for finder in sys.meta_path:
+            if finder is self:
+                continue
+            find_spec = getattr(finder, 'find_spec', None)
+            spec = find_spec(name, path, target) if find_spec else None
+            if spec is not None:
+                break
+        else:
+            return None
+        if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+            spec.loader = _TimedLoader(spec.loader, name, self.report)
+        return spec
+
+
+class StartupReport:
+    """Linha do tempo de imports e etapas até o primeiro frame."""
+
+    def __init__(self):
+        self.origin = perf_counter()
+        self.active = False
+        self.finished = False
+        self.steps = []     # (etapa, s desde a origem)
+        self.imports = []   # (módulo, início, inclusivo, próprio, profundidade) em s
+        self.deferred = []  # (módulo adiado, s para carregar depois do primeiro frame)
+        self._stack = []
+        self._finder = None
+
+    def start(self):
+        """Passa a medir imports e etapas (chame antes de importar o jogo)."""
+        if self.active:
+            return
+        self.active = True
+        self._finder = _ImportTimer(self)
+        sys.meta_path.insert(0, self._finder)
+
+    def step(self, label):
+        """Marca o fim de uma etapa de inicialização."""
+        if self.active:
+            self.steps.append((label, perf_counter() - self.origin))
+
+    def finish(self, label='primeiro frame'):
+        """
+        Fecha o relatório no primeiro frame, imprime e mede os módulos adiados.
+
+        Args:
+            label: Nome da última etapa
+        """
+        if not self.active or self.finished:
+            return
+        self.step(label)
+        self.finished = True
+        first_frame = self.steps[-1][1]
+        sys.meta_path.remove(self._finder)
+
+        for name, load in DEFERRED:
+            start = perf_counter()
+            try:
+                load()
+            except Exception as e:
+                print(f"[AVISO] Falha ao carregar {name}: {e}")
+            self.deferred.append((name, perf_counter() - start))
+        self.active = False
+        self.print_report(first_frame)
+
+    def print_report(self, first_frame):
+        """Imprime a linha do tempo, os imports mais lentos e a economia dos adiados."""
+        print("\n=== Relatório de inicialização ===")
+        print("Etapas (ms desde o início do processo de medição):")
+        previous = 0.0
+        for label, at in self.steps:
+            print(f"  {at * 1000:8.1f}  (+{(at - previous) * 1000:7.1f})  {label}")
+            previous = at
+
+        top = [entry for entry in self.imports if entry[1] <= first_frame]
+        total_imports = sum(entry[2] for entry in top if entry[4] == 0)
+        print("\nImports mais lentos (ms próprio / inclusivo):")
+        for name, _, inclusive, own, _ in sorted(top, key=lambda entry: -entry[3])[:15]:
+            print(f"  {own * 1000:8.1f} / {inclusive * 1000:8.1f}  {name}")
+        print(f"\n{len(top)} módulos importados antes do primeiro frame, {total_imports * 1000:.1f} ms em imports")
+        print(f"Primeiro frame em {first_frame * 1000:.1f} ms")
+
+        print("\nAdiados para depois do primeiro frame (tempo economizado):")
+        for name, seconds in self.deferred:
+            print(f"  {seconds * 1000:8.1f}  {name}")
+        print(f"  {sum(seconds for _, seconds in self.deferred) * 1000:8.1f}  total\n")
+
+
+# Relatório compartilhado (só ativo com main.py --startup-report)
+STARTUP = StartupReport()
@@ -0,0 +1,116 @@
+"""
+Telemetria por sessão do jogo Perfect Potion.
+
+Contadores baratos (um incremento de dicionário) acumulados durante a
+partida: spawns por tipo, pares de colisão testados e acertados, testes de
+máscara, itens removidos por saírem da tela, itens atingidos por explosões,
+eventos SDL por tipo, renderizações de texto e Surfaces criadas. No game
+over, uma linha JSON com tudo é acrescentada a settings.TELEMETRY_FILE
+(dentro de SAVE_DIR), ao lado das estatísticas da partida.
+
+Cada Game tem a sua instância (game.telemetry), repassada aos subsistemas.
+A gravação em arquivo fica desligada por padrão: liga com
+settings.TELEMETRY_ENABLED ou `python main.py --telemetry`.
+
+Renderizações de texto e Surfaces vêm de frame_stats.ALLOCATIONS, que o
+Game instala quando a telemetria está ligada.
+"""
+import json
+import os
+import time
+from datetime import datetime
+import numpy as np
+import pygame as pg
+from src import settings
+from src.utils.frame_stats import ALLOCATIONS
+from src.utils.log import get_logger
+
+log = get_logger(__name__)
+
+# Nome de cada tipo de item (mesma ordem de KIND_* em item_engine)
+KIND_NAMES = ('ingredient', 'hazard', 'bomb')
+
+
+class SessionTelemetry:
+    """Contadores de uma partida, gravados em JSONL no fim dela."""
+
+    def __init__(self, path=None, enabled=None):
+        """
+        Args:
+            path: Arquivo JSONL (padrão: SAVE_DIR/settings.TELEMETRY_FILE)
+            enabled: Se flush() grava o arquivo (padrão: settings.TELEMETRY_ENABLED)
+        """
+        self.path = path or os.path.join(settings.SAVE_DIR, settings.TELEMETRY_FILE)
+        self.enabled = settings.TELEMETRY_ENABLED if enabled is None else enabled
+        self.counters = {}  # nome -> valor
+        self.events = {}    # tipo do evento SDL -> quantidade
+        self.started = time.time()
+        self._allocations_start = ALLOCATIONS.snapshot()
+
+    def start_session(self):
+        """Zera os contadores (início de uma partida)."""
+        self.counters = {}
+        self.events = {}
+        self.started = time.time()
+        self._allocations_start = ALLOCATIONS.snapshot()
+
+    def add(self, name, amount=1):
+        """Soma 'amount' ao contador 'name'."""
+        counters = self.counters
+        counters[name] = counters.get(name, 0) + amount
+
+    def count_event(self, event_type):
+        """Conta um evento SDL processado."""
+        events = self.events
+        events[event_type] = events.get(event_type, 0) + 1
+
+    def count_spawns(self, kinds):
+        """
+        Conta os itens criados numa onda, por tipo.
+
+        Args:
+            kinds: Array com o tipo (KIND_*) de cada item criado
+        """
+        if len(kinds) == 0:
+            return
+        for kind, amount in enumerate(np.bincount(kinds, minlength=len(KIND_NAMES)).tolist()):
+            if amount:
+                self.add(f'spawn.{KIND_NAMES[kind]}', amount)
+
+    def summary(self):
+        """
+        Returns:
+            dict: Contadores da sessão até agora (eventos com o nome SDL)
+        """
+        surfaces, renders = ALLOCATIONS.snapshot()
+        return {
+            'counters': dict(sorted(self.counters.items())),
+            'events': {pg.event.event_name(event_type): amount
+                       for event_type, amount in sorted(self.events.items())},
+            'font_renders': renders - self._allocations_start[1],
+            'surfaces_allocated': surfaces - self._allocations_start[0],
+            'duration_sec': round(time.time() - self.started, 1),
+        }
+
+    def flush(self, **stats):
+        """
+        Acrescenta uma linha com os contadores da sessão ao arquivo JSONL.
+
+        Args:
+            stats: Estatísticas da partida gravadas junto (score, nível, ...)
+
+        Returns:
+            dict: Registro gravado (None se a telemetria estiver desligada ou falhar)
+        """
+        if not self.enabled:
+            return None
+        record = {'time': datetime.now().isoformat(timespec='seconds'), **stats, **self.summary()}
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+        except (IOError, TypeError, ValueError) as e:
+            log.error("Erro ao salvar telemetria: %s", e)
+            return None
+        log.info("Telemetria da sessão salva em %s", self.path)
+        return record
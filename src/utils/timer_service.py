@@ -0,0 +1,156 @@
+"""
+Serviço central de timers do jogo Perfect Potion.
+
+Os timers rodam no relógio da simulação (um tick por frame), então se
+comportam igual com ou sem janela e em replays. Por baixo fica uma roda de
+tempo hierárquica (hierarchical timing wheel): agendar e cancelar custam
+O(1), e cada tick só visita os timers que vencem naquele tick.
+"""
+import math
+from src import settings
+
+
+class TimingWheel:
+    """
+    Roda de tempo hierárquica com 'levels' rodas de 'slots' posições.
+
+    A roda 0 tem um balde por tick; a roda 1 um balde a cada 'slots' ticks,
+    e assim por diante. Quando uma roda dá a volta, o balde atual da roda de
+    cima é redistribuído nas rodas de baixo (cascata).
+    """
+
+    def __init__(self, slots=64, levels=4):
+        """
+        Args:
+            slots: Posições por roda (potência de 2)
+            levels: Quantidade de rodas
+        """
+        if slots & (slots - 1):
+            raise ValueError("A quantidade de posições da roda deve ser potência de 2")
+        self.slots = slots
+        self.levels = levels
+        self._bits = slots.bit_length() - 1
+        self._mask = slots - 1
+        self.now = 0
+        self.clear()
+
+    def clear(self):
+        """Descarta todas as entradas agendadas (mantém o tick atual)."""
+        self._wheels = [[[] for _ in range(self.slots)] for _ in range(self.levels)]
+        self._overflow = []  # Entradas além do alcance da última roda
+        self.pending = 0
+
+    def schedule(self, tick, entry):
+        """
+        Agenda 'entry' para sair no tick dado (ticks passados saem no próximo).
+
+        Args:
+            tick: Tick absoluto de vencimento
+            entry: Qualquer objeto, devolvido por advance() no vencimento
+        """
+        self._place(max(int(tick), self.now + 1), entry)
+        self.pending += 1
+
+    def _place(self, tick, entry):
+        delta = tick - self.now
+        for level in range(self.levels):
+            if delta < 1 << (self._bits * (level + 1)):
+                index = (tick >> (self._bits * level)) & self._mask
+                self._wheels[level][index].append((tick, entry))
+                return
+        self._overflow.append((tick, entry))
+
+    def advance(self):
+        """
+        Avança um tick.
+
+        Returns:
+            list: Entradas que venceram neste tick
+        """
+        self.now += 1
+        now = self.now
+
+        # Cascata: de cima para baixo, as rodas que deram a volta neste tick
+        # redistribuem o balde atual (e o excedente, se a última deu a volta)
+        wrapped = 0
+        while wrapped + 1 < self.levels and now & ((1 << (self._bits * (wrapped + 1))) - 1) == 0:
+            wrapped += 1
+        if wrapped == self.levels - 1 and self._overflow:
+            overflow, self._overflow = self._overflow, []
+            for tick, entry in overflow:
+                self._place(tick, entry)
+        for level in range(wrapped, 0, -1):
+            index = (now >> (self._bits * level)) & self._mask
+            bucket = self._wheels[level][index]
+            if bucket:
+                self._wheels[level][index] = []
+                for tick, entry in bucket:
+                    self._place(tick, entry)
+
+        index = now & self._mask
+        bucket = self._wheels[0][index]
+        if not bucket:
+            return []
+        self._wheels[0][index] = []
+        self.pending -= len(bucket)
+        return [entry for _, entry in bucket]
+
+
+class Timer:
+    """Um timer agendado; cancel() impede que o callback seja chamado."""
+
+    __slots__ = ('callback', 'args', 'cancelled')
+
+    def __init__(self, callback, args):
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self):
+        """Cancela o timer (O(1): ele só é descartado quando vencer)."""
+        self.cancelled = True
+
+
+class TimerService:
+    """
+    Timers de jogo (invencibilidade, mensagens, banners, troca de nível).
+
+    Os sistemas registram callbacks com call_later(); o Game chama advance()
+    uma vez por frame de simulação.
+    """
+
+    def __init__(self, step_ms=None):
+        """
+        Args:
+            step_ms: Duração de um tick em ms (padrão: settings.SIM_STEP_MS)
+        """
+        self.step_ms = step_ms or settings.SIM_STEP_MS
+        self.wheel = TimingWheel()
+
+    @property
+    def now_ms(self):
+        """Tempo atual da simulação em ms."""
+        return self.wheel.now * self.step_ms
+
+    def call_later(self, delay_ms, callback, *args):
+        """
+        Agenda callback(*args) para daqui a 'delay_ms' ms de simulação.
+
+        Returns:
+            Timer: Objeto que pode ser cancelado
+        """
+        timer = Timer(callback, args)
+        ticks = max(1, math.ceil(delay_ms / self.step_ms))
+        self.wheel.schedule(self.wheel.now + ticks, timer)
+        return timer
+
+    def advance(self):
+        """Avança um tick e chama os callbacks que venceram."""
+        for timer in self.wheel.advance():
+            if not timer.cancelled:
+                timer.callback(*timer.args)
+
+    def reset(self):
+        """Cancela tudo e volta o relógio para zero (ex: novo jogo)."""
+        self.wheel.now = 0
+        self.wheel.clear()
@@ -0,0 +1,175 @@
+"""
+Rastreamento (tracing) de trechos do jogo Perfect Potion.
+
+Cada trecho medido (span) vira uma tupla (nome, categoria, início, fim,
+thread) num buffer circular em memória; nada é formatado nem escrito
+durante o jogo. O custo por span é um perf_counter e um append (cerca de
+1 µs), então o modo pode ficar ligado em produção.
+
+O buffer é exportado no formato Chrome trace-event (JSON), que abre no
+Perfetto (ui.perfetto.dev) ou em chrome://tracing.
+
+Uso:
+    from src.utils.tracing import TRACER, traced
+
+    with TRACER.span('db.add_score', 'db'):
+        ...
+
+    @traced('spawn_item', 'spawn')
+    def spawn_item(self): ...
+
+As fases do loop vêm do FrameTimer (cada mark vira um span).
+"""
+import functools
+import json
+import os
+import threading
+from collections import deque
+from datetime import datetime
+from time import perf_counter
+from src import settings
+from src.utils.log import get_logger
+
+log = get_logger(__name__)
+
+
+class _Span:
+    """Context manager de um span (criado por Tracer.span)."""
+
+    __slots__ = ('tracer', 'name', 'category', 'start')
+
+    def __init__(self, tracer, name, category):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+
+    def __enter__(self):
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.tracer.complete(self.name, self.start, perf_counter(), self.category)
+        return False
+
+
+class _NoSpan:
+    """Span que não faz nada (tracing desligado)."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NO_SPAN = _NoSpan()
+
+
+class Tracer:
+    """Buffer circular de spans, exportado como Chrome trace-event JSON."""
+
+    def __init__(self, capacity=None, enabled=None):
+        """
+        Args:
+            capacity: Quantos spans guardar (padrão: settings.TRACE_BUFFER_SIZE)
+            enabled: Se grava spans (padrão: settings.TRACE_ENABLED)
+        """
+        self.enabled = settings.TRACE_ENABLED if enabled is None else enabled
+        self.spans = deque(maxlen=capacity or settings.TRACE_BUFFER_SIZE)
+        self.origin = perf_counter()
+
+    def complete(self, name, start, end, category='game'):
+        """
+        Grava um span já medido.
+
+        Args:
+            name: Nome do trecho
+            start: perf_counter() do início
+            end: perf_counter() do fim
+            category: Categoria (agrupa spans no visualizador)
+        """
+        self.spans.append((name, category, start, end, threading.get_ident()))
+
+    def span(self, name, category='game'):
+        """Context manager que mede o bloco (não faz nada se desligado)."""
+        if not self.enabled:
+            return _NO_SPAN
+        return _Span(self, name, category)
+
+    def clear(self):
+        """Descarta os spans gravados."""
+        self.spans.clear()
+
+    def export(self):
+        """
+        Converte o buffer para o formato Chrome trace-event.
+
+        Returns:
+            dict: {'traceEvents': [...], 'displayTimeUnit': 'ms'}
+        """
+        pid = os.getpid()
+        origin = self.origin
+        events = [{
+            'name': name, 'cat': category, 'ph': 'X', 'pid': pid, 'tid': tid,
+            'ts': round((start - origin) * 1e6, 3),
+            'dur': round((end - start) * 1e6, 3),
+        } for name, category, start, end, tid in list(self.spans)]
+
+        # Nomes das threads que aparecem no trace (as que ainda existem)
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for tid in {event['tid'] for event in events}:
+            events.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid,
+                           'args': {'name': names.get(tid, f'thread-{tid}')}})
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def write(self, path=None):
+        """
+        Escreve o buffer num arquivo JSON.
+
+        Args:
+            path: Caminho do arquivo (padrão: SAVE_DIR/trace-AAAAMMDD-HHMMSS.json)
+
+        Returns:
+            str: Caminho escrito (None se não havia spans ou houve erro)
+        """
+        if not self.spans:
+            return None
+        if path is None:
+            path = os.path.join(settings.SAVE_DIR, datetime.now().strftime('trace-%Y%m%d-%H%M%S.json'))
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(self.export(), f)
+        except IOError as e:
+            log.error("Erro ao salvar trace: %s", e)
+            return None
+        return path
+
+
+# Tracer do processo (ferramenta de depuração: main.py --trace). Fica num
+# módulo porque @traced envolve funções de módulo como as do banco de dados.
+TRACER = Tracer()
+
+
+def traced(name, category='game'):
+    """
+    Decorador que grava um span a cada chamada da função (se o tracing estiver ligado).
+
+    Args:
+        name: Nome do span
+        category: Categoria do span
+    """
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not TRACER.enabled:
+                return function(*args, **kwargs)
+            start = perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                TRACER.complete(name, start, perf_counter(), category)
+        return wrapper
+    return decorator
@@ -0,0 +1,43 @@
+"""Receitas simultâneas no RecipeAutomaton (python -m pytest)."""
+from src.utils.recipe_engine import Recipe, RecipeAutomaton, MISTAKE_RESTART
+
+ALPHABET = 10
+
+
+def feed_all(automaton, potions):
+    return [automaton.feed(potion_id) for potion_id in potions]
+
+
+def test_interleaved_ordered_recipes():
+    automaton = RecipeAutomaton([Recipe([0, 1]), Recipe([2, 3])], alphabet_size=ALPHABET)
+    assert feed_all(automaton, [0, 2, 1, 3]) == [(True, -1), (True, -1), (True, 0), (True, 1)]
+    assert not automaton.active
+
+
+def test_interleaved_ordered_and_unordered():
+    automaton = RecipeAutomaton([Recipe([0, 1]), Recipe([2, 3], ordered=False)], alphabet_size=ALPHABET)
+    assert feed_all(automaton, [3, 0, 2]) == [(True, -1), (True, -1), (True, 1)]
+    assert automaton.progress() == [(0, [0, 1], 1)]
+    assert automaton.feed(1) == (True, 0)
+
+
+def test_mistake_keeps_every_recipe_in_keep_mode():
+    automaton = RecipeAutomaton([Recipe([0, 1]), Recipe([2, 3])], alphabet_size=ALPHABET)
+    feed_all(automaton, [0, 2])
+    assert automaton.feed(5) == (False, -1)
+    assert sorted(automaton.progress()) == [(0, [0, 1], 1), (1, [2, 3], 1)]
+
+
+def test_restart_rewinds_to_longest_suffix():
+    automaton = RecipeAutomaton([Recipe([1, 2, 1, 3])], alphabet_size=ALPHABET, mistake_mode=MISTAKE_RESTART)
+    assert feed_all(automaton, [1, 2, 1, 2])[-1] == (False, -1)
+    assert automaton.progress() == [(0, [1, 2, 1, 3], 2)]
+    assert feed_all(automaton, [1, 3])[-1] == (True, 0)
+
+
+def test_shared_potions_complete_one_recipe_at_a_time():
+    automaton = RecipeAutomaton([Recipe([0, 1]), Recipe([0, 1])], alphabet_size=ALPHABET)
+    assert feed_all(automaton, [0, 1, 0, 1]) == [(True, -1), (True, 0), (True, -1), (True, 1)]
+
+    automaton = RecipeAutomaton([Recipe([0, 1]), Recipe([0, 1, 2])], alphabet_size=ALPHABET)
+    assert feed_all(automaton, [0, 1, 2]) == [(True, -1), (True, 0), (True, 1)]